@@ -5,5 +5,9 @@ urlpatterns = [
     path("users/view/", include('users.urls.retrieve_urls')),
     
     path("criteria/criteria-version/", include('criteria.urls.criteria_version_url')),
-    path("criteria/input-type/", include('criteria.urls.input_type_url'))
+    path("criteria/input-type/", include('criteria.urls.input_type_url')),
+    path("criteria/evaluation/", include('criteria.urls.evaluation_url')),
+    path("criteria/simulation/", include('criteria.urls.simulation_url')),
+    path("criteria/export/", include('criteria.urls.export_url')),
+    path("criteria/import/", include('criteria.urls.import_url')),
 ]
\ No newline at end of file
@@ -55,7 +55,7 @@ MIDDLEWARE = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CapabilityJWTAuthentication',
     ) 
 }
 
@@ -138,6 +138,46 @@ DATABASES = {
 }
 AUTH_USER_MODEL = 'users.CustomUser'
 
+# Evaluation results are cached per criteria version and input values.
+# Set CRITERIA_RESULT_CACHE_ALIAS to the name of a Django cache (e.g. "default")
+# to share the results between processes. The cache also holds the stamps that
+# invalidate the compiled programs and policies of every process, so it must
+# be set when running several workers.
+CRITERIA_RESULT_CACHE_SIZE = 256
+CRITERIA_RESULT_CACHE_ALIAS = None
+
+# Seconds a user's resolved permissions are cached between requests.
+PERMISSION_CACHE_TTL = 300
+
+# Embed the user's permissions and a permission-version stamp in the access
+# tokens issued by login, so requests are authorized without loading the user
+# while the stamp is current. The stamps are kept in the PERMISSION_STAMP_CACHE_ALIAS
+# cache, which must be shared by every process serving the API.
+JWT_CAPABILITY_CLAIMS = False
+PERMISSION_STAMP_CACHE_ALIAS = "default"
+
+# Seconds between two reads of the tokens revoked by other processes.
+TOKEN_REVOCATION_REFRESH_INTERVAL = 5
+
+# Sliding-window limits on the attempts of the login and password views,
+# per username and per client IP. Set AUTH_RATE_LIMIT_CACHE_ALIAS to the
+# name of a Django cache to share the counts between processes.
+AUTH_RATE_LIMIT_WINDOW = 60
+AUTH_RATE_LIMIT_PER_USERNAME = 10
+AUTH_RATE_LIMIT_PER_IP = 60
+AUTH_RATE_LIMIT_CACHE_ALIAS = None
+
+
+# Passwords are hashed with PBKDF2 and PASSWORD_HASHER_ITERATIONS iterations.
+# Changing it rehashes each password on the next successful login.
+PASSWORD_HASHERS = [
+    'users.hashers.ConfigurablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASHER_ITERATIONS = 320000
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -2,6 +2,9 @@ from django.contrib import admin
 from .models import (
     Criteria, 
     CriteriaVersion, 
+    CriteriaVersionSnapshot,
+    EvaluationInput,
+    EvaluationResult,
     InputType, 
     ResultPolicy, 
     VariableRelationship
@@ -45,12 +48,14 @@ class CriteriaVersionAdmin(admin.ModelAdmin):
                 ('Made by', {'fields': ('created_user',)}), 
                 ('Create the version', {'fields': ('version_name',)}),
                 ('Choose the role and state', {'fields': ('role_name','state')}),
+                ('Expressions', {'fields': ('expression_dialect',)}),
             )
         else:
             return (
                 ('Last updated by', {'fields': ('updated_user',)}),
                 ('Edit the version', {'fields': ('version_name',)}),
                 ('Edit role and state', {'fields': ('role_name','state')}),
+                ('Expressions', {'fields': ('expression_dialect',)}),
             )
 
 class CriteriaAdmin(admin.ModelAdmin):
@@ -102,8 +107,49 @@ class VariableRelationshipAdmin(admin.ModelAdmin):
     list_filter = ('version', )
     search_fields = ('version', )
 
+class CriteriaVersionSnapshotAdmin(admin.ModelAdmin):
+    list_display = (
+        'version',
+        'content_hash',
+        'created_at',
+    )
+    readonly_fields = ('version', 'content', 'content_hash', 'created_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+class EvaluationInputAdmin(admin.ModelAdmin):
+    list_display = (
+        'version',
+        'employee',
+        'alias',
+        'value',
+    )
+
+    list_filter = ('version', )
+    search_fields = ('alias', )
+
+class EvaluationResultAdmin(admin.ModelAdmin):
+    list_display = (
+        'version',
+        'employee',
+        'final_result',
+        'grade',
+        'needs_action',
+        'needs_explanation',
+        'evaluated_at',
+    )
+
+    list_filter = ('version', 'grade', 'needs_action', 'needs_explanation')
+
 admin.site.register(InputType,InputTypeAdmin)
 admin.site.register(CriteriaVersion,CriteriaVersionAdmin)
 admin.site.register(Criteria,CriteriaAdmin)
 admin.site.register(ResultPolicy, ResultPolicyAdmin)
-admin.site.register(VariableRelationship, VariableRelationshipAdmin)
\ No newline at end of file
+admin.site.register(VariableRelationship, VariableRelationshipAdmin)
+admin.site.register(CriteriaVersionSnapshot, CriteriaVersionSnapshotAdmin)
+admin.site.register(EvaluationInput, EvaluationInputAdmin)
+admin.site.register(EvaluationResult, EvaluationResultAdmin)
\ No newline at end of file
@@ -2,6 +2,9 @@ class CriteriaVersionMessage:
     INVALID_VERSION="Criteria version can not found"
     OBJECT_HAS_NO_VALUE="Object has no value"  
     ONLY_ONE_FIELD_CAN_BE_UPDATED="Only one field of criteria version can be updated"
+    NO_OFFICIAL_VERSION="There is no Official version of this role to compare with"
+    INVALID_CURSOR="Invalid cursor"
+    CANNOT_CREATE_OFFICIAL="A criteria version can not be created as Official, promote it once its criteria are added"
 
 class ResponseMessage:
     CANT_UPDATE_STATE="Can not update state"
@@ -12,6 +15,53 @@ class CRUDResponseMessage:
     DELETE_SUCCESSFULLY="Delete successfully"
     UPDATE_SUCCESSFULLY="Update successfully"
     
+class ExpressionMessage:
+    INVALID_SYNTAX="Expression has invalid syntax"
+    UNSUPPORTED_SYNTAX="Expression contains an unsupported element"
+    UNKNOWN_FUNCTION="Expression calls an unknown function"
+    UNKNOWN_ALIAS="Expression references an alias that does not exist in this version"
+    ALIAS_HAS_NO_VALUE="Expression references an alias that is neither an input nor has an expression"
+    DUPLICATE_ALIAS="Alias is defined more than once in this version"
+
+class GraphMessage:
+    DANGLING_ALIAS="Relationship references an alias that does not exist in this version"
+    CYCLIC_DEPENDENCY="Alias is part of, or depends on, a dependency cycle"
+
+class EvaluationMessage:
+    MISSING_INPUT="Input values are missing for alias"
+    UNKNOWN_INPUT="Input column is not an input criteria of this version"
+    INVALID_INPUT_SHAPE="Input values must be a rectangular matrix with one column per input alias"
+    INVALID_INPUT_VALUE="Input values must be numbers"
+    INPUT_OUT_OF_RANGE="Input value is outside the range of its input type"
+    NO_FINAL_RESULT="Criteria version has no final result criteria"
+
+class SimulationMessage:
+    MISSING_SCENARIOS="Either overrides or sweep is required"
+    OVERRIDES_AND_SWEEP="Overrides and sweep cannot be used together"
+    INVALID_SWEEP="Sweep needs either a list of values, or start, stop and steps"
+    DUPLICATE_SWEEP_ALIAS="An alias can only be swept once"
+    TOO_MANY_SCENARIOS="Too many scenarios, the maximum is"
+
+class GradingMessage:
+    INVALID_GRADING_RULE="Grading rule must map distinct performance points to grades"
+    EMPTY_GRADING_RULE="Grading rule has no grade"
+
+class ExportMessage:
+    INVALID_FILE_TYPE="File type must be csv or xlsx"
+
+class ImportMessage:
+    INVALID_FILE_TYPE="File must be a .csv, .xlsx or .xls sheet"
+    INVALID_SHEET="Sheet contains invalid cells, nothing was imported"
+    IMPORT_SUCCESSFULLY="Import successfully"
+    MISSING_FILE="A sheet must be uploaded in the file field"
+    MISSING_EMPLOYEE_COLUMN="Sheet must have an employee_id column"
+    UNKNOWN_COLUMN="Column is not an input criteria of this version"
+    INVALID_EMPLOYEE="Employee id must be an integer"
+    EMPLOYEE_NOT_FOUND="Employee not found or inactive"
+    DUPLICATE_EMPLOYEE="Employee appears more than once in the sheet"
+    INVALID_VALUE="Value must be a number"
+    VALUE_OUT_OF_RANGE="Value is outside the range of its input type"
+    
 INVALID_STATE=["Unofficial", "Official"]  
 MESSAGE="message"
 DATA="data"
\ No newline at end of file
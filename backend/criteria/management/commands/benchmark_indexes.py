@@ -0,0 +1,149 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from ...models import (
+    Criteria,
+    CriteriaRoleEnum,
+    CriteriaVersion,
+    CriteriaVersionStateEnum,
+    VariableRelationship,
+)
+
+# Models whose composite indexes and constraints are benchmarked.
+INDEXED_MODELS = (CriteriaVersion, Criteria, VariableRelationship)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the query plans and timings of the criteria access patterns "
+        "with and without their composite indexes, on a seeded dataset. "
+        "Everything is rolled back when done."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--versions",
+            type=int,
+            default=200,
+            help="Number of criteria versions to seed",
+        )
+        parser.add_argument(
+            "--criteria",
+            type=int,
+            default=100,
+            help="Number of criteria (and relationships) per version",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Number of runs of each query when timing it",
+        )
+
+    def seed(self, versions, criteria):
+        roles = list(CriteriaRoleEnum.values)
+        created = CriteriaVersion.objects.bulk_create(
+            CriteriaVersion(
+                version_name=f"__benchmark-{index}",
+                role_name=roles[index % len(roles)],
+                # A few Official versions among years of Outdated ones.
+                state=(
+                    CriteriaVersionStateEnum.OFFICIAL
+                    if index >= versions - len(roles)
+                    else CriteriaVersionStateEnum.OUTDATED
+                ),
+            )
+            for index in range(versions)
+        )
+
+        Criteria.objects.bulk_create(
+            Criteria(
+                version=version,
+                alias=f"K{index}",
+                parent_alias=f"K{index // 10}" if index else None,
+                is_input=index >= criteria // 2,
+                is_final_result=index == 0,
+            )
+            for version in created
+            for index in range(criteria)
+        )
+        VariableRelationship.objects.bulk_create(
+            VariableRelationship(version=version, from_alias=f"K{index}", to_alias=f"K{index // 10}")
+            for version in created
+            for index in range(1, criteria)
+        )
+        return created[len(created) // 2]
+
+    def queries(self, version, criteria):
+        alias = f"K{criteria // 2}"
+        return [
+            ("Criteria by (version, alias)", Criteria.objects.filter(version=version, alias=alias)),
+            ("Criteria by (version, parent_alias)", Criteria.objects.filter(version=version, parent_alias="K1")),
+            ("Criteria by (version, is_final_result)", Criteria.objects.filter(version=version, is_final_result=True)),
+            ("VariableRelationship by (version, from_alias)", VariableRelationship.objects.filter(version=version, from_alias=alias)),
+            ("VariableRelationship by (version, to_alias)", VariableRelationship.objects.filter(version=version, to_alias="K1")),
+            ("CriteriaVersion by (role_name, state)", CriteriaVersion.objects.filter(
+                role_name=CriteriaRoleEnum.TL, state=CriteriaVersionStateEnum.OFFICIAL
+            )),
+            ("CriteriaVersion page by (created_at, id)", CriteriaVersion.objects.order_by(
+                "created_at", "id"
+            )[:50]),
+            ("CriteriaVersion page by (role_name, state, created_at, id)", CriteriaVersion.objects.filter(
+                role_name=CriteriaRoleEnum.TL, state=CriteriaVersionStateEnum.OUTDATED
+            ).order_by("created_at", "id")[:50]),
+        ]
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            for model in INDEXED_MODELS:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+    def measure(self, queries, repeat):
+        results = {}
+        for label, queryset in queries:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                list(queryset.all())
+            milliseconds = (time.perf_counter() - start) * 1000 / repeat
+            results[label] = (queryset.explain(), milliseconds)
+        return results
+
+    def set_indexes(self, enabled):
+        with connection.schema_editor() as editor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    (editor.add_index if enabled else editor.remove_index)(model, index)
+                for constraint in model._meta.constraints:
+                    (editor.add_constraint if enabled else editor.remove_constraint)(model, constraint)
+        self.analyze()
+
+    def handle(self, *args, **options):
+        # Dropping indexes inside a transaction that is rolled back needs
+        # transactional DDL on indexes and constraints.
+        if connection.vendor != "postgresql":
+            raise CommandError("The index benchmark needs a PostgreSQL database.")
+
+        with transaction.atomic():
+            version = self.seed(options["versions"], options["criteria"])
+            queries = self.queries(version, options["criteria"])
+
+            self.set_indexes(False)
+            before = self.measure(queries, options["repeat"])
+            self.set_indexes(True)
+            after = self.measure(queries, options["repeat"])
+            transaction.set_rollback(True)
+
+        for label, _ in queries:
+            (plan_before, ms_before), (plan_after, ms_after) = before[label], after[label]
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(f"  before ({ms_before:.3f} ms):")
+            self.stdout.write("\n".join(f"    {line}" for line in plan_before.splitlines()))
+            self.stdout.write(f"  after ({ms_after:.3f} ms):")
+            self.stdout.write("\n".join(f"    {line}" for line in plan_after.splitlines()))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['versions']} versions of {options['criteria']} criteria, "
+            "and rolled everything back."
+        ))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from ...constants import CriteriaVersionMessage
+from ...models import CriteriaVersion
+from ...services.runner_service import run_evaluation
+
+
+class Command(BaseCommand):
+    help = "Evaluate every active employee against a criteria version in parallel."
+
+    def add_arguments(self, parser):
+        parser.add_argument("version_name", help="Name of the criteria version to evaluate")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of employees evaluated per chunk",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes (defaults to the number of CPU cores)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            version = CriteriaVersion.objects.get(version_name=options["version_name"])
+        except CriteriaVersion.DoesNotExist:
+            raise CommandError(CriteriaVersionMessage.INVALID_VERSION)
+
+        try:
+            summary = run_evaluation(
+                version.id,
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+            )
+        except ValidationError as ve:
+            raise CommandError(ve.detail)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Evaluated {summary['employees']} employees "
+            f"({summary['skipped']} skipped) in {summary['seconds']}s, "
+            f"{summary['employees_per_second']} employees/s"
+        ))
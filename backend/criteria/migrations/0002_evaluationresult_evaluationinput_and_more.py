@@ -0,0 +1,47 @@
+# Generated by Django 4.0 on 2026-10-18 08:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_employee_role'),
+        ('criteria', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvaluationResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('values', models.JSONField(help_text='Computed value of every criteria of the version')),
+                ('final_result', models.FloatField(blank=True, help_text='Value of the final result criteria', null=True, verbose_name='Final result')),
+                ('grade', models.CharField(blank=True, help_text='Grade of the final result according to the result policy', max_length=20, null=True)),
+                ('needs_action', models.BooleanField(default=False, verbose_name='Needs action')),
+                ('needs_explanation', models.BooleanField(default=False, verbose_name='Needs explanation')),
+                ('evaluated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.employee')),
+                ('version', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='criteria.criteriaversion')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EvaluationInput',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(help_text='Alias of the input criteria this value belongs to', max_length=20)),
+                ('value', models.FloatField(help_text='Input value of the employee for this criteria')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.employee')),
+                ('version', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='criteria.criteriaversion')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='evaluationresult',
+            constraint=models.UniqueConstraint(fields=('version', 'employee'), name='unique_evaluation_result'),
+        ),
+        migrations.AddConstraint(
+            model_name='evaluationinput',
+            constraint=models.UniqueConstraint(fields=('version', 'employee', 'alias'), name='unique_evaluation_input'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0 on 2026-10-18 08:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('criteria', '0002_evaluationresult_evaluationinput_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CriteriaVersionSnapshot',
+            fields=[
+                ('version', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='criteria.criteriaversion')),
+                ('content', models.TextField(help_text='Compact JSON of the criteria, relationships, input types and result policy of the version')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the content', max_length=64, verbose_name='Content hash')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
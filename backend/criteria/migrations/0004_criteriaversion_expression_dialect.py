@@ -0,0 +1,18 @@
+# Generated by Django 4.0 on 2026-10-18 08:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('criteria', '0003_criteriaversionsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='criteriaversion',
+            name='expression_dialect',
+            field=models.CharField(choices=[('Python', 'Python'), ('Excel', 'Excel')], default='Python', help_text='Language the criteria expressions of this version are written in', max_length=16),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.0 on 2026-10-18 08:50
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_aliases(apps, schema_editor):
+    # The unique (version, alias) constraint cannot be added while a version
+    # has two criteria with the same alias, so report them all first.
+    Criteria = apps.get_model('criteria', 'Criteria')
+    duplicates = Criteria.objects.values('version__version_name', 'alias').annotate(
+        count=Count('id')
+    ).filter(count__gt=1).order_by('version__version_name', 'alias')
+    if duplicates:
+        raise RuntimeError(
+            'Criteria aliases must be unique per version before migrating. Rename or '
+            'delete the duplicated criteria: ' + ', '.join(
+                f"{row['alias']} ({row['count']} times in version {row['version__version_name']})"
+                for row in duplicates
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('criteria', '0004_criteriaversion_expression_dialect'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='criteria',
+            index=models.Index(fields=['version', 'parent_alias'], name='criteria_version_parent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criteria',
+            index=models.Index(fields=['version', 'is_final_result'], name='criteria_version_final_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criteriaversion',
+            index=models.Index(fields=['role_name', 'state'], name='version_role_state_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='variablerelationship',
+            index=models.Index(fields=['version', 'from_alias'], name='relationship_version_from_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='variablerelationship',
+            index=models.Index(fields=['version', 'to_alias'], name='relationship_version_to_idx'),
+        ),
+        migrations.RunPython(check_duplicate_aliases, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='criteria',
+            constraint=models.UniqueConstraint(fields=('version', 'alias'), name='criteria_version_alias_unique'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.0 on 2026-10-18 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('criteria', '0005_criteria_access_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='criteriaversion',
+            name='version_role_state_idx',
+        ),
+        migrations.AddIndex(
+            model_name='criteriaversion',
+            index=models.Index(fields=['created_at', 'id'], name='version_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='criteriaversion',
+            index=models.Index(fields=['role_name', 'state', 'created_at', 'id'], name='version_role_state_created_idx'),
+        ),
+    ]
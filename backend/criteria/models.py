@@ -1,6 +1,7 @@
 
 from django.db import models
 from api.models import TimeStamped, UserTrackable
+from users.models import Employee
 
 class CriteriaRoleEnum(models.TextChoices):
     TL = "TL", "Team Lead"
@@ -13,6 +14,11 @@ class CriteriaVersionStateEnum(models.TextChoices):
     OUTDATED = "Outdated", "Outdated"
 
 
+class CriteriaExpressionDialectEnum(models.TextChoices):
+    PYTHON = "Python", "Python"
+    EXCEL = "Excel", "Excel"
+
+
 class CriteriaVersion(TimeStamped, UserTrackable):
     version_name = models.CharField(
         max_length=200, unique=True, 
@@ -31,10 +37,27 @@ class CriteriaVersion(TimeStamped, UserTrackable):
         default=CriteriaVersionStateEnum.UNOFFICIAL,
         help_text="Criteria tree version state",
     )
+    expression_dialect = models.CharField(
+        max_length=16,
+        choices=CriteriaExpressionDialectEnum.choices,
+        default=CriteriaExpressionDialectEnum.PYTHON,
+        help_text="Language the criteria expressions of this version are written in",
+    )
 
     def __str__(self):
         return self.version_name
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the version list orders by (created_at, id),
+            # with or without the role and state filters.
+            models.Index(fields=["created_at", "id"], name="version_created_idx"),
+            models.Index(
+                fields=["role_name", "state", "created_at", "id"],
+                name="version_role_state_created_idx",
+            ),
+        ]
+
 
 class ResultPolicy(models.Model):
     version = models.OneToOneField(
@@ -139,6 +162,16 @@ class Criteria(models.Model):
 
     class Meta:
         verbose_name_plural = "Criteria"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["version", "alias"],
+                name="criteria_version_alias_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["version", "parent_alias"], name="criteria_version_parent_idx"),
+            models.Index(fields=["version", "is_final_result"], name="criteria_version_final_idx"),
+        ]
 
 
 class VariableRelationship(models.Model):
@@ -159,3 +192,104 @@ class VariableRelationship(models.Model):
 
     def __str__(self):
         return f"{self.version}: {self.from_alias} -> {self.to_alias}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["version", "from_alias"], name="relationship_version_from_idx"),
+            models.Index(fields=["version", "to_alias"], name="relationship_version_to_idx"),
+        ]
+
+
+class CriteriaVersionSnapshot(models.Model):
+    version = models.OneToOneField(
+        CriteriaVersion,
+        on_delete=models.CASCADE,
+        primary_key=True,
+    )
+    content = models.TextField(
+        help_text="Compact JSON of the criteria, relationships, input types and result policy of the version",
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the content",
+        verbose_name='Content hash'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.version}"
+
+
+class EvaluationInput(models.Model):
+    version = models.ForeignKey(
+        CriteriaVersion,
+        on_delete=models.CASCADE,
+    )
+    employee = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+    )
+    alias = models.CharField(
+        max_length=20,
+        help_text="Alias of the input criteria this value belongs to",
+    )
+    value = models.FloatField(
+        help_text="Input value of the employee for this criteria",
+    )
+
+    def __str__(self):
+        return f"{self.version}_{self.employee_id}_{self.alias}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["version", "employee", "alias"],
+                name="unique_evaluation_input",
+            ),
+        ]
+
+
+class EvaluationResult(models.Model):
+    version = models.ForeignKey(
+        CriteriaVersion,
+        on_delete=models.CASCADE,
+    )
+    employee = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+    )
+    values = models.JSONField(
+        help_text="Computed value of every criteria of the version",
+    )
+    final_result = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Value of the final result criteria",
+        verbose_name='Final result'
+    )
+    grade = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        help_text="Grade of the final result according to the result policy",
+    )
+    needs_action = models.BooleanField(
+        default=False,
+        verbose_name='Needs action'
+    )
+    needs_explanation = models.BooleanField(
+        default=False,
+        verbose_name='Needs explanation'
+    )
+    evaluated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.version}_{self.employee_id}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["version", "employee"],
+                name="unique_evaluation_result",
+            ),
+        ]
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from ..models import(
     CriteriaVersion,
     CriteriaRoleEnum,
-    CriteriaVersionStateEnum
+    CriteriaVersionStateEnum,
+    CriteriaExpressionDialectEnum
 )
 from ..constants import(
     CriteriaVersionMessage
@@ -16,6 +18,10 @@ class CriteriaVersionSerializer(serializers.ModelSerializer):
         choices=CriteriaRoleEnum.choices,
         required=False
     )
+    expression_dialect = serializers.ChoiceField(
+        choices=CriteriaExpressionDialectEnum.choices,
+        required=False
+    )
     created_user=serializers.UUIDField(read_only=True)
     updated_user=serializers.UUIDField(read_only=True)
     
@@ -24,6 +30,11 @@ class CriteriaVersionSerializer(serializers.ModelSerializer):
         fields = "__all__"
         
     def validate(self, data):
+        if self.instance is None and data.get("state") == CriteriaVersionStateEnum.OFFICIAL:
+            # Versions are frozen when they are promoted, once their criteria exist.
+            raise serializers.ValidationError(
+                {"state": [CriteriaVersionMessage.CANNOT_CREATE_OFFICIAL]}
+            )
         request=self.context.get("context", None)
         if request and request.method in ["PUT", "PATCH"]:
             attr_list = list(data.values())
@@ -32,4 +43,31 @@ class CriteriaVersionSerializer(serializers.ModelSerializer):
                     CriteriaVersionMessage.ONLY_ONE_FIELD_CAN_BE_UPDATED
                 )
             
-        return data
\ No newline at end of file
+        return data
+
+class CloneCriteriaVersionSerializer(serializers.Serializer):
+    version_name = serializers.CharField(
+        max_length=200,
+        validators=[UniqueValidator(queryset=CriteriaVersion.objects.all())]
+    )
+    role_name = serializers.ChoiceField(
+        choices=CriteriaRoleEnum.choices,
+        required=False
+    )
+
+class CriteriaVersionListSerializer(serializers.Serializer):
+    role_name = serializers.ChoiceField(
+        choices=CriteriaRoleEnum.choices,
+        required=False
+    )
+    state = serializers.ChoiceField(
+        choices=CriteriaVersionStateEnum.choices,
+        required=False
+    )
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(
+        min_value=1,
+        max_value=200,
+        default=50
+    )
+    with_count = serializers.BooleanField(default=False)
@@ -0,0 +1,70 @@
+from rest_framework import serializers
+from ..constants import (
+    SimulationMessage
+)
+from ..services.simulation_service import MAX_SCENARIOS
+
+class BatchEvaluationSerializer(serializers.Serializer):
+    columns = serializers.ListField(
+        child=serializers.CharField(max_length=20),
+        allow_empty=False,
+    )
+    # Validated as a whole matrix by the evaluation service instead of cell by cell.
+    rows = serializers.JSONField()
+    employees = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+    )
+
+class IncrementalEvaluationSerializer(serializers.Serializer):
+    values = serializers.DictField(
+        child=serializers.FloatField(allow_null=True),
+    )
+    changes = serializers.DictField(
+        child=serializers.FloatField(),
+        allow_empty=False,
+    )
+
+class SweepSerializer(serializers.Serializer):
+    alias = serializers.CharField(max_length=20)
+    values = serializers.ListField(
+        child=serializers.FloatField(),
+        allow_empty=False,
+        max_length=MAX_SCENARIOS,
+        required=False,
+    )
+    start = serializers.FloatField(required=False)
+    stop = serializers.FloatField(required=False)
+    steps = serializers.IntegerField(min_value=1, max_value=MAX_SCENARIOS, required=False)
+
+    def validate(self, data):
+        has_range = all(key in data for key in ("start", "stop", "steps"))
+        if ("values" in data) == has_range:
+            raise serializers.ValidationError(SimulationMessage.INVALID_SWEEP)
+        return data
+
+class SimulationSerializer(serializers.Serializer):
+    base = serializers.DictField(
+        child=serializers.FloatField(),
+    )
+    overrides = serializers.ListField(
+        child=serializers.DictField(child=serializers.FloatField()),
+        allow_empty=False,
+        required=False,
+    )
+    sweep = SweepSerializer(
+        many=True,
+        allow_empty=False,
+        required=False,
+    )
+
+    def validate(self, data):
+        if "overrides" not in data and "sweep" not in data:
+            raise serializers.ValidationError(SimulationMessage.MISSING_SCENARIOS)
+        if "overrides" in data and "sweep" in data:
+            raise serializers.ValidationError(SimulationMessage.OVERRIDES_AND_SWEEP)
+
+        aliases = [sweep["alias"] for sweep in data.get("sweep", [])]
+        if len(aliases) != len(set(aliases)):
+            raise serializers.ValidationError(SimulationMessage.DUPLICATE_SWEEP_ALIAS)
+        return data
@@ -0,0 +1,77 @@
+from django.db import transaction
+
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    CriteriaVersionStateEnum,
+    ResultPolicy,
+    VariableRelationship,
+)
+from .snapshot_service import (
+    CRITERIA_FIELDS,
+    load_snapshot,
+)
+
+# Children of a version that are copied along with it.
+CHILD_MODELS = (Criteria, VariableRelationship, ResultPolicy)
+
+
+def _copied_fields(model) -> list:
+    return [
+        field.attname for field in model._meta.concrete_fields
+        if not field.primary_key and field.name != "version"
+    ]
+
+
+@transaction.atomic
+def clone_version(source: CriteriaVersion, version_name: str, user=None, role_name=None) -> CriteriaVersion:
+    """
+    Copy a criteria version with its criteria, relationships and result policy.
+
+    Every child table is read with one query and written with one
+    `bulk_create`, inside a single transaction. A frozen source is copied
+    from its snapshot, which is what it is evaluated with. The clone is
+    always Unofficial, whatever the state of the source.
+
+    Args:
+        source (CriteriaVersion): The version to copy.
+        version_name (str): The name of the new version.
+        user (CustomUser | None): The user creating the clone.
+        role_name (str | None): The role of the clone, the role of the
+            source by default.
+
+    Returns:
+        CriteriaVersion: The new version.
+    """
+    clone = CriteriaVersion.objects.create(
+        version_name=version_name,
+        role_name=role_name or source.role_name,
+        state=CriteriaVersionStateEnum.UNOFFICIAL,
+        expression_dialect=source.expression_dialect,
+        created_user=user,
+    )
+    snapshot = load_snapshot(source.pk)
+    if snapshot is not None:
+        _copy_snapshot(snapshot, clone)
+        return clone
+
+    for model in CHILD_MODELS:
+        fields = _copied_fields(model)
+        model.objects.bulk_create(
+            model(version=clone, **row)
+            for row in model.objects.filter(version=source).order_by("pk").values(*fields)
+        )
+    return clone
+
+
+def _copy_snapshot(snapshot: dict, clone: CriteriaVersion) -> None:
+    Criteria.objects.bulk_create(
+        Criteria(version=clone, **{field: row[field] for field in CRITERIA_FIELDS})
+        for row in snapshot["criteria"]
+    )
+    VariableRelationship.objects.bulk_create(
+        VariableRelationship(version=clone, from_alias=from_alias, to_alias=to_alias)
+        for from_alias, to_alias in snapshot["relationships"]
+    )
+    if snapshot["result_policy"] is not None:
+        ResultPolicy.objects.create(version=clone, **snapshot["result_policy"])
@@ -0,0 +1,155 @@
+import numpy as np
+
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    CriteriaVersionStateEnum,
+    VariableRelationship,
+)
+from .evaluation_service import to_json_list
+from .expression_service import get_compiled_version
+from .grading_service import get_compiled_policy
+from .result_cache_service import evaluate_cached
+from .snapshot_service import (
+    load_snapshots,
+    snapshot_criteria,
+)
+
+# Criteria fields compared between two versions. Input types are compared
+# by name, since each version may point to its own InputType rows.
+COMPARED_FIELDS = (
+    "name",
+    "parent_alias",
+    "description",
+    "is_input",
+    "input_type__name",
+    "expression",
+    "is_final_result",
+)
+
+
+def official_version_of(version: CriteriaVersion) -> CriteriaVersion | None:
+    """
+    Return the current Official version with the same role as the given one.
+    """
+    return CriteriaVersion.objects.filter(
+        role_name=version.role_name,
+        state=CriteriaVersionStateEnum.OFFICIAL,
+    ).exclude(pk=version.pk).order_by("-updated_at", "-pk").first()
+
+
+def _diff_criteria(base: dict, target: dict) -> dict:
+    modified = []
+    for alias in base.keys() & target.keys():
+        changes = {
+            field.replace("__name", ""): {"from": base[alias][field], "to": target[alias][field]}
+            for field in COMPARED_FIELDS
+            if base[alias][field] != target[alias][field]
+        }
+        if changes:
+            modified.append({"alias": alias, "changes": changes})
+
+    return {
+        "added": [target[alias] for alias in target.keys() - base.keys()],
+        "removed": [base[alias] for alias in base.keys() - target.keys()],
+        "modified": modified,
+    }
+
+
+def diff_versions(base: CriteriaVersion, target: CriteriaVersion) -> dict:
+    """
+    Compare the criteria tree and relationships of two versions.
+
+    Both versions are loaded with one query per table and indexed by alias,
+    so the diff is linear in the size of the trees. Frozen versions are read
+    from their snapshot, which is what they are evaluated with.
+
+    Args:
+        base (CriteriaVersion): The version to compare against.
+        target (CriteriaVersion): The version under review.
+
+    Returns:
+        dict: The added, removed and modified criteria, and the added and
+            removed relationships, sorted by alias.
+    """
+    criteria = {base.pk: {}, target.pk: {}}
+    edges = {base.pk: set(), target.pk: set()}
+    snapshots = load_snapshots(list(criteria))
+    live = [version_id for version_id in criteria if version_id not in snapshots]
+    for version_id, snapshot in snapshots.items():
+        for row in snapshot_criteria(snapshot):
+            criteria[version_id][row["alias"]] = {
+                "alias": row["alias"], **{field: row[field] for field in COMPARED_FIELDS}
+            }
+        edges[version_id].update(tuple(edge) for edge in snapshot["relationships"])
+
+    if live:
+        for row in Criteria.objects.filter(version_id__in=live).values(
+            "version_id", "alias", *COMPARED_FIELDS
+        ):
+            criteria[row.pop("version_id")][row["alias"]] = row
+
+        for version_id, from_alias, to_alias in VariableRelationship.objects.filter(
+            version_id__in=live
+        ).values_list("version_id", "from_alias", "to_alias"):
+            edges[version_id].add((from_alias, to_alias))
+
+    diff = _diff_criteria(criteria[base.pk], criteria[target.pk])
+    for key in ("added", "removed"):
+        for row in diff[key]:
+            row["input_type"] = row.pop("input_type__name")
+        diff[key].sort(key=lambda row: row["alias"])
+    diff["modified"].sort(key=lambda change: change["alias"])
+
+    return {
+        "base": base.version_name,
+        "target": target.version_name,
+        "criteria": diff,
+        "relationships": {
+            "added": sorted(edges[target.pk] - edges[base.pk]),
+            "removed": sorted(edges[base.pk] - edges[target.pk]),
+        },
+    }
+
+
+def _final_results(version: CriteriaVersion, inputs: dict) -> tuple:
+    compiled = get_compiled_version(version.pk)
+    values, grading = evaluate_cached(
+        compiled,
+        get_compiled_policy(version.pk),
+        {alias: column for alias, column in inputs.items() if alias in compiled.input_bounds},
+    )
+    final_result = values.get(compiled.final_alias)
+    return final_result, grading
+
+
+def compare_final_results(base: CriteriaVersion, target: CriteriaVersion, inputs: dict) -> dict:
+    """
+    Evaluate a sample batch against both versions and compare the final results.
+
+    Sample columns that are not inputs of a version are ignored for it.
+
+    Args:
+        base (CriteriaVersion): The version to compare against.
+        target (CriteriaVersion): The version under review.
+        inputs (dict): Mapping of input alias to an array of sample values.
+
+    Returns:
+        dict: The final result (and grade, when the version has a
+            ResultPolicy) of every sample row for both versions, and the
+            difference of the final results.
+    """
+    effect = {}
+    results = {}
+    for key, version in (("base", base), ("target", target)):
+        final_result, grading = _final_results(version, inputs)
+        results[key] = final_result
+        effect[key] = {
+            "final_result": to_json_list(final_result) if final_result is not None else None,
+            "grades": grading["grades"].tolist() if grading is not None else None,
+        }
+
+    if results["base"] is not None and results["target"] is not None:
+        with np.errstate(invalid="ignore"):
+            effect["delta"] = to_json_list(results["target"] - results["base"])
+    return effect
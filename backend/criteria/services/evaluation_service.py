@@ -0,0 +1,233 @@
+import heapq
+import math
+
+import numpy as np
+from rest_framework.exceptions import ValidationError
+
+from ..constants import EvaluationMessage
+from .expression_service import CompiledVersion
+
+
+def inputs_from_matrix(columns, rows) -> dict:
+    """
+    Split a row-per-employee matrix into one NumPy column per input alias.
+
+    Args:
+        columns (list[str]): Input alias of every column.
+        rows (list[list[float]]): One row of input values per employee.
+
+    Returns:
+        dict: Mapping of alias to a float64 array of length N.
+
+    Raises:
+        ValidationError: If the matrix is not rectangular or not numeric.
+    """
+    try:
+        matrix = np.asarray(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValidationError(EvaluationMessage.INVALID_INPUT_VALUE)
+
+    if matrix.ndim != 2 or matrix.shape[1] != len(columns):
+        raise ValidationError(EvaluationMessage.INVALID_INPUT_SHAPE)
+
+    return {alias: matrix[:, index] for index, alias in enumerate(columns)}
+
+
+def validate_inputs(compiled: CompiledVersion, inputs: dict) -> int:
+    """
+    Check that the inputs cover every input alias of the version and
+    respect the bounds of their input type.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        inputs (dict): Mapping of alias to a float64 array.
+
+    Returns:
+        int: The number of rows (employees) in the batch.
+
+    Raises:
+        ValidationError: Mapping of alias to every problem found.
+    """
+    errors = {}
+    for alias in inputs:
+        if alias not in compiled.input_bounds:
+            errors[alias] = [EvaluationMessage.UNKNOWN_INPUT]
+    for alias in compiled.input_aliases:
+        if alias not in inputs:
+            errors[alias] = [EvaluationMessage.MISSING_INPUT]
+    if errors:
+        raise ValidationError(errors)
+
+    lengths = {len(values) for values in inputs.values()}
+    if len(lengths) > 1:
+        raise ValidationError(EvaluationMessage.INVALID_INPUT_SHAPE)
+
+    for alias, (minimum, maximum) in compiled.input_bounds.items():
+        values = inputs[alias]
+        invalid = np.isnan(values)
+        if minimum is not None:
+            invalid |= values < minimum
+        if maximum is not None:
+            invalid |= values > maximum
+        if invalid.any():
+            rows = ", ".join(str(row) for row in np.flatnonzero(invalid))
+            errors[alias] = [f"{EvaluationMessage.INPUT_OUT_OF_RANGE}: rows {rows}"]
+    if errors:
+        raise ValidationError(errors)
+
+    return lengths.pop() if lengths else 0
+
+
+def valid_input_rows(compiled: CompiledVersion, inputs: dict) -> np.ndarray:
+    """
+    Return a boolean mask of the rows whose input values are all present
+    and inside the bounds of their input type.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        inputs (dict): Mapping of every input alias to a float64 array.
+
+    Returns:
+        np.ndarray: True for every row that can be evaluated.
+    """
+    size = len(next(iter(inputs.values()))) if inputs else 0
+    valid = np.ones(size, dtype=bool)
+    for alias, (minimum, maximum) in compiled.input_bounds.items():
+        values = inputs[alias]
+        valid &= ~np.isnan(values)
+        if minimum is not None:
+            valid &= values >= minimum
+        if maximum is not None:
+            valid &= values <= maximum
+    return valid
+
+
+def evaluate_batch(compiled: CompiledVersion, inputs: dict) -> dict:
+    """
+    Compute every derived criterion for a whole batch of employees at once.
+
+    Each expression runs a single time over NumPy arrays holding the values
+    of all employees, in the dependency order of the version.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        inputs (dict): Mapping of input alias to a float64 array of length N.
+
+    Returns:
+        dict: Mapping of every input and derived alias to an array of length N.
+    """
+    try:
+        values = {
+            alias: np.asarray(column, dtype=np.float64)
+            for alias, column in inputs.items()
+        }
+    except (TypeError, ValueError):
+        raise ValidationError(EvaluationMessage.INVALID_INPUT_VALUE)
+    size = validate_inputs(compiled, values)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for alias in compiled.order:
+            result = compiled.expressions[alias].evaluate(values)
+            values[alias] = np.broadcast_to(
+                np.asarray(result, dtype=np.float64), (size,)
+            )
+    return values
+
+
+def _same_value(old, new) -> bool:
+    if old is None:
+        return False
+    return old == new or (math.isnan(old) and math.isnan(new))
+
+
+def evaluate_incremental(compiled: CompiledVersion, values: dict, changes: dict) -> dict:
+    """
+    Re-evaluate one employee after some of their input values changed.
+
+    Only criteria downstream of the changed aliases are recomputed, following
+    the reverse-dependency index of the version in topological order. A
+    criterion whose value does not change stops the propagation, so its own
+    dependents are left untouched.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        values (dict): Current value of every alias of the employee.
+        changes (dict): New value of each edited input alias.
+
+    Returns:
+        dict: Mapping of each derived alias whose value changed to its new value.
+
+    Raises:
+        ValidationError: If a changed alias is not a valid input value or a
+            value needed for recomputation is missing.
+    """
+    errors = {}
+    for alias, value in changes.items():
+        if alias not in compiled.input_bounds:
+            errors[alias] = [EvaluationMessage.UNKNOWN_INPUT]
+            continue
+        minimum, maximum = compiled.input_bounds[alias]
+        if (
+            math.isnan(value)
+            or (minimum is not None and value < minimum)
+            or (maximum is not None and value > maximum)
+        ):
+            errors[alias] = [EvaluationMessage.INPUT_OUT_OF_RANGE]
+    if errors:
+        raise ValidationError(errors)
+
+    # Values are NumPy scalars, so a division by zero gives infinity or NaN
+    # under np.errstate, like the batch path, instead of raising.
+    namespace = {
+        alias: None if value is None else np.float64(value)
+        for alias, value in values.items()
+    }
+    graph = compiled.graph
+    dirty = []
+    queued = set()
+
+    def mark_dependents(alias):
+        for dependent in graph.dependents.get(alias, ()):
+            if dependent not in queued and dependent in compiled.expressions:
+                queued.add(dependent)
+                heapq.heappush(dirty, (graph.position[dependent], dependent))
+
+    for alias, value in changes.items():
+        value = np.float64(value)
+        if not _same_value(namespace.get(alias), value):
+            namespace[alias] = value
+            mark_dependents(alias)
+
+    changed = {}
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        while dirty:
+            _, alias = heapq.heappop(dirty)
+            expression = compiled.expressions[alias]
+            missing = [name for name in expression.dependencies if namespace.get(name) is None]
+            if missing:
+                raise ValidationError({
+                    name: [EvaluationMessage.MISSING_INPUT] for name in missing
+                })
+
+            value = np.float64(expression.evaluate(namespace))
+            if _same_value(namespace.get(alias), value):
+                continue
+            namespace[alias] = value
+            changed[alias] = float(value)
+            mark_dependents(alias)
+    return changed
+
+
+def to_json_value(value):
+    """
+    Convert a single result to a JSON friendly value (NaN and infinity become None).
+    """
+    return value if math.isfinite(value) else None
+
+
+def to_json_list(values) -> list:
+    """
+    Convert a result array to a JSON friendly list (NaN and infinity become None).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isfinite(values), values, None).tolist()
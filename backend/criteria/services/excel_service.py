@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+
+import formulas
+import numpy as np
+from formulas.errors import FormulaError
+from formulas.functions import get_functions, not_implemented
+from formulas.tokens.function import Function
+
+from ..constants import ExpressionMessage
+
+# Excel functions that work element-wise, so a formula that only uses them
+# (and the reducing functions below) can run once on the arrays of a whole
+# batch of employees. Any other function, such as GEOMEAN or SUMIF, may
+# reduce its arguments to a single value, so formulas that use one run once
+# per employee instead.
+VECTORIZED_FUNCTIONS = frozenset({
+    "ABS",
+    "EXP",
+    "IF",
+    "IFERROR",
+    "INT",
+    "LN",
+    "LOG",
+    "LOG10",
+    "MOD",
+    "NOT",
+    "POWER",
+    "ROUND",
+    "ROUNDDOWN",
+    "ROUNDUP",
+    "SIGN",
+    "SQRT",
+    "TRUNC",
+})
+
+
+def _as_float(value) -> float:
+    # Excel errors such as #DIV/0! and text results become NaN, like the
+    # invalid operations of the Python dialect.
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+_as_floats = np.frompyfunc(_as_float, 1, 1)
+
+
+def _elementwise(reduce, function):
+    # Reduce across the arguments instead of over them, so each employee of
+    # a batch gets the SUM or MIN of their own values. Ranges and array
+    # constants (2-D) keep the Excel function.
+    def elementwise(*args):
+        if any(np.ndim(arg) > 1 for arg in args):
+            return function(*args)
+        columns = [
+            np.asarray(_as_floats(np.asarray(arg, dtype=object)), dtype=np.float64)
+            for arg in args
+        ]
+        return reduce(np.stack(np.broadcast_arrays(*columns)), axis=0)
+    return elementwise
+
+
+# Excel functions that reduce their arguments, and their NumPy reductions.
+# Called with one value per argument, as with aliases, they are evaluated
+# element-wise across their arguments.
+REDUCING_FUNCTIONS = {
+    "AVERAGE": np.mean,
+    "MAX": np.max,
+    "MIN": np.min,
+    "PRODUCT": np.prod,
+    "SUM": np.sum,
+}
+
+
+@dataclass(frozen=True)
+class ExcelExpression:
+    alias: str
+    source: str
+    function: object
+    arguments: tuple
+    dependencies: frozenset
+    vectorized: bool
+
+    def evaluate(self, namespace: dict):
+        """
+        Run the compiled formula against the given alias values.
+
+        Args:
+            namespace (dict): Mapping of alias to a scalar or NumPy array.
+
+        Returns:
+            A float, or a float64 array with the shape of the inputs.
+        """
+        values = [namespace[alias] for alias in self.arguments]
+        if all(np.ndim(value) == 0 for value in values):
+            return _as_float(self.function(*values))
+
+        columns = np.broadcast_arrays(*values)
+        if self.vectorized:
+            result = np.asarray(self.function(*values), dtype=object)
+            if result.shape == columns[0].shape:
+                return _as_floats(result).astype(np.float64)
+
+        # A result without one value per employee was reduced over the batch,
+        # so the formula is run once per employee instead.
+        result = [self.function(*row) for row in zip(*columns)]
+        return _as_floats(np.asarray(result, dtype=object)).astype(np.float64)
+
+
+def compile_excel_formula(alias: str, source: str, aliases) -> ExcelExpression:
+    """
+    Parse an Excel formula once and compile it into a callable.
+
+    Aliases are matched case-insensitively, the way Excel matches names.
+
+    Args:
+        alias (str): The alias of the criterion holding the formula.
+        source (str): The formula, with or without its leading `=`.
+        aliases (Iterable[str]): Every alias of the version.
+
+    Returns:
+        ExcelExpression: The compiled formula.
+
+    Raises:
+        ValueError: If the formula cannot be parsed, calls an unknown
+            function or references an unknown alias.
+    """
+    formula = source.strip()
+    if not formula.startswith("="):
+        formula = f"={formula}"
+
+    try:
+        tokens, builder = formulas.Parser().ast(formula)
+    except FormulaError:
+        raise ValueError(ExpressionMessage.INVALID_SYNTAX)
+
+    functions = get_functions()
+    names = {token.name.upper() for token in tokens if isinstance(token, Function)}
+    for name in sorted(names):
+        # Unknown names are added to the registry as placeholders when parsed.
+        if functions.get(name, not_implemented) is not_implemented:
+            raise ValueError(f"{ExpressionMessage.UNKNOWN_FUNCTION}: {name}")
+
+    reducing = {
+        functions[name]: _elementwise(REDUCING_FUNCTIONS[name], functions[name])
+        for name in names & REDUCING_FUNCTIONS.keys()
+    }
+    for node in builder.dsp.function_nodes.values():
+        if node["function"] in reducing:
+            node["function"] = reducing[node["function"]]
+
+    by_name = {name.upper(): name for name in aliases}
+    function = builder.compile()
+    arguments = []
+    for name in function.inputs:
+        if name not in by_name:
+            raise ValueError(f"{ExpressionMessage.UNKNOWN_ALIAS}: {name}")
+        arguments.append(by_name[name])
+
+    return ExcelExpression(
+        alias=alias,
+        source=source,
+        function=function,
+        arguments=tuple(arguments),
+        dependencies=frozenset(arguments),
+        vectorized=names <= VECTORIZED_FUNCTIONS | REDUCING_FUNCTIONS.keys(),
+    )
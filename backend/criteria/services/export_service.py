@@ -0,0 +1,165 @@
+import csv
+import tempfile
+
+from openpyxl import Workbook
+
+from ..models import (
+    Criteria,
+    EvaluationResult,
+)
+from .snapshot_service import (
+    load_snapshot,
+    snapshot_criteria,
+)
+
+CSV = "csv"
+XLSX = "xlsx"
+CONTENT_TYPES = {
+    CSV: "text/csv",
+    XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+CHUNK_SIZE = 2000
+FILE_CHUNK_SIZE = 64 * 1024
+
+CRITERIA_HEADER = [
+    "alias",
+    "name",
+    "parent_alias",
+    "description",
+    "is_input",
+    "input_type",
+    "input_min",
+    "input_max",
+    "expression",
+    "is_final_result",
+]
+
+# Criteria values written under CRITERIA_HEADER.
+CRITERIA_EXPORT_FIELDS = (
+    "alias",
+    "name",
+    "parent_alias",
+    "description",
+    "is_input",
+    "input_type__name",
+    "input_type__min",
+    "input_type__max",
+    "expression",
+    "is_final_result",
+)
+
+RESULT_HEADER = [
+    "employee_id",
+    "username",
+    "team",
+    "final_result",
+    "grade",
+    "needs_action",
+    "needs_explanation",
+    "evaluated_at",
+]
+
+
+class _Echo:
+    """
+    File-like object that hands back what is written to it, so csv.writer
+    can produce one line at a time.
+    """
+    def write(self, value):
+        return value
+
+
+def stream_csv(header, rows):
+    """
+    Yield a CSV file line by line.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_xlsx(header, rows, title):
+    """
+    Yield an XLSX file in chunks.
+
+    The workbook is built in openpyxl write-only mode, which flushes every row
+    to a temporary file instead of keeping the sheet in memory. An XLSX file
+    is a zip archive that can only be finished after its last row, so the
+    finished file is then streamed from disk.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(FILE_CHUNK_SIZE):
+            yield chunk
+
+
+def stream_rows(file_type, header, rows, title):
+    if file_type == XLSX:
+        return stream_xlsx(header, rows, title)
+    return stream_csv(header, rows)
+
+
+def criteria_rows(version_id: int):
+    """
+    Yield the criteria tree of a version, read with a server-side cursor.
+
+    Frozen versions are read from their snapshot, which is what they are
+    evaluated with.
+    """
+    snapshot = load_snapshot(version_id)
+    if snapshot is not None:
+        return (
+            tuple(row[field] for field in CRITERIA_EXPORT_FIELDS)
+            for row in snapshot_criteria(snapshot)
+        )
+
+    return Criteria.objects.filter(version_id=version_id).order_by("id").values_list(
+        *CRITERIA_EXPORT_FIELDS
+    ).iterator(chunk_size=CHUNK_SIZE)
+
+
+def result_header(version_id: int) -> tuple:
+    """
+    Return the header of a result export and the aliases of its value columns.
+    """
+    snapshot = load_snapshot(version_id)
+    if snapshot is not None:
+        aliases = [row["alias"] for row in snapshot["criteria"]]
+    else:
+        aliases = list(
+            Criteria.objects.filter(version_id=version_id).order_by("id").values_list(
+                "alias", flat=True
+            )
+        )
+    return RESULT_HEADER + aliases, aliases
+
+
+def result_rows(version_id: int, aliases):
+    """
+    Yield the evaluation results of a version, read with a server-side cursor.
+    """
+    results = EvaluationResult.objects.filter(version_id=version_id).order_by(
+        "employee_id"
+    ).values_list(
+        "employee_id",
+        "employee__user__username",
+        "employee__team__name",
+        "final_result",
+        "grade",
+        "needs_action",
+        "needs_explanation",
+        "evaluated_at",
+        "values",
+    ).iterator(chunk_size=CHUNK_SIZE)
+
+    for *fields, evaluated_at, values in results:
+        yield fields + [evaluated_at.isoformat()] + [values.get(alias) for alias in aliases]
@@ -0,0 +1,410 @@
+import ast
+import copy
+import math
+import threading
+from dataclasses import dataclass, field
+from functools import reduce
+
+import numpy as np
+from rest_framework.exceptions import ValidationError
+
+from ..constants import ExpressionMessage
+from ..models import (
+    Criteria,
+    CriteriaExpressionDialectEnum,
+    VariableRelationship,
+)
+from .excel_service import compile_excel_formula
+from .interval_service import propagate_bounds
+from .graph_service import (
+    DependencyIndex,
+    build_dependency_index,
+)
+from .snapshot_service import (
+    criteria_definition,
+    load_snapshot,
+)
+from .stamp_service import (
+    renew_shared_stamp,
+    shared_stamp,
+)
+
+KEY_PREFIX = "criteria-program"
+
+
+def _minimum(*args):
+    return reduce(np.minimum, args)
+
+
+def _maximum(*args):
+    return reduce(np.maximum, args)
+
+
+def _round(value, digits=0):
+    return np.round(value, int(digits))
+
+
+# Functions that can be called inside Criteria.expression. Every function
+# works on scalars as well as on NumPy arrays, so the same compiled code can
+# score one employee or a whole team at once.
+FUNCTIONS = {
+    "min": _minimum,
+    "max": _maximum,
+    "abs": np.abs,
+    "round": _round,
+    "where": np.where,
+}
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.Eq,
+    ast.NotEq,
+)
+
+_GLOBALS = {"__builtins__": {}, "__float64__": np.float64, **FUNCTIONS}
+
+
+class _FloatConstants(ast.NodeTransformer):
+    # Integer constants would run Python big-int arithmetic, which can hang
+    # on a power like 9 ** 9 ** 9. As floats, they overflow to infinity.
+    def visit_Constant(self, node):
+        try:
+            value = float(node.value)
+        except OverflowError:
+            value = math.inf
+        return ast.copy_location(ast.Constant(value), node)
+
+
+class _NumPyConstants(ast.NodeTransformer):
+    # Python floats raise OverflowError where NumPy returns infinity, so the
+    # compiled code wraps every constant in np.float64, like the batch values.
+    def visit_Constant(self, node):
+        call = ast.Call(
+            func=ast.Name(id="__float64__", ctx=ast.Load()), args=[node], keywords=[]
+        )
+        return ast.copy_location(call, node)
+
+
+def _compile_tree(alias: str, tree: ast.Expression):
+    tree = ast.fix_missing_locations(_NumPyConstants().visit(copy.deepcopy(tree)))
+    return compile(tree, filename=f"<criteria {alias}>", mode="eval")
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    alias: str
+    source: str
+    code: object
+    dependencies: frozenset
+
+    def evaluate(self, namespace: dict):
+        """
+        Run the compiled expression against the given alias values.
+
+        Args:
+            namespace (dict): Mapping of alias to a scalar or NumPy array.
+
+        Returns:
+            The computed value, with the same shape as the inputs.
+        """
+        return eval(self.code, _GLOBALS, namespace)
+
+
+@dataclass
+class CompiledVersion:
+    version_id: int
+    input_aliases: tuple
+    expressions: dict
+    order: tuple = ()
+    graph: DependencyIndex | None = None
+    final_alias: str | None = None
+    aliases: frozenset = field(default_factory=frozenset)
+    input_bounds: dict = field(default_factory=dict)
+    bounds: dict = field(default_factory=dict)
+
+
+def parse_expression(source: str) -> ast.Expression:
+    """
+    Parse and validate an expression against the allowed grammar.
+
+    Args:
+        source (str): The raw text of Criteria.expression.
+
+    Returns:
+        ast.Expression: The validated syntax tree, with every constant
+            turned into a float.
+
+    Raises:
+        ValueError: If the expression is not valid or uses unsupported syntax.
+    """
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError:
+        raise ValueError(ExpressionMessage.INVALID_SYNTAX)
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(
+                f"{ExpressionMessage.UNSUPPORTED_SYNTAX}: {type(node).__name__}"
+            )
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool)
+            or not isinstance(node.value, (int, float))
+        ):
+            raise ValueError(
+                f"{ExpressionMessage.UNSUPPORTED_SYNTAX}: {node.value!r}"
+            )
+        if isinstance(node, ast.Compare) and len(node.ops) > 1:
+            raise ValueError(
+                f"{ExpressionMessage.UNSUPPORTED_SYNTAX}: chained comparison"
+            )
+        if isinstance(node, ast.Call):
+            if (
+                not isinstance(node.func, ast.Name)
+                or node.func.id not in FUNCTIONS
+                or node.keywords
+            ):
+                raise ValueError(ExpressionMessage.UNKNOWN_FUNCTION)
+    return _FloatConstants().visit(tree)
+
+
+def referenced_aliases(tree: ast.Expression) -> frozenset:
+    """
+    Collect every alias referenced by a parsed expression.
+
+    Function names used in calls are not counted as aliases.
+    """
+    called = {
+        id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)
+    }
+    return frozenset(
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and id(node) not in called
+    )
+
+
+def compile_criteria(
+    version_id: int,
+    rows,
+    edges=(),
+    dialect=CriteriaExpressionDialectEnum.PYTHON,
+) -> CompiledVersion:
+    """
+    Compile every expression of a criteria version.
+
+    Each expression is parsed a single time, whatever its dialect. All errors
+    of the version are collected and reported together. The interval of
+    every criterion, propagated from the bounds of the input types, is
+    computed once here and kept on the program.
+
+    Args:
+        version_id (int): The CriteriaVersion primary key.
+        rows (Iterable[dict]): Criteria values with at least `alias`,
+            `is_input`, `expression` and `is_final_result`, and optionally
+            the `input_type__min` / `input_type__max` bounds of inputs.
+        edges (Iterable[tuple[str, str]]): VariableRelationship
+            `(from_alias, to_alias)` pairs of the version. Aliases referenced
+            by an expression are added as edges as well.
+        dialect (str): The expression dialect of the version, either Python
+            or Excel formulas.
+
+    Returns:
+        CompiledVersion: The compiled program of the version.
+
+    Raises:
+        ValidationError: Mapping of alias to the list of its errors.
+    """
+    rows = list(rows)
+    errors = {}
+    aliases = set()
+    for row in rows:
+        if row["alias"] in aliases:
+            errors.setdefault(row["alias"], []).append(
+                ExpressionMessage.DUPLICATE_ALIAS
+            )
+        aliases.add(row["alias"])
+
+    input_aliases = tuple(row["alias"] for row in rows if row["is_input"])
+    valued_aliases = set(input_aliases) | {
+        row["alias"] for row in rows
+        if not row["is_input"] and row["expression"]
+    }
+
+    expressions = {}
+    trees = {}
+    final_alias = None
+    for row in rows:
+        alias = row["alias"]
+        if row["is_final_result"]:
+            final_alias = alias
+        if row["is_input"] or not row["expression"]:
+            continue
+
+        try:
+            if dialect == CriteriaExpressionDialectEnum.EXCEL:
+                expression = compile_excel_formula(alias, row["expression"], aliases)
+            else:
+                tree = trees[alias] = parse_expression(row["expression"])
+                expression = CompiledExpression(
+                    alias=alias,
+                    source=row["expression"],
+                    code=_compile_tree(alias, tree),
+                    dependencies=referenced_aliases(tree),
+                )
+        except ValueError as e:
+            errors.setdefault(alias, []).append(str(e))
+            continue
+
+        for name in sorted(expression.dependencies):
+            if name not in aliases:
+                errors.setdefault(alias, []).append(
+                    f"{ExpressionMessage.UNKNOWN_ALIAS}: {name}"
+                )
+            elif name not in valued_aliases:
+                errors.setdefault(alias, []).append(
+                    f"{ExpressionMessage.ALIAS_HAS_NO_VALUE}: {name}"
+                )
+
+        expressions[alias] = expression
+
+    try:
+        graph = build_dependency_index(
+            [row["alias"] for row in rows],
+            list(edges) + [
+                (dependency, alias)
+                for alias, expression in expressions.items()
+                for dependency in sorted(expression.dependencies & aliases)
+            ],
+        )
+    except ValidationError as ve:
+        for key, messages in ve.detail.items():
+            errors.setdefault(key, []).extend(messages)
+
+    if errors:
+        raise ValidationError(errors)
+
+    order = tuple(alias for alias in graph.order if alias in expressions)
+
+    input_bounds = {
+        row["alias"]: (row.get("input_type__min"), row.get("input_type__max"))
+        for row in rows if row["is_input"]
+    }
+
+    return CompiledVersion(
+        version_id=version_id,
+        input_aliases=input_aliases,
+        expressions=expressions,
+        order=order,
+        graph=graph,
+        final_alias=final_alias,
+        aliases=frozenset(aliases),
+        input_bounds=input_bounds,
+        bounds=propagate_bounds(order, trees, input_bounds),
+    )
+
+
+_compiled_versions = {}
+_generations = {}
+_lock = threading.Lock()
+
+
+def load_criteria_definition(version_id: int) -> tuple:
+    """
+    Load the plain data needed to compile a criteria version.
+
+    Frozen (Official) versions are read from their snapshot with a single
+    query; other versions are read from the live tables. The result only
+    holds built-in types, so it can be sent to other processes and compiled
+    there with `compile_criteria`.
+
+    Args:
+        version_id (int): The CriteriaVersion primary key.
+
+    Returns:
+        tuple: The list of criteria rows, the list of relationship edges and
+            the expression dialect of the version.
+    """
+    snapshot = load_snapshot(version_id)
+    if snapshot is not None:
+        return criteria_definition(snapshot)
+
+    rows = Criteria.objects.filter(version_id=version_id).order_by("id").values(
+        "alias",
+        "is_input",
+        "expression",
+        "is_final_result",
+        "input_type__min",
+        "input_type__max",
+        "version__expression_dialect",
+    )
+    edges = VariableRelationship.objects.filter(version_id=version_id).order_by(
+        "id"
+    ).values_list("from_alias", "to_alias")
+    rows = list(rows)
+    # The dialect only matters when the version has expressions to compile.
+    dialect = rows[0]["version__expression_dialect"] if rows else (
+        CriteriaExpressionDialectEnum.PYTHON
+    )
+    return rows, list(edges), dialect
+
+
+def get_compiled_version(version_id: int) -> CompiledVersion:
+    """
+    Return the compiled program of a criteria version, compiling it on first use.
+
+    The program carries the dependency index of the version, so evaluation
+    never rebuilds the graph. With a shared cache, the program is cached
+    with the shared stamp of the version, so it is compiled again once
+    another process invalidates it.
+
+    Args:
+        version_id (int): The CriteriaVersion primary key.
+
+    Returns:
+        CompiledVersion: The cached compiled program.
+    """
+    stamp = shared_stamp(KEY_PREFIX, version_id)
+    cached = _compiled_versions.get(version_id)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    generation = _generations.get(version_id, 0)
+    rows, edges, dialect = load_criteria_definition(version_id)
+    compiled = compile_criteria(version_id, rows, edges, dialect)
+
+    with _lock:
+        # Do not cache a program that was invalidated while it was compiling.
+        if _generations.get(version_id, 0) == generation:
+            _compiled_versions[version_id] = (stamp, compiled)
+    return compiled
+
+
+def invalidate_compiled_version(version_id: int) -> None:
+    """
+    Drop the cached compiled program of a criteria version, in every process.
+    """
+    with _lock:
+        _generations[version_id] = _generations.get(version_id, 0) + 1
+        _compiled_versions.pop(version_id, None)
+    renew_shared_stamp(KEY_PREFIX, version_id)
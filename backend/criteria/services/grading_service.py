@@ -0,0 +1,180 @@
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from rest_framework.exceptions import ValidationError
+
+from ..constants import GradingMessage
+from ..models import ResultPolicy
+from .interval_service import Interval
+from .snapshot_service import load_snapshot
+from .stamp_service import (
+    renew_shared_stamp,
+    shared_stamp,
+)
+
+KEY_PREFIX = "criteria-policy"
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """
+    ResultPolicy of a version compiled into sorted lookup arrays.
+
+    `thresholds[i]` is the lowest score that gets `grades[i]`, and
+    `needs_action[i]` / `needs_explanation[i]` are the flags of that grade.
+    """
+    thresholds: np.ndarray
+    grades: np.ndarray
+    needs_action: np.ndarray
+    needs_explanation: np.ndarray
+
+    def grade(self, scores, bounds: Interval | None = None) -> dict:
+        """
+        Grade a batch of final scores with one `numpy.searchsorted` call.
+
+        Scores below the lowest threshold, or that are not numbers, get no grade.
+        When the known bounds of the scores prove that every score is a
+        number above the lowest threshold, these checks are skipped, and a
+        batch that can only get one grade is not searched at all.
+
+        Args:
+            scores (array-like): Final result of every employee.
+            bounds (Interval | None): Interval that holds every score.
+
+        Returns:
+            dict: `grades`, `needs_action` and `needs_explanation` arrays
+                aligned with the scores.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        if bounds is not None and not bounds.nan and bounds.low >= self.thresholds[0]:
+            first, last = np.searchsorted(self.thresholds, [bounds.low, bounds.high], side="right") - 1
+            if first == last:
+                indexes = np.full(scores.shape, first)
+            else:
+                indexes = np.searchsorted(self.thresholds, scores, side="right") - 1
+            return {
+                "grades": self.grades[indexes],
+                "needs_action": self.needs_action[indexes],
+                "needs_explanation": self.needs_explanation[indexes],
+            }
+
+        indexes = np.searchsorted(self.thresholds, scores, side="right") - 1
+        graded = (indexes >= 0) & ~np.isnan(scores)
+        indexes = np.where(graded, indexes, 0)
+        return {
+            "grades": np.where(graded, self.grades[indexes], None),
+            "needs_action": graded & self.needs_action[indexes],
+            "needs_explanation": graded & self.needs_explanation[indexes],
+        }
+
+
+def _grading_pairs(grading_rule) -> list:
+    # Accepted shapes of ResultPolicy.grading_rule:
+    #   {"90": "A", "75": "B"}                  lowest points -> grade
+    #   {"A": 90, "B": 75}                      grade -> lowest points
+    #   [{"min": 90, "grade": "A"}, ...]        list of rules
+    if isinstance(grading_rule, dict):
+        items = list(grading_rule.items())
+        try:
+            return [(float(points), str(grade)) for points, grade in items]
+        except (TypeError, ValueError):
+            return [(float(points), str(grade)) for grade, points in items]
+    if isinstance(grading_rule, list):
+        return [(float(rule["min"]), str(rule["grade"])) for rule in grading_rule]
+    raise TypeError(type(grading_rule).__name__)
+
+
+def compile_policy(grading_rule, action_grades, explanation_grades) -> CompiledPolicy:
+    """
+    Compile the JSON fields of a ResultPolicy into sorted threshold arrays.
+
+    Args:
+        grading_rule (dict | list): Performance point to grade mapping.
+        action_grades (list): Grades that need an action.
+        explanation_grades (list): Grades that need to be explained.
+
+    Returns:
+        CompiledPolicy: The compiled policy.
+
+    Raises:
+        ValidationError: If the grading rule is malformed.
+    """
+    try:
+        pairs = sorted(_grading_pairs(grading_rule))
+    except (KeyError, TypeError, ValueError):
+        raise ValidationError({"grading_rule": [GradingMessage.INVALID_GRADING_RULE]})
+
+    if not pairs:
+        raise ValidationError({"grading_rule": [GradingMessage.EMPTY_GRADING_RULE]})
+    thresholds = [points for points, _ in pairs]
+    if len(set(thresholds)) != len(thresholds) or np.isnan(thresholds).any():
+        raise ValidationError({"grading_rule": [GradingMessage.INVALID_GRADING_RULE]})
+
+    grades = [grade for _, grade in pairs]
+    action_grades = {str(grade) for grade in action_grades or ()}
+    explanation_grades = {str(grade) for grade in explanation_grades or ()}
+
+    return CompiledPolicy(
+        thresholds=np.asarray(thresholds, dtype=np.float64),
+        grades=np.asarray(grades, dtype=object),
+        needs_action=np.asarray([grade in action_grades for grade in grades]),
+        needs_explanation=np.asarray([grade in explanation_grades for grade in grades]),
+    )
+
+
+_compiled_policies = {}
+_generations = {}
+_lock = threading.Lock()
+
+
+def load_policy_definition(version_id: int) -> dict | None:
+    """
+    Load the JSON fields of the ResultPolicy of a version as a plain dict.
+
+    The result can be passed as keyword arguments to `compile_policy`.
+    Frozen versions are read from their snapshot.
+    """
+    snapshot = load_snapshot(version_id)
+    if snapshot is not None:
+        return snapshot["result_policy"]
+
+    return ResultPolicy.objects.filter(version_id=version_id).values(
+        "grading_rule", "action_grades", "explanation_grades"
+    ).first()
+
+
+def get_compiled_policy(version_id: int) -> CompiledPolicy | None:
+    """
+    Return the compiled ResultPolicy of a criteria version, compiling it on first use.
+
+    Args:
+        version_id (int): The CriteriaVersion primary key.
+
+    Returns:
+        CompiledPolicy | None: The cached compiled policy, or None if the
+            version has no ResultPolicy.
+    """
+    stamp = shared_stamp(KEY_PREFIX, version_id)
+    cached = _compiled_policies.get(version_id)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    generation = _generations.get(version_id, 0)
+    policy = load_policy_definition(version_id)
+    compiled = compile_policy(**policy) if policy is not None else None
+
+    with _lock:
+        if _generations.get(version_id, 0) == generation:
+            _compiled_policies[version_id] = (stamp, compiled)
+    return compiled
+
+
+def invalidate_compiled_policy(version_id: int) -> None:
+    """
+    Drop the cached compiled ResultPolicy of a criteria version, in every process.
+    """
+    with _lock:
+        _generations[version_id] = _generations.get(version_id, 0) + 1
+        _compiled_policies.pop(version_id, None)
+    renew_shared_stamp(KEY_PREFIX, version_id)
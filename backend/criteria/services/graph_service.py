@@ -0,0 +1,96 @@
+from collections import deque
+from dataclasses import dataclass
+
+from rest_framework.exceptions import ValidationError
+
+from ..constants import GraphMessage
+
+
+@dataclass(frozen=True)
+class DependencyIndex:
+    """
+    Dependency graph of one criteria version.
+
+    `dependents` maps an alias to the aliases computed from it (the
+    `from_alias -> to_alias` direction of VariableRelationship) and
+    `dependencies` is the reverse adjacency list. `order` is a topological
+    order of every alias and `position` the index of an alias in it.
+    """
+    dependents: dict
+    dependencies: dict
+    order: tuple
+    position: dict
+
+    def downstream(self, aliases) -> tuple:
+        """
+        Return every alias reachable from the given aliases, in topological order.
+
+        The given aliases themselves are not included.
+        """
+        seen = set()
+        stack = list(aliases)
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return tuple(sorted(seen, key=self.position.__getitem__))
+
+
+def build_dependency_index(aliases, edges) -> DependencyIndex:
+    """
+    Build the adjacency lists and a topological order with Kahn's algorithm.
+
+    Runs in O(V + E). Dangling aliases and cycles are all collected in the
+    same pass and reported together.
+
+    Args:
+        aliases (Iterable[str]): Every alias of the version.
+        edges (Iterable[tuple[str, str]]): `(from_alias, to_alias)` pairs.
+
+    Returns:
+        DependencyIndex: The dependency index of the version.
+
+    Raises:
+        ValidationError: Mapping of the offending edge or alias to its errors.
+    """
+    aliases = list(dict.fromkeys(aliases))
+    dependents = {alias: [] for alias in aliases}
+    dependencies = {alias: [] for alias in aliases}
+    errors = {}
+
+    for from_alias, to_alias in dict.fromkeys(edges):
+        missing = [alias for alias in (from_alias, to_alias) if alias not in dependents]
+        if missing:
+            errors[f"{from_alias} -> {to_alias}"] = [
+                f"{GraphMessage.DANGLING_ALIAS}: {alias}" for alias in missing
+            ]
+            continue
+        dependents[from_alias].append(to_alias)
+        dependencies[to_alias].append(from_alias)
+
+    in_degree = {alias: len(dependencies[alias]) for alias in aliases}
+    queue = deque(alias for alias in aliases if in_degree[alias] == 0)
+    order = []
+    while queue:
+        alias = queue.popleft()
+        order.append(alias)
+        for dependent in dependents[alias]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    if len(order) < len(aliases):
+        for alias in aliases:
+            if in_degree[alias] > 0:
+                errors.setdefault(alias, []).append(GraphMessage.CYCLIC_DEPENDENCY)
+
+    if errors:
+        raise ValidationError(errors)
+
+    return DependencyIndex(
+        dependents={alias: tuple(items) for alias, items in dependents.items()},
+        dependencies={alias: tuple(items) for alias, items in dependencies.items()},
+        order=tuple(order),
+        position={alias: index for index, alias in enumerate(order)},
+    )
@@ -0,0 +1,173 @@
+import io
+
+import numpy as np
+import pandas as pd
+from django.db import connection, transaction
+
+from users.models import Employee
+from ..constants import ImportMessage
+from ..models import EvaluationInput
+from .expression_service import CompiledVersion
+
+EMPLOYEE_COLUMN = "employee_id"
+BATCH_SIZE = 5000
+EXCEL_EXTENSIONS = (".xlsx", ".xls")
+
+
+def read_sheet(file) -> pd.DataFrame:
+    """
+    Read an uploaded CSV or Excel sheet, keeping every cell as text so that
+    each column can be validated as a whole afterwards.
+
+    Raises:
+        ValueError: If the file type is not supported or cannot be parsed.
+    """
+    name = (getattr(file, "name", "") or "").lower()
+    if name.endswith(".csv"):
+        return pd.read_csv(file, dtype=str, skipinitialspace=True)
+    if name.endswith(EXCEL_EXTENSIONS):
+        return pd.read_excel(file, dtype=str)
+    raise ValueError(ImportMessage.INVALID_FILE_TYPE)
+
+
+def _cell_errors(frame, mask, column, message) -> list:
+    # Sheet row numbers start at 1 and the first row is the header.
+    cells = frame[column]
+    return [
+        {
+            "row": int(index) + 2,
+            "column": column,
+            "value": None if pd.isna(cells[index]) else cells[index],
+            "message": message,
+        }
+        for index in np.flatnonzero(mask)
+    ]
+
+
+def validate_sheet(compiled: CompiledVersion, frame: pd.DataFrame) -> tuple:
+    """
+    Validate a whole sheet column by column and collect every bad cell.
+
+    Empty input cells are allowed and are simply not imported.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        frame (pd.DataFrame): The sheet, with an `employee_id` column and one
+            column per input alias.
+
+    Returns:
+        tuple: A long `(employee_id, alias, value)` frame of the values to
+            import, and the list of errors (empty when the sheet is valid).
+    """
+    frame = frame.rename(columns=lambda column: str(column).strip()).reset_index(drop=True)
+    errors = []
+
+    if EMPLOYEE_COLUMN not in frame.columns:
+        errors.append({"column": EMPLOYEE_COLUMN, "message": ImportMessage.MISSING_EMPLOYEE_COLUMN})
+    unknown = [
+        column for column in frame.columns
+        if column != EMPLOYEE_COLUMN and column not in compiled.input_bounds
+    ]
+    for column in unknown:
+        errors.append({"column": column, "message": ImportMessage.UNKNOWN_COLUMN})
+    if errors:
+        return None, errors
+
+    employee_ids = pd.to_numeric(frame[EMPLOYEE_COLUMN], errors="coerce")
+    invalid = employee_ids.isna() | (employee_ids % 1 != 0)
+    errors += _cell_errors(frame, invalid, EMPLOYEE_COLUMN, ImportMessage.INVALID_EMPLOYEE)
+
+    known = set(
+        Employee.objects.filter(
+            id__in=employee_ids[~invalid].astype("int64").unique().tolist(),
+            is_active=True,
+        ).values_list("id", flat=True)
+    )
+    missing = ~invalid & ~employee_ids.isin(known)
+    errors += _cell_errors(frame, missing, EMPLOYEE_COLUMN, ImportMessage.EMPLOYEE_NOT_FOUND)
+    duplicated = ~invalid & employee_ids.duplicated(keep=False)
+    errors += _cell_errors(frame, duplicated, EMPLOYEE_COLUMN, ImportMessage.DUPLICATE_EMPLOYEE)
+
+    aliases = [column for column in frame.columns if column != EMPLOYEE_COLUMN]
+    values = {}
+    for alias in aliases:
+        empty = frame[alias].isna() | (frame[alias].str.strip() == "")
+        column = pd.to_numeric(frame[alias], errors="coerce")
+        errors += _cell_errors(
+            frame, ~empty & column.isna(), alias, ImportMessage.INVALID_VALUE
+        )
+
+        minimum, maximum = compiled.input_bounds[alias]
+        out_of_range = pd.Series(False, index=frame.index)
+        if minimum is not None:
+            out_of_range |= column < minimum
+        if maximum is not None:
+            out_of_range |= column > maximum
+        errors += _cell_errors(frame, out_of_range, alias, ImportMessage.VALUE_OUT_OF_RANGE)
+        values[alias] = column
+
+    if errors:
+        return None, errors
+
+    wide = pd.DataFrame(values)
+    wide.insert(0, EMPLOYEE_COLUMN, employee_ids.astype("int64"))
+    long = wide.melt(id_vars=EMPLOYEE_COLUMN, var_name="alias", value_name="value")
+    return long.dropna(subset=["value"]).reset_index(drop=True), []
+
+
+def _copy_inputs(version_id: int, values: pd.DataFrame) -> None:
+    buffer = io.StringIO()
+    values.assign(version_id=version_id)[
+        ["version_id", EMPLOYEE_COLUMN, "alias", "value"]
+    ].to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    table = connection.ops.quote_name(EvaluationInput._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} (version_id, employee_id, alias, value) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+
+@transaction.atomic
+def write_inputs(version_id: int, values: pd.DataFrame) -> int:
+    """
+    Replace the stored input value of every non-empty cell of a sheet.
+
+    Empty cells are not part of the frame, so the values already stored for
+    them are kept. Rows are written with Postgres COPY when available, and
+    with `bulk_create` in batches on other databases.
+
+    Args:
+        version_id (int): The CriteriaVersion primary key.
+        values (pd.DataFrame): Long `(employee_id, alias, value)` frame.
+
+    Returns:
+        int: The number of values written.
+    """
+    for alias, column in values.groupby("alias")[EMPLOYEE_COLUMN]:
+        employee_ids = column.tolist()
+        for start in range(0, len(employee_ids), BATCH_SIZE):
+            EvaluationInput.objects.filter(
+                version_id=version_id,
+                employee_id__in=employee_ids[start:start + BATCH_SIZE],
+                alias=alias,
+            ).delete()
+
+    if connection.vendor == "postgresql":
+        _copy_inputs(version_id, values)
+    else:
+        EvaluationInput.objects.bulk_create(
+            (
+                EvaluationInput(
+                    version_id=version_id,
+                    employee_id=employee_id,
+                    alias=alias,
+                    value=value,
+                )
+                for employee_id, alias, value in values.itertuples(index=False)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+    return len(values)
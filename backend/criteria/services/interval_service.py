@@ -0,0 +1,248 @@
+import ast
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+INF = math.inf
+
+
+@dataclass(frozen=True)
+class Interval:
+    """
+    Range of the values a criterion can take. `nan` is True when the value
+    may not be a number at all (for example after a division by zero).
+    """
+    low: float = -INF
+    high: float = INF
+    nan: bool = False
+
+    @property
+    def bounded(self) -> bool:
+        return math.isfinite(self.low) and math.isfinite(self.high)
+
+    def contains(self, value: float) -> bool:
+        return self.low <= value <= self.high
+
+    def to_json(self) -> dict:
+        return {
+            "min": self.low if math.isfinite(self.low) else None,
+            "max": self.high if math.isfinite(self.high) else None,
+            "may_be_nan": self.nan,
+        }
+
+
+UNBOUNDED = Interval()
+BOOLEAN = Interval(0.0, 1.0)
+
+
+def _span(values, nan=False) -> Interval:
+    # NaN candidates come from inf - inf or 0 * inf, which only happen with
+    # unbounded operands: the result is then unbounded as well.
+    values = [float(value) for value in values]
+    if any(math.isnan(value) for value in values):
+        return Interval(nan=nan)
+    return Interval(min(values), max(values), nan)
+
+
+def _multiply(a: Interval, b: Interval, nan: bool) -> Interval:
+    with np.errstate(invalid="ignore", over="ignore"):
+        products = [
+            0.0 if 0.0 in (x, y) else x * y
+            for x in (a.low, a.high) for y in (b.low, b.high)
+        ]
+    return _span(products, nan)
+
+
+def _divide(a: Interval, b: Interval, nan: bool) -> Interval:
+    if b.contains(0.0):
+        return Interval(nan=True)
+    return _multiply(a, Interval(1.0 / b.high, 1.0 / b.low), nan)
+
+
+def _power(a: Interval, b: Interval, nan: bool) -> Interval:
+    exponent = b.low if b.low == b.high else None
+    with np.errstate(over="ignore"):
+        if exponent is not None and exponent.is_integer() and exponent >= 0:
+            candidates = [np.power(a.low, exponent), np.power(a.high, exponent)]
+            if exponent % 2 == 0 and a.contains(0.0):
+                candidates.append(0.0)
+            return _span(candidates, nan)
+        if a.low > 0:
+            return _span(
+                [np.power(x, y) for x in (a.low, a.high) for y in (b.low, b.high)], nan
+            )
+    return Interval(nan=True)
+
+
+def _binary(op, a: Interval, b: Interval) -> Interval:
+    nan = a.nan or b.nan
+    if isinstance(op, ast.Add):
+        return _span([a.low + b.low, a.high + b.high], nan)
+    if isinstance(op, ast.Sub):
+        return _span([a.low - b.high, a.high - b.low], nan)
+    if isinstance(op, ast.Mult):
+        return _multiply(a, b, nan)
+    if isinstance(op, ast.Div):
+        return _divide(a, b, nan)
+    if isinstance(op, ast.FloorDiv):
+        quotient = _divide(a, b, nan)
+        return Interval(np.floor(quotient.low), np.floor(quotient.high), quotient.nan)
+    if isinstance(op, ast.Mod):
+        if b.contains(0.0):
+            return Interval(nan=True)
+        # Python's modulo takes the sign of the divisor.
+        if b.low > 0:
+            return Interval(0.0, b.high, nan)
+        return Interval(b.low, 0.0, nan)
+    if isinstance(op, ast.Pow):
+        return _power(a, b, nan)
+    return Interval(nan=True)
+
+
+# Number of arguments of the functions that can be analysed, as (min, max).
+_ARITY = {
+    "min": (1, None),
+    "max": (1, None),
+    "abs": (1, 1),
+    "round": (1, 2),
+    "where": (3, 3),
+}
+
+
+def _call(name, args, nodes) -> Interval:
+    nan = any(arg.nan for arg in args)
+    minimum, maximum = _ARITY.get(name, (None, None))
+    if minimum is None or len(args) < minimum or (maximum and len(args) > maximum):
+        return Interval(nan=True)
+    if name == "min":
+        return Interval(min(a.low for a in args), min(a.high for a in args), nan)
+    if name == "max":
+        return Interval(max(a.low for a in args), max(a.high for a in args), nan)
+    if name == "abs":
+        a = args[0]
+        if a.low >= 0:
+            return a
+        if a.high <= 0:
+            return Interval(-a.high, -a.low, nan)
+        return Interval(0.0, max(-a.low, a.high), nan)
+    if name == "round":
+        # Rounding is monotonic, so the rounded ends bound the result when
+        # the number of digits is a constant.
+        if len(nodes) > 1 and not isinstance(nodes[1], ast.Constant):
+            return Interval(nan=nan)
+        digits = int(nodes[1].value) if len(nodes) > 1 else 0
+        return Interval(np.round(args[0].low, digits), np.round(args[0].high, digits), nan)
+    _, a, b = args
+    return Interval(min(a.low, b.low), max(a.high, b.high), nan)
+
+
+def expression_interval(tree: ast.AST, intervals: dict) -> Interval:
+    """
+    Propagate the intervals of the referenced aliases through a parsed
+    expression, with interval arithmetic.
+
+    Args:
+        tree (ast.AST): An expression validated by `parse_expression`.
+        intervals (dict): Mapping of alias to its Interval.
+
+    Returns:
+        Interval: A range that holds every value the expression can take.
+    """
+    if isinstance(tree, ast.Expression):
+        return expression_interval(tree.body, intervals)
+    if isinstance(tree, ast.Constant):
+        return Interval(float(tree.value), float(tree.value))
+    if isinstance(tree, ast.Name):
+        return intervals.get(tree.id, UNBOUNDED)
+    if isinstance(tree, ast.UnaryOp):
+        operand = expression_interval(tree.operand, intervals)
+        if isinstance(tree.op, ast.USub):
+            return Interval(-operand.high, -operand.low, operand.nan)
+        return operand
+    if isinstance(tree, ast.BinOp):
+        return _binary(
+            tree.op,
+            expression_interval(tree.left, intervals),
+            expression_interval(tree.right, intervals),
+        )
+    if isinstance(tree, ast.Compare):
+        return BOOLEAN
+    if isinstance(tree, ast.Call):
+        args = [expression_interval(arg, intervals) for arg in tree.args]
+        return _call(tree.func.id, args, tree.args)
+    return Interval(nan=True)
+
+
+def propagate_bounds(order, trees: dict, input_bounds: dict) -> dict:
+    """
+    Compute the interval of every criterion of a version.
+
+    Input intervals come from the bounds of their InputType, where None is
+    infinite. Expressions that cannot be analysed (for example Excel
+    formulas, which have no tree here) are unbounded.
+
+    Args:
+        order (Iterable[str]): Derived aliases in dependency order.
+        trees (dict): Mapping of alias to its parsed expression.
+        input_bounds (dict): Mapping of input alias to `(min, max)`.
+
+    Returns:
+        dict: Mapping of every alias to its Interval.
+    """
+    intervals = {
+        alias: Interval(
+            -INF if minimum is None else float(minimum),
+            INF if maximum is None else float(maximum),
+        )
+        for alias, (minimum, maximum) in input_bounds.items()
+    }
+    for alias in order:
+        tree = trees.get(alias)
+        intervals[alias] = (
+            expression_interval(tree, intervals) if tree is not None else Interval(nan=True)
+        )
+    return intervals
+
+
+def unreachable_grades(thresholds, grades, interval: Interval) -> list:
+    """
+    Return the grades of a policy that no final result in the interval can get.
+
+    Grade `i` is given to scores in `[thresholds[i], thresholds[i + 1])`.
+    """
+    unreachable = []
+    for index, (minimum, grade) in enumerate(zip(thresholds, grades)):
+        maximum = thresholds[index + 1] if index + 1 < len(thresholds) else INF
+        if interval.high < minimum or interval.low >= maximum:
+            unreachable.append({"grade": grade, "min": float(minimum)})
+    return unreachable
+
+
+def analyze_version(compiled, policy) -> dict:
+    """
+    Report the bounds of every criterion of a compiled version, and the
+    grades of its policy that the final result can never reach.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        policy (CompiledPolicy | None): The compiled ResultPolicy, if any.
+
+    Returns:
+        dict: The JSON friendly bounds of every alias and of the final
+            result, the unreachable grades, and whether some final results
+            may get no grade at all.
+    """
+    final = compiled.bounds.get(compiled.final_alias)
+    analysis = {
+        "bounds": {alias: interval.to_json() for alias, interval in compiled.bounds.items()},
+        "final_result": final.to_json() if final is not None else None,
+        "unreachable_grades": [],
+        "may_be_ungraded": None,
+    }
+    if policy is not None and final is not None:
+        analysis["unreachable_grades"] = unreachable_grades(
+            policy.thresholds, policy.grades, final
+        )
+        analysis["may_be_ungraded"] = final.nan or final.low < policy.thresholds[0]
+    return analysis
@@ -0,0 +1,64 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from ..constants import CriteriaVersionMessage
+
+
+def encode_cursor(created_at: datetime, pk: int) -> str:
+    """
+    Return an opaque cursor pointing right after the given row.
+    """
+    payload = json.dumps([created_at.isoformat(), pk])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Return the `(created_at, id)` key encoded in a cursor.
+
+    Raises:
+        ValidationError: If the cursor was not made by `encode_cursor`.
+    """
+    try:
+        created_at, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, TypeError):
+        raise ValidationError({"cursor": [CriteriaVersionMessage.INVALID_CURSOR]})
+
+
+def keyset_page(queryset, cursor: str | None, page_size: int) -> tuple:
+    """
+    Return one page of rows ordered by `(created_at, id)`, starting after
+    the cursor.
+
+    The page is found by seeking the `(created_at, id)` key instead of
+    skipping rows with an OFFSET, so every page costs the same whatever its
+    position.
+
+    Args:
+        queryset (QuerySet): Rows with `created_at` and `id` fields.
+        cursor (str | None): The `next` cursor of the previous page, or None
+            for the first page.
+        page_size (int): The maximum number of rows of the page.
+
+    Returns:
+        tuple: The rows of the page, and the cursor of the next page or None
+            on the last page.
+    """
+    queryset = queryset.order_by("created_at", "id")
+    if cursor is not None:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        )
+
+    # One extra row tells whether there is a next page.
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].pk)
@@ -0,0 +1,134 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from django.conf import settings
+
+from .evaluation_service import evaluate_batch
+from .expression_service import CompiledVersion
+from .grading_service import CompiledPolicy
+from .stamp_service import (
+    renew_shared_stamp,
+    shared_cache,
+    shared_stamp,
+)
+
+DEFAULT_SIZE = 256
+KEY_PREFIX = "criteria-results"
+
+# In-process LRU tier, keyed by (version id, version stamp, input digest).
+_results = OrderedDict()
+_generations = {}
+_stats = {"hits": 0, "shared_hits": 0, "misses": 0}
+_lock = threading.Lock()
+
+
+def _stamp(version_id: int, shared) -> str:
+    # With a shared tier, the stamp is stored next to the results, so an
+    # invalidation in one process is seen by all of them.
+    if shared is None:
+        return str(_generations.get(version_id, 0))
+    return shared_stamp(KEY_PREFIX, version_id, shared)
+
+
+def input_digest(inputs: dict) -> str:
+    """
+    Return a stable SHA-256 hash of a batch of input values.
+
+    The hash does not depend on the order of the aliases, and equal values
+    always hash the same whatever the array layout they come in.
+    """
+    digest = hashlib.sha256()
+    for alias in sorted(inputs):
+        column = np.ascontiguousarray(inputs[alias], dtype=np.float64)
+        digest.update(alias.encode())
+        digest.update(str(column.shape).encode())
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+
+def evaluate_cached(compiled: CompiledVersion, policy: CompiledPolicy | None, inputs: dict) -> tuple:
+    """
+    Evaluate and grade a batch of inputs, reusing the result of an identical
+    earlier batch of the same version.
+
+    Results are looked up in the in-process LRU tier first, then in the
+    shared tier when `CRITERIA_RESULT_CACHE_ALIAS` is set. Cached arrays are
+    shared between callers and must not be modified.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        policy (CompiledPolicy | None): The compiled ResultPolicy, if any.
+        inputs (dict): Mapping of input alias to an array of values.
+
+    Returns:
+        tuple: The values of every alias (as returned by `evaluate_batch`)
+            and the grading of the final result, or None without a policy.
+    """
+    version_id = compiled.version_id
+    shared = shared_cache()
+    key = (version_id, _stamp(version_id, shared), input_digest(inputs))
+
+    with _lock:
+        result = _results.get(key)
+        if result is not None:
+            _results.move_to_end(key)
+            _stats["hits"] += 1
+            return result
+
+    shared_key = ":".join([KEY_PREFIX, *map(str, key)])
+    result = shared.get(shared_key) if shared is not None else None
+    with _lock:
+        _stats["shared_hits" if result is not None else "misses"] += 1
+
+    if result is None:
+        values = evaluate_batch(compiled, inputs)
+        grading = None
+        if policy is not None and compiled.final_alias in values:
+            grading = policy.grade(
+                values[compiled.final_alias], compiled.bounds.get(compiled.final_alias)
+            )
+        result = (values, grading)
+        if shared is not None:
+            shared.set(shared_key, result)
+
+    size = getattr(settings, "CRITERIA_RESULT_CACHE_SIZE", DEFAULT_SIZE)
+    with _lock:
+        # Do not cache a result that was invalidated while it was computing.
+        if shared is not None or key[1] == str(_generations.get(version_id, 0)):
+            _results[key] = result
+            while len(_results) > size:
+                _results.popitem(last=False)
+    return result
+
+
+def invalidate_results(version_id: int) -> None:
+    """
+    Drop every cached result of a criteria version, in every tier.
+    """
+    with _lock:
+        _generations[version_id] = _generations.get(version_id, 0) + 1
+        for key in [key for key in _results if key[0] == version_id]:
+            del _results[key]
+
+    renew_shared_stamp(KEY_PREFIX, version_id)
+
+
+def result_cache_stats() -> dict:
+    """
+    Return the hit and miss counters of this process, and the number of
+    results held in its LRU tier.
+    """
+    with _lock:
+        return {**_stats, "size": len(_results)}
+
+
+def clear_result_cache() -> None:
+    """
+    Empty the in-process tier and reset its counters.
+    """
+    with _lock:
+        _results.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,190 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+from django.db import transaction
+
+from users.models import Employee
+from ..models import (
+    EvaluationInput,
+    EvaluationResult,
+)
+from .expression_service import (
+    compile_criteria,
+    get_compiled_version,
+    load_criteria_definition,
+)
+from .grading_service import (
+    compile_policy,
+    load_policy_definition,
+)
+from .evaluation_service import (
+    evaluate_batch,
+    to_json_list,
+    valid_input_rows,
+)
+
+# Compiled program and policy of the version, loaded once per worker process.
+_worker_state = {}
+
+
+def _init_worker(version_id, rows, edges, dialect, policy):
+    _worker_state["compiled"] = compile_criteria(version_id, rows, edges, dialect)
+    _worker_state["policy"] = compile_policy(**policy) if policy is not None else None
+
+
+def _evaluate_chunk(employee_ids, matrix):
+    """
+    Evaluate one chunk of employees inside a worker process.
+
+    Args:
+        employee_ids (np.ndarray): Employee id of every row of the matrix.
+        matrix (np.ndarray): Input values, one column per input alias of the
+            compiled version and NaN where a value is missing.
+
+    Returns:
+        tuple: The employee ids of the chunk, the mask of the evaluated ones,
+            a mapping of every alias to its values and the grading arrays (or
+            None) of the evaluated employees.
+    """
+    compiled = _worker_state["compiled"]
+    policy = _worker_state["policy"]
+
+    inputs = {
+        alias: matrix[:, index] for index, alias in enumerate(compiled.input_aliases)
+    }
+    valid = valid_input_rows(compiled, inputs)
+    values = evaluate_batch(
+        compiled, {alias: column[valid] for alias, column in inputs.items()}
+    )
+    grading = None
+    if policy is not None and compiled.final_alias in values:
+        grading = policy.grade(
+            values[compiled.final_alias], compiled.bounds.get(compiled.final_alias)
+        )
+    return employee_ids, valid, values, grading
+
+
+def _load_chunk(version_id, input_aliases, employee_ids):
+    columns = {alias: index for index, alias in enumerate(input_aliases)}
+    rows = {employee_id: index for index, employee_id in enumerate(employee_ids)}
+    matrix = np.full((len(employee_ids), len(input_aliases)), np.nan)
+
+    for employee_id, alias, value in EvaluationInput.objects.filter(
+        version_id=version_id,
+        employee_id__in=employee_ids,
+        alias__in=input_aliases,
+    ).values_list("employee_id", "alias", "value"):
+        matrix[rows[employee_id], columns[alias]] = value
+    return np.asarray(employee_ids), matrix
+
+
+@transaction.atomic
+def _write_chunk(version_id, final_alias, employee_ids, valid, values, grading):
+    columns = {alias: to_json_list(column) for alias, column in values.items()}
+    final_results = columns.get(final_alias)
+
+    # The results of skipped employees are removed too, so none is left
+    # from an earlier run with inputs that are missing now.
+    EvaluationResult.objects.filter(
+        version_id=version_id, employee_id__in=employee_ids.tolist()
+    ).delete()
+    EvaluationResult.objects.bulk_create([
+        EvaluationResult(
+            version_id=version_id,
+            employee_id=employee_id,
+            values={alias: column[index] for alias, column in columns.items()},
+            final_result=final_results[index] if final_results else None,
+            grade=grading["grades"][index] if grading else None,
+            needs_action=bool(grading["needs_action"][index]) if grading else False,
+            needs_explanation=bool(grading["needs_explanation"][index]) if grading else False,
+        )
+        for index, employee_id in enumerate(employee_ids[valid].tolist())
+    ])
+
+
+def _employee_chunks(chunk_size) -> list:
+    employee_ids = list(
+        Employee.objects.filter(is_active=True).order_by("id").values_list("id", flat=True)
+    )
+    return [
+        employee_ids[start:start + chunk_size]
+        for start in range(0, len(employee_ids), chunk_size)
+    ]
+
+
+def run_evaluation(version_id: int, chunk_size: int = 500, workers: int | None = None) -> dict:
+    """
+    Evaluate every active employee against a criteria version in parallel.
+
+    Employees are split into chunks that are scored by a pool of worker
+    processes, each of which compiles the version once. At most two chunks
+    per worker are in flight, and results are written back chunk by chunk,
+    so the memory of the parent process stays bounded.
+
+    Args:
+        version_id (int): The CriteriaVersion primary key.
+        chunk_size (int): Number of employees per chunk.
+        workers (int | None): Number of worker processes. Defaults to the
+            number of CPU cores. With 1, chunks are evaluated in-process.
+
+    Returns:
+        dict: The number of evaluated and skipped employees, the elapsed
+            seconds and the throughput in employees per second.
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+
+    # Fails fast, before any worker starts, if the version does not compile.
+    compiled = get_compiled_version(version_id)
+    rows, edges, dialect = load_criteria_definition(version_id)
+    policy = load_policy_definition(version_id)
+    initargs = (version_id, rows, edges, dialect, policy)
+
+    evaluated = 0
+    skipped = 0
+
+    def collect(result):
+        nonlocal evaluated, skipped
+        employee_ids, valid, values, grading = result
+        _write_chunk(version_id, compiled.final_alias, employee_ids, valid, values, grading)
+        evaluated += int(valid.sum())
+        skipped += int((~valid).sum())
+
+    if workers == 1:
+        _init_worker(*initargs)
+        for chunk in _employee_chunks(chunk_size):
+            collect(_evaluate_chunk(*_load_chunk(version_id, compiled.input_aliases, chunk)))
+    else:
+        chunks = _employee_chunks(chunk_size)
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods() else None
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=initargs,
+        ) as executor:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(
+                    _evaluate_chunk, *_load_chunk(version_id, compiled.input_aliases, chunk)
+                ))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+            for future in pending:
+                collect(future.result())
+
+    seconds = time.perf_counter() - started
+    return {
+        "employees": evaluated,
+        "skipped": skipped,
+        "seconds": round(seconds, 3),
+        "employees_per_second": round(evaluated / seconds, 1) if seconds else None,
+    }
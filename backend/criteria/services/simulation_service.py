@@ -0,0 +1,123 @@
+import math
+
+import numpy as np
+from rest_framework.exceptions import ValidationError
+
+from ..constants import (
+    EvaluationMessage,
+    SimulationMessage,
+)
+from .evaluation_service import evaluate_batch
+from .expression_service import CompiledVersion
+from .grading_service import CompiledPolicy
+
+MAX_SCENARIOS = 100_000
+
+
+def sweep_size(sweep: dict) -> int:
+    """
+    Return the number of points of one swept alias, without building them.
+    """
+    if "values" in sweep:
+        return len(sweep["values"])
+    return sweep["steps"]
+
+
+def sweep_values(sweep: dict) -> np.ndarray:
+    """
+    Return the points of one swept alias, either listed or evenly spaced
+    from `start` to `stop` (both included).
+    """
+    if "values" in sweep:
+        return np.asarray(sweep["values"], dtype=np.float64)
+    return np.linspace(sweep["start"], sweep["stop"], sweep["steps"])
+
+
+def build_scenarios(compiled: CompiledVersion, base: dict, overrides=None, sweep=None) -> tuple:
+    """
+    Expand a base input vector into one column per input alias, with one
+    row per scenario.
+
+    Each override is one scenario. A sweep gives every combination of the
+    points of its aliases.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        base (dict): Value of every input alias shared by all scenarios.
+        overrides (list[dict] | None): Input values changed in each scenario.
+        sweep (list[dict] | None): The aliases to sweep and their points.
+
+    Returns:
+        tuple: The mapping of input alias to a float64 array of one value per
+            scenario, and the mapping of every varied alias to its column.
+
+    Raises:
+        ValidationError: If an alias is not an input of the version or there
+            are too many scenarios.
+    """
+    if overrides is not None:
+        varied = sorted({alias for override in overrides for alias in override})
+        size = len(overrides)
+    else:
+        varied = [item["alias"] for item in sweep]
+        size = math.prod(sweep_size(item) for item in sweep)
+
+    unknown = [alias for alias in varied if alias not in compiled.input_bounds]
+    if unknown:
+        raise ValidationError({alias: [EvaluationMessage.UNKNOWN_INPUT] for alias in unknown})
+    if size > MAX_SCENARIOS:
+        raise ValidationError(f"{SimulationMessage.TOO_MANY_SCENARIOS} {MAX_SCENARIOS}")
+
+    inputs = {
+        alias: np.full(size, value, dtype=np.float64) for alias, value in base.items()
+    }
+    if overrides is not None:
+        for alias in varied:
+            column = inputs.get(alias, np.full(size, np.nan))
+            for index, override in enumerate(overrides):
+                if alias in override:
+                    column[index] = override[alias]
+            inputs[alias] = column
+    else:
+        points = [sweep_values(item) for item in sweep]
+        grid = np.meshgrid(*points, indexing="ij")
+        for alias, column in zip(varied, grid):
+            inputs[alias] = column.ravel()
+
+    return inputs, {alias: inputs[alias] for alias in varied}
+
+
+def simulate(compiled: CompiledVersion, policy: CompiledPolicy | None, base: dict, overrides=None, sweep=None) -> dict:
+    """
+    Evaluate every scenario of a what-if simulation in one vectorized pass.
+
+    Args:
+        compiled (CompiledVersion): The compiled criteria version.
+        policy (CompiledPolicy | None): The compiled ResultPolicy, if any.
+        base (dict): Value of every input alias shared by all scenarios.
+        overrides (list[dict] | None): Input values changed in each scenario.
+        sweep (list[dict] | None): The aliases to sweep and their points.
+
+    Returns:
+        dict: The varied inputs, the final result and, when the version has
+            a ResultPolicy, the grading of every scenario.
+
+    Raises:
+        ValidationError: If the scenarios are invalid or the version has no
+            final result criteria.
+    """
+    if compiled.final_alias is None:
+        raise ValidationError(EvaluationMessage.NO_FINAL_RESULT)
+
+    inputs, varied = build_scenarios(compiled, base, overrides, sweep)
+    final_result = evaluate_batch(compiled, inputs)[compiled.final_alias]
+
+    simulation = {
+        "inputs": varied,
+        "final_result": final_result,
+    }
+    if policy is not None:
+        simulation.update(
+            policy.grade(final_result, compiled.bounds.get(compiled.final_alias))
+        )
+    return simulation
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import threading
+from functools import partial
+
+from django.db import transaction
+
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    CriteriaVersionSnapshot,
+    InputType,
+    ResultPolicy,
+    VariableRelationship,
+)
+
+CRITERIA_FIELDS = (
+    "alias",
+    "name",
+    "parent_alias",
+    "description",
+    "is_input",
+    "input_type_id",
+    "expression",
+    "is_final_result",
+)
+
+
+def build_snapshot_content(version: CriteriaVersion) -> dict:
+    """
+    Collect everything needed to evaluate a version into one plain dict.
+    """
+    criteria = list(
+        Criteria.objects.filter(version=version).order_by("id").values(*CRITERIA_FIELDS)
+    )
+    input_type_ids = {row["input_type_id"] for row in criteria} - {None}
+    return {
+        "version": {
+            "id": version.id,
+            "version_name": version.version_name,
+            "role_name": version.role_name,
+            "expression_dialect": version.expression_dialect,
+        },
+        "criteria": criteria,
+        "input_types": list(
+            InputType.objects.filter(id__in=input_type_ids).order_by("id").values(
+                "id", "name", "min", "max"
+            )
+        ),
+        "relationships": [
+            list(edge) for edge in VariableRelationship.objects.filter(
+                version=version
+            ).order_by("id").values_list("from_alias", "to_alias")
+        ],
+        "result_policy": ResultPolicy.objects.filter(version=version).values(
+            "grading_rule", "action_grades", "explanation_grades"
+        ).first(),
+    }
+
+
+def freeze_version(version: CriteriaVersion) -> CriteriaVersionSnapshot:
+    """
+    Store the immutable snapshot of a version, unless it already has one.
+
+    The content is compact JSON with sorted keys, so the same definition
+    always gives the same SHA-256 content hash.
+
+    Args:
+        version (CriteriaVersion): The version being promoted to Official.
+
+    Returns:
+        CriteriaVersionSnapshot: The stored snapshot.
+    """
+    content = json.dumps(
+        build_snapshot_content(version), sort_keys=True, separators=(",", ":")
+    )
+    snapshot, _ = CriteriaVersionSnapshot.objects.get_or_create(
+        version=version,
+        defaults={
+            "content": content,
+            "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+        },
+    )
+    return snapshot
+
+
+# Snapshots never change once written, so they stay cached for the life of
+# the process.
+_snapshots = {}
+_lock = threading.Lock()
+
+
+def load_snapshot(version_id: int) -> dict | None:
+    """
+    Return the snapshot content of a version with a single read, or None if
+    the version has not been frozen.
+    """
+    if version_id in _snapshots:
+        return _snapshots[version_id]
+
+    content = CriteriaVersionSnapshot.objects.filter(version_id=version_id).values_list(
+        "content", flat=True
+    ).first()
+    if content is None:
+        return None
+
+    snapshot = json.loads(content)
+    # Only cache the snapshot once the transaction that read it commits: a
+    # promotion that rolls back would otherwise leave a cached snapshot that
+    # does not exist in the database.
+    transaction.on_commit(partial(_remember_snapshot, version_id, snapshot))
+    return snapshot
+
+
+def load_snapshots(version_ids) -> dict:
+    """
+    Return the snapshot content of several versions, reading the ones not
+    cached yet with a single query. Versions that have not been frozen are
+    left out.
+    """
+    snapshots = {
+        version_id: _snapshots[version_id]
+        for version_id in version_ids if version_id in _snapshots
+    }
+    missing = [version_id for version_id in version_ids if version_id not in snapshots]
+    if not missing:
+        return snapshots
+
+    for version_id, content in CriteriaVersionSnapshot.objects.filter(
+        version_id__in=missing
+    ).values_list("version_id", "content"):
+        snapshots[version_id] = json.loads(content)
+        transaction.on_commit(partial(_remember_snapshot, version_id, snapshots[version_id]))
+    return snapshots
+
+
+def _remember_snapshot(version_id: int, snapshot: dict) -> None:
+    with _lock:
+        _snapshots[version_id] = snapshot
+
+
+def forget_snapshot(version_id: int) -> None:
+    """
+    Drop the cached snapshot of a deleted version.
+    """
+    with _lock:
+        _snapshots.pop(version_id, None)
+
+
+def snapshot_criteria(snapshot: dict) -> list:
+    """
+    Return the criteria rows of a snapshot, each with the `input_type__name`,
+    `input_type__min` and `input_type__max` of its input type, like the
+    values of a Criteria query.
+    """
+    input_types = {input_type["id"]: input_type for input_type in snapshot["input_types"]}
+    rows = []
+    for row in snapshot["criteria"]:
+        input_type = input_types.get(row["input_type_id"], {})
+        rows.append({
+            **row,
+            "input_type__name": input_type.get("name"),
+            "input_type__min": input_type.get("min"),
+            "input_type__max": input_type.get("max"),
+        })
+    return rows
+
+
+def criteria_definition(snapshot: dict) -> tuple:
+    """
+    Return the `(rows, edges, dialect)` of a snapshot in the shape used by
+    `compile_criteria`.
+    """
+    return (
+        snapshot_criteria(snapshot),
+        [tuple(edge) for edge in snapshot["relationships"]],
+        snapshot["version"]["expression_dialect"],
+    )
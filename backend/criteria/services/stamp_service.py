@@ -0,0 +1,50 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def shared_cache():
+    """
+    Return the Django cache shared by every process, named by
+    `CRITERIA_RESULT_CACHE_ALIAS`, or None when caches are per process only.
+    """
+    alias = getattr(settings, "CRITERIA_RESULT_CACHE_ALIAS", None)
+    return caches[alias] if alias else None
+
+
+def shared_stamp(prefix: str, version_id: int, shared=None) -> str | None:
+    """
+    Return the stamp of a cached criteria version in the shared cache.
+
+    The stamp changes whenever any process renews it, so a process can tell
+    that an entry it cached locally was invalidated elsewhere.
+
+    Args:
+        prefix (str): Key prefix of the cache the stamp belongs to.
+        version_id (int): The CriteriaVersion primary key.
+        shared: The shared cache, looked up from the settings when omitted.
+
+    Returns:
+        str | None: The stamp, or None without a shared cache.
+    """
+    shared = shared if shared is not None else shared_cache()
+    if shared is None:
+        return None
+
+    key = f"{prefix}:{version_id}:stamp"
+    stamp = shared.get(key)
+    if stamp is None:
+        shared.add(key, uuid.uuid4().hex, timeout=None)
+        stamp = shared.get(key)
+    return stamp
+
+
+def renew_shared_stamp(prefix: str, version_id: int) -> None:
+    """
+    Give a cached criteria version a new stamp, which invalidates the
+    entries cached for it in every process.
+    """
+    shared = shared_cache()
+    if shared is not None:
+        shared.set(f"{prefix}:{version_id}:stamp", uuid.uuid4().hex, timeout=None)
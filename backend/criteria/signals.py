@@ -0,0 +1,154 @@
+from django.contrib.auth.models import Group, Permission
+from django.core.signals import request_finished, request_started
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver
+from rest_framework.exceptions import ValidationError
+from .models import (
+    Criteria,
+    CriteriaVersion,
+    CriteriaVersionStateEnum,
+    InputType,
+    ResultPolicy,
+    VariableRelationship,
+)
+from users.models import (
+    CustomUser,
+    CustomUserPermission,
+    Employee,
+)
+from .utils import (
+    begin_permission_snapshots,
+    end_permission_snapshots,
+    invalidate_permission_snapshots,
+)
+from .services.expression_service import (
+    compile_criteria,
+    get_compiled_version,
+    invalidate_compiled_version,
+    load_criteria_definition,
+)
+from .services.grading_service import (
+    invalidate_compiled_policy,
+)
+from .services.result_cache_service import (
+    invalidate_results,
+)
+from .services.snapshot_service import (
+    forget_snapshot,
+    freeze_version,
+)
+
+@receiver([post_save, post_delete], sender=Criteria)
+@receiver([post_save, post_delete], sender=VariableRelationship)
+def invalidate_version_on_criteria_change(sender, instance, **kwargs):
+    invalidate_compiled_version(instance.version_id)
+    invalidate_results(instance.version_id)
+
+@receiver([post_save, post_delete], sender=ResultPolicy)
+def invalidate_policy_on_change(sender, instance, **kwargs):
+    invalidate_compiled_policy(instance.version_id)
+    invalidate_results(instance.version_id)
+
+def _input_type_version_ids(input_type):
+    return set(
+        Criteria.objects.filter(input_type=input_type).values_list("version_id", flat=True)
+    )
+
+@receiver(pre_delete, sender=InputType)
+def remember_input_type_versions(sender, instance, **kwargs):
+    # The criteria lose their input type before post_delete is sent.
+    instance._version_ids = _input_type_version_ids(instance)
+
+@receiver([post_save, post_delete], sender=InputType)
+def invalidate_versions_on_input_type_change(sender, instance, **kwargs):
+    # Compiled programs hold the bounds of their input types.
+    version_ids = getattr(instance, "_version_ids", None)
+    if version_ids is None:
+        version_ids = _input_type_version_ids(instance)
+    for version_id in version_ids:
+        invalidate_compiled_version(version_id)
+        invalidate_results(version_id)
+
+@receiver(pre_save, sender=CriteriaVersion)
+def remember_previous_state(sender, instance, **kwargs):
+    # Only read the stored state when the version is saved as Official.
+    instance._previous_state = None
+    if instance.pk is not None and instance.state == CriteriaVersionStateEnum.OFFICIAL:
+        instance._previous_state = CriteriaVersion.objects.filter(
+            pk=instance.pk
+        ).values_list("state", flat=True).first()
+
+def _warm_compiled_version(version_id):
+    try:
+        get_compiled_version(version_id)
+    except ValidationError:
+        pass
+
+@receiver(post_save, sender=CriteriaVersion)
+def freeze_official_version(sender, instance, created, **kwargs):
+    # Official versions are read-only: they are frozen into a snapshot when
+    # they are promoted, and their program and dependency index are built as
+    # soon as the promotion commits.
+    official = instance.state == CriteriaVersionStateEnum.OFFICIAL
+    if official and getattr(instance, "_previous_state", None) == CriteriaVersionStateEnum.OFFICIAL:
+        return
+
+    # The expression dialect of a draft version may have changed.
+    invalidate_compiled_version(instance.pk)
+    invalidate_results(instance.pk)
+    # A version created as Official has no criteria yet, so there is nothing
+    # to freeze.
+    if created or not official:
+        return
+
+    try:
+        compile_criteria(instance.pk, *load_criteria_definition(instance.pk))
+    except ValidationError:
+        # Only versions that compile are frozen.
+        return
+    freeze_version(instance)
+    transaction.on_commit(lambda: _warm_compiled_version(instance.pk))
+
+@receiver(post_delete, sender=CriteriaVersion)
+def invalidate_version_on_delete(sender, instance, **kwargs):
+    invalidate_compiled_version(instance.pk)
+    invalidate_compiled_policy(instance.pk)
+    invalidate_results(instance.pk)
+    forget_snapshot(instance.pk)
+
+# check_permission snapshots live for the duration of one request.
+request_started.connect(begin_permission_snapshots, dispatch_uid="begin_permission_snapshots")
+request_finished.connect(end_permission_snapshots, dispatch_uid="end_permission_snapshots")
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_permissions_on_user_change(sender, instance, **kwargs):
+    invalidate_permission_snapshots([instance.pk])
+
+@receiver([post_save, post_delete], sender=Employee)
+def invalidate_permissions_on_employee_change(sender, instance, **kwargs):
+    invalidate_permission_snapshots([instance.user_id])
+
+@receiver([post_save, post_delete], sender=CustomUserPermission)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def invalidate_permissions_on_access_level_change(sender, instance, **kwargs):
+    # Shared by many users, and rarely changed: drop every snapshot.
+    invalidate_permission_snapshots()
+
+@receiver(m2m_changed, sender=CustomUser.groups.through)
+def invalidate_permissions_on_group_membership_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_permission_snapshots([instance.pk])
+    elif pk_set is not None:
+        invalidate_permission_snapshots(pk_set)
+    else:
+        invalidate_permission_snapshots()
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permissions_on_group_permission_change(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_permission_snapshots()
+
@@ -0,0 +1,36 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from ..management.commands.benchmark_indexes import Command
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    VariableRelationship,
+)
+
+class CriteriaIndexesTest(TestCase):
+
+    def test_alias_is_unique_per_version(self):
+        first = CriteriaVersion.objects.create(version_name="2025")
+        second = CriteriaVersion.objects.create(version_name="2026")
+        Criteria.objects.create(version=first, alias="KPI1")
+        Criteria.objects.create(version=second, alias="KPI1")
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Criteria.objects.create(version=first, alias="KPI1")
+
+    def test_benchmark_seeds_every_access_pattern(self):
+        command = Command()
+        version = command.seed(versions=4, criteria=20)
+
+        self.assertEqual(Criteria.objects.filter(version=version).count(), 20)
+        self.assertEqual(VariableRelationship.objects.filter(version=version).count(), 19)
+        for label, queryset in command.queries(version, 20):
+            self.assertTrue(queryset.exists(), label)
+
+    def test_benchmark_needs_postgresql(self):
+        if connection.vendor == "postgresql":
+            self.skipTest("Runs the benchmark on PostgreSQL")
+        with self.assertRaises(CommandError):
+            call_command("benchmark_indexes")
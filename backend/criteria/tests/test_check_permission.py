@@ -0,0 +1,112 @@
+from django.contrib.auth.models import Group, Permission as AuthPermission
+from django.core.exceptions import PermissionDenied
+from django.test import TestCase, override_settings
+from users.models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+from ..utils import (
+    begin_permission_snapshots,
+    check_permission,
+    end_permission_snapshots,
+    invalidate_permission_snapshots,
+)
+
+class CheckPermissionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="member", password="@Abcde12345")
+        Employee.objects.create(
+            user=self.user,
+            team=Team.objects.create(name="Apple"),
+            access_level=Permission.objects.create(access_level="PM", can_export=True),
+        )
+        self.staff = User.objects.create_user(
+            username="staff", password="@Abcde12345", is_staff=True
+        )
+        begin_permission_snapshots()
+        self.addCleanup(end_permission_snapshots)
+        self.addCleanup(invalidate_permission_snapshots)
+
+    def test_employee_permissions_are_loaded_once_per_request(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(check_permission(self.user, "can_export", "criteria"))
+            self.assertFalse(check_permission(self.user, "can_write_eval_data", "criteria"))
+            self.assertTrue(check_permission(self.user, "can_read_eval_data", "evaluation"))
+
+        with self.assertRaises(PermissionDenied):
+            check_permission(self.user, "can_fly", "criteria")
+
+    def next_request(self):
+        end_permission_snapshots()
+        begin_permission_snapshots()
+
+    def test_snapshot_is_shared_between_requests(self):
+        check_permission(self.user, "can_export", "criteria")
+        self.next_request()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(check_permission(self.user, "can_export", "criteria"))
+
+    def test_snapshot_is_invalidated_by_signals(self):
+        check_permission(self.user, "can_export", "criteria")
+        self.next_request()
+        access_level = Permission.objects.get()
+        access_level.can_export = False
+        access_level.save()
+
+        self.assertFalse(check_permission(self.user, "can_export", "criteria"))
+
+        self.next_request()
+        Employee.objects.update(is_active=False)
+        self.assertFalse(check_permission(self.user, "can_export", "criteria"))
+        Employee.objects.get().save()
+        self.next_request()
+        with self.assertRaises(PermissionDenied):
+            check_permission(self.user, "can_export", "criteria")
+
+    @override_settings(PERMISSION_CACHE_TTL=0)
+    def test_snapshot_expires(self):
+        check_permission(self.user, "can_export", "criteria")
+        self.next_request()
+        Permission.objects.update(can_export=False)
+
+        self.assertFalse(check_permission(self.user, "can_export", "criteria"))
+
+    def test_staff_group_permissions(self):
+        with self.assertRaises(PermissionDenied):
+            check_permission(self.staff, "can_export", "criteria")
+
+        self.next_request()
+        group = Group.objects.create(name="Reviewers")
+        group.permissions.add(AuthPermission.objects.get(codename="view_criteria"))
+        Group.objects.create(name="Empty").user_set.add(self.staff)
+        group.user_set.add(self.staff)
+
+        with self.assertNumQueries(2):
+            self.assertTrue(check_permission(self.staff, "can_export", "criteria"))
+            self.assertFalse(check_permission(self.staff, "can_export", "team"))
+        # A username is looked up, then the snapshot of the request is reused.
+        with self.assertNumQueries(1):
+            self.assertFalse(check_permission("staff", "can_export", "team"))
+
+    def test_unknown_user(self):
+        with self.assertRaises(PermissionDenied):
+            check_permission("nobody", "can_export", "criteria")
+
+    def test_group_permission_changes_are_seen(self):
+        group = Group.objects.create(name="Reviewers")
+        group.user_set.add(self.staff)
+        self.assertFalse(check_permission(self.staff, "can_export", "criteria"))
+
+        self.next_request()
+        group.permissions.add(AuthPermission.objects.get(codename="view_criteria"))
+        self.assertTrue(check_permission(self.staff, "can_export", "criteria"))
+
+        self.next_request()
+        self.staff.groups.clear()
+        with self.assertRaises(PermissionDenied):
+            check_permission(self.staff, "can_export", "criteria")
+
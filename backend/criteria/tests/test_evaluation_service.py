@@ -0,0 +1,135 @@
+import numpy as np
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+from users.models import CustomUser as User
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    InputType,
+)
+from ..services.expression_service import get_compiled_version
+from ..services.evaluation_service import (
+    evaluate_batch,
+    evaluate_incremental,
+    inputs_from_matrix,
+)
+
+class EvaluationTestCase(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        Criteria.objects.create(
+            version=self.version, alias="KPI1", is_input=True, input_type=percent
+        )
+        Criteria.objects.create(
+            version=self.version, alias="KPI2", is_input=True, input_type=percent
+        )
+        Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="AVG + 1", is_final_result=True
+        )
+        Criteria.objects.create(
+            version=self.version, alias="AVG", expression="(KPI1 + KPI2) / 2"
+        )
+
+
+class EvaluateBatchTest(EvaluationTestCase):
+
+    def test_evaluate_whole_batch(self):
+        compiled = get_compiled_version(self.version.id)
+        inputs = inputs_from_matrix(["KPI1", "KPI2"], [[10, 20], [50, 70], [0, 0]])
+
+        values = evaluate_batch(compiled, inputs)
+
+        np.testing.assert_allclose(values["AVG"], [15, 60, 0])
+        np.testing.assert_allclose(values["FINAL"], [16, 61, 1])
+
+    def test_out_of_range_inputs_are_reported(self):
+        compiled = get_compiled_version(self.version.id)
+        inputs = inputs_from_matrix(["KPI1", "KPI2"], [[10, 120], [-5, 70]])
+
+        with self.assertRaises(ValidationError) as context:
+            evaluate_batch(compiled, inputs)
+
+        self.assertTrue(context.exception.detail["KPI1"][0].endswith("rows 1"))
+        self.assertTrue(context.exception.detail["KPI2"][0].endswith("rows 0"))
+
+
+class EvaluateIncrementalTest(EvaluationTestCase):
+
+    def setUp(self):
+        super().setUp()
+        Criteria.objects.create(version=self.version, alias="BONUS", expression="KPI2 * 2")
+        self.compiled = get_compiled_version(self.version.id)
+        self.values = {"KPI1": 10.0, "KPI2": 20.0, "AVG": 15.0, "FINAL": 16.0, "BONUS": 40.0}
+
+    def test_only_downstream_criteria_are_returned(self):
+        changed = evaluate_incremental(self.compiled, self.values, {"KPI1": 30})
+
+        self.assertEqual(changed, {"AVG": 25.0, "FINAL": 26.0})
+
+    def test_unchanged_value_stops_propagation(self):
+        changed = evaluate_incremental(self.compiled, self.values, {"KPI2": 20})
+
+        self.assertEqual(changed, {})
+
+    def test_division_by_zero_gives_infinity(self):
+        Criteria.objects.create(version=self.version, alias="RATIO", expression="KPI2 / KPI1")
+        compiled = get_compiled_version(self.version.id)
+
+        changed = evaluate_incremental(compiled, {**self.values, "RATIO": 2.0}, {"KPI1": 0})
+
+        self.assertEqual(changed["RATIO"], float("inf"))
+        self.assertEqual(changed["AVG"], 10.0)
+
+
+class EvaluationViewTest(EvaluationTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("evaluation", kwargs={"version_name": "2025"})
+
+    def test_batch_evaluation(self):
+        response = self.client.post(self.url, {
+            "columns": ["KPI1", "KPI2"],
+            "rows": [[10, 20], [50, 70]],
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["final_result"], [16, 61])
+
+    def test_missing_input_column(self):
+        response = self.client.post(self.url, {
+            "columns": ["KPI1"],
+            "rows": [[10]],
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_incremental_evaluation(self):
+        response = self.client.patch(self.url, {
+            "values": {"KPI1": 10, "KPI2": 20, "AVG": 15, "FINAL": 16},
+            "changes": {"KPI2": 40},
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["changed"], {"AVG": 25, "FINAL": 26})
+
+    def test_incremental_division_by_zero(self):
+        Criteria.objects.create(version=self.version, alias="RATIO", expression="KPI2 / KPI1")
+
+        response = self.client.patch(self.url, {
+            "values": {"KPI1": 10, "KPI2": 20, "AVG": 15, "FINAL": 16, "RATIO": 2},
+            "changes": {"KPI1": 0},
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["data"]["changed"], {"AVG": 10, "FINAL": 11, "RATIO": None}
+        )
@@ -0,0 +1,121 @@
+import math
+
+import numpy as np
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+from ..models import (
+    Criteria,
+    CriteriaExpressionDialectEnum,
+    CriteriaVersion,
+)
+from ..services.evaluation_service import evaluate_batch
+from ..services.expression_service import (
+    compile_criteria,
+    get_compiled_version,
+)
+
+EXCEL = CriteriaExpressionDialectEnum.EXCEL
+
+class ExcelDialectTest(TestCase):
+
+    def rows(self, *criteria):
+        return [
+            {
+                "alias": alias,
+                "is_input": expression is None,
+                "expression": expression,
+                "is_final_result": alias == "FINAL",
+            }
+            for alias, expression in criteria
+        ]
+
+    def test_formulas_run_on_arrays(self):
+        compiled = compile_criteria(1, self.rows(
+            ("KPI1", None),
+            ("KPI2", None),
+            ("TOTAL", "=SUM(KPI1, KPI2)"),
+            ("FINAL", "=IF(Total > 100, ROUND(MIN(kpi1, KPI2) / 3, 1), 0)"),
+        ), dialect=EXCEL)
+
+        values = evaluate_batch(compiled, {
+            "KPI1": [10.0, 80.0, 90.0],
+            "KPI2": [20.0, 40.0, 100.0],
+        })
+
+        self.assertEqual(compiled.expressions["FINAL"].dependencies, {"KPI1", "KPI2", "TOTAL"})
+        self.assertEqual(values["TOTAL"].tolist(), [30.0, 120.0, 190.0])
+        self.assertEqual(values["FINAL"].tolist(), [0.0, 13.3, 30.0])
+        self.assertEqual(compiled.expressions["FINAL"].evaluate(
+            {"KPI1": 90.0, "KPI2": 100.0, "TOTAL": 190.0}
+        ), 30.0)
+
+    def test_reducing_functions_run_across_arguments(self):
+        compiled = compile_criteria(1, self.rows(
+            ("KPI1", None),
+            ("KPI2", None),
+            ("LOW", "=MIN(KPI1, KPI2 * 2, 30)"),
+            ("FINAL", "=AVERAGE(KPI1, KPI2) + PRODUCT(KPI1, 2) + MAX(KPI1, 0)"),
+        ), dialect=EXCEL)
+
+        values = evaluate_batch(compiled, {
+            "KPI1": [10.0, 80.0, 90.0],
+            "KPI2": [20.0, 10.0, 100.0],
+        })
+
+        self.assertTrue(compiled.expressions["LOW"].vectorized)
+        self.assertTrue(compiled.expressions["FINAL"].vectorized)
+        self.assertEqual(values["LOW"].tolist(), [10.0, 20.0, 30.0])
+        self.assertEqual(values["FINAL"].tolist(), [45.0, 285.0, 365.0])
+
+    def test_aggregates_run_once_per_employee(self):
+        compiled = compile_criteria(1, self.rows(
+            ("KPI1", None),
+            ("KPI2", None),
+            ("MEAN", "=GEOMEAN(KPI1, KPI2)"),
+            ("FINAL", "=STDEV.S(KPI1, KPI2)"),
+        ), dialect=EXCEL)
+
+        values = evaluate_batch(compiled, {
+            "KPI1": [10.0, 2.0, 5.0],
+            "KPI2": [40.0, 8.0, 5.0],
+        })
+
+        self.assertFalse(compiled.expressions["MEAN"].vectorized)
+        np.testing.assert_allclose(values["MEAN"], [20.0, 4.0, 5.0])
+        np.testing.assert_allclose(values["FINAL"], [15 * math.sqrt(2), 3 * math.sqrt(2), 0.0])
+
+    def test_excel_errors_become_nan(self):
+        compiled = compile_criteria(1, self.rows(
+            ("KPI1", None),
+            ("FINAL", "100 / KPI1"),
+        ), dialect=EXCEL)
+
+        values = evaluate_batch(compiled, {"KPI1": [0.0, 4.0]})
+
+        self.assertTrue(math.isnan(values["FINAL"][0]))
+        self.assertEqual(values["FINAL"][1], 25.0)
+
+    def test_errors_are_reported_together(self):
+        with self.assertRaises(ValidationError) as context:
+            compile_criteria(1, self.rows(
+                ("KPI1", None),
+                ("A", "=IF(KPI1 > 1,"),
+                ("B", "=FOOBAR(KPI1)"),
+                ("C", "=KPI1 + MISSING"),
+            ), dialect=EXCEL)
+
+        self.assertEqual(set(context.exception.detail), {"A", "B", "C"})
+
+    def test_version_dialect_is_used_when_compiling(self):
+        version = CriteriaVersion.objects.create(version_name="2025", expression_dialect=EXCEL)
+        Criteria.objects.create(version=version, alias="KPI1", is_input=True)
+        Criteria.objects.create(
+            version=version, alias="FINAL", expression="=MAX(KPI1, 50)", is_final_result=True
+        )
+
+        compiled = get_compiled_version(version.id)
+
+        self.assertEqual(
+            evaluate_batch(compiled, {"KPI1": np.array([10.0, 70.0])})["FINAL"].tolist(),
+            [50.0, 70.0],
+        )
@@ -0,0 +1,88 @@
+from io import BytesIO
+from openpyxl import load_workbook
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    EvaluationResult,
+)
+from ..services.snapshot_service import forget_snapshot
+
+class ExportViewTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        Criteria.objects.create(version=self.version, alias="KPI1", is_input=True)
+        Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="KPI1 * 2", is_final_result=True
+        )
+        self.user = User.objects.create_user(username="OnDQ", password="@Abcde12345")
+        self.permission = Permission.objects.create(access_level="PM", can_export=True)
+        self.employee = Employee.objects.create(
+            user=self.user,
+            team=Team.objects.create(name="Apple"),
+            access_level=self.permission,
+        )
+        EvaluationResult.objects.create(
+            version=self.version,
+            employee=self.employee,
+            values={"KPI1": 10, "FINAL": 20},
+            final_result=20,
+            grade="A",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_export_criteria_csv(self):
+        response = self.client.get(
+            reverse("export-criteria", kwargs={"version_name": "2025"})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[2].startswith("FINAL,"))
+
+    def test_export_official_criteria_from_snapshot(self):
+        self.addCleanup(forget_snapshot, self.version.id)
+        self.version.state = "Official"
+        self.version.save()
+        Criteria.objects.filter(version=self.version, alias="FINAL").update(expression="KPI1 * 5")
+
+        response = self.client.get(
+            reverse("export-criteria", kwargs={"version_name": "2025"})
+        )
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertIn("KPI1 * 2", lines[2])
+
+    def test_export_results_xlsx(self):
+        response = self.client.get(
+            reverse("export-results", kwargs={"version_name": "2025"}),
+            {"file_type": "xlsx"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sheet = load_workbook(BytesIO(b"".join(response.streaming_content))).active
+        rows = list(sheet.values)
+        self.assertEqual(rows[0][-2:], ("KPI1", "FINAL"))
+        self.assertEqual(rows[1][1:5], ("OnDQ", "Apple", 20, "A"))
+
+    def test_export_without_permission(self):
+        self.permission.can_export = False
+        self.permission.save()
+
+        response = self.client.get(
+            reverse("export-results", kwargs={"version_name": "2025"})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
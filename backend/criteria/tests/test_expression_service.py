@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.exceptions import ValidationError
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    InputType,
+)
+from ..services.expression_service import (
+    KEY_PREFIX,
+    compile_criteria,
+    get_compiled_version,
+)
+from ..services.stamp_service import renew_shared_stamp
+
+class CompileCriteriaTest(TestCase):
+
+    def rows(self, *criteria):
+        return [
+            {
+                "alias": alias,
+                "is_input": expression is None,
+                "expression": expression,
+                "is_final_result": alias == "FINAL",
+            }
+            for alias, expression in criteria
+        ]
+
+    def test_compile_and_evaluate(self):
+        compiled = compile_criteria(1, self.rows(
+            ("KPI1", None),
+            ("KPI2", None),
+            ("FINAL", "round(max(KPI1, KPI2) * 0.5 + abs(-KPI1), 1)"),
+        ))
+        expression = compiled.expressions["FINAL"]
+
+        self.assertEqual(compiled.input_aliases, ("KPI1", "KPI2"))
+        self.assertEqual(compiled.final_alias, "FINAL")
+        self.assertEqual(expression.dependencies, {"KPI1", "KPI2"})
+        self.assertEqual(expression.evaluate({"KPI1": 10, "KPI2": 20}), 20)
+
+    def test_huge_constant_powers_overflow_to_infinity(self):
+        compiled = compile_criteria(1, self.rows(
+            ("KPI1", None),
+            ("A", "KPI1 + 9 ** 9 ** 9"),
+            ("FINAL", "KPI1 + 10 ** 400"),
+        ))
+
+        with np.errstate(over="ignore"):
+            self.assertEqual(compiled.expressions["A"].evaluate({"KPI1": 1.0}), math.inf)
+            self.assertEqual(compiled.expressions["FINAL"].evaluate({"KPI1": 1.0}), math.inf)
+        self.assertEqual(compiled.bounds["FINAL"].high, math.inf)
+
+    def test_errors_are_reported_together(self):
+        with self.assertRaises(ValidationError) as context:
+            compile_criteria(1, self.rows(
+                ("KPI1", None),
+                ("A", "KPI1 +"),
+                ("B", "__import__('os')"),
+                ("C", "KPI1 + MISSING"),
+                ("D", "KPI1.real"),
+            ))
+
+        self.assertEqual(set(context.exception.detail), {"A", "B", "C", "D"})
+
+
+class CompiledVersionCacheTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        Criteria.objects.create(version=self.version, alias="KPI1", is_input=True)
+        self.final = Criteria.objects.create(
+            version=self.version,
+            alias="FINAL",
+            expression="KPI1 * 2",
+            is_final_result=True,
+        )
+
+    def test_compiled_version_is_cached(self):
+        get_compiled_version(self.version.id)
+
+        with self.assertNumQueries(0):
+            compiled = get_compiled_version(self.version.id)
+
+        self.assertEqual(compiled.expressions["FINAL"].evaluate({"KPI1": 3}), 6)
+
+    def test_cache_is_invalidated_when_criteria_changes(self):
+        get_compiled_version(self.version.id)
+        self.final.expression = "KPI1 * 3"
+        self.final.save()
+
+        compiled = get_compiled_version(self.version.id)
+
+        self.assertEqual(compiled.expressions["FINAL"].evaluate({"KPI1": 3}), 9)
+
+    def test_cache_is_invalidated_when_input_type_changes(self):
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        kpi = Criteria.objects.get(version=self.version, alias="KPI1")
+        kpi.input_type = percent
+        kpi.save()
+        self.assertEqual(get_compiled_version(self.version.id).input_bounds["KPI1"], (0, 100))
+
+        percent.max = 200
+        percent.save()
+        self.assertEqual(get_compiled_version(self.version.id).input_bounds["KPI1"], (0, 200))
+
+        percent.delete()
+        self.assertEqual(get_compiled_version(self.version.id).input_bounds["KPI1"], (None, None))
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        CRITERIA_RESULT_CACHE_ALIAS="default",
+    )
+    def test_cache_is_invalidated_by_other_processes(self):
+        self.addCleanup(cache.clear)
+        get_compiled_version(self.version.id)
+
+        # Another process edits the criterion and renews the shared stamp.
+        Criteria.objects.filter(pk=self.final.pk).update(expression="KPI1 * 3")
+        renew_shared_stamp(KEY_PREFIX, self.version.id)
+
+        compiled = get_compiled_version(self.version.id)
+        self.assertEqual(compiled.expressions["FINAL"].evaluate({"KPI1": 3}), 9)
@@ -0,0 +1,87 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.exceptions import ValidationError
+from ..models import (
+    CriteriaVersion,
+    ResultPolicy,
+)
+from ..services.grading_service import (
+    KEY_PREFIX,
+    compile_policy,
+    get_compiled_policy,
+)
+from ..services.stamp_service import renew_shared_stamp
+
+class CompilePolicyTest(TestCase):
+
+    def test_grade_batch(self):
+        policy = compile_policy(
+            {"90": "A", "75": "B", "50": "C", "0": "D"},
+            action_grades=["D"],
+            explanation_grades=["A", "D"],
+        )
+
+        grading = policy.grade([95, 90, 89.9, 10, -1, float("nan")])
+
+        self.assertEqual(grading["grades"].tolist(), ["A", "A", "B", "D", None, None])
+        self.assertEqual(grading["needs_action"].tolist(), [False, False, False, True, False, False])
+        self.assertEqual(grading["needs_explanation"].tolist(), [True, True, False, True, False, False])
+
+    def test_grade_to_points_and_list_rules(self):
+        by_grade = compile_policy({"A": 90, "B": 0}, [], [])
+        by_list = compile_policy([{"min": 90, "grade": "A"}, {"min": 0, "grade": "B"}], [], [])
+
+        self.assertEqual(by_grade.grade([91, 5])["grades"].tolist(), ["A", "B"])
+        self.assertEqual(by_list.grade([91, 5])["grades"].tolist(), ["A", "B"])
+
+    def test_invalid_grading_rule(self):
+        with self.assertRaises(ValidationError):
+            compile_policy("A", [], [])
+
+
+class CompiledPolicyCacheTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+
+    def test_cache_is_invalidated_when_policy_changes(self):
+        self.assertIsNone(get_compiled_policy(self.version.id))
+
+        policy = ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"50": "Pass", "0": "Fail"},
+            action_grades=["Fail"],
+            explanation_grades=[],
+        )
+        self.assertEqual(get_compiled_policy(self.version.id).grade([60])["grades"].tolist(), ["Pass"])
+
+        policy.grading_rule = {"70": "Pass", "0": "Fail"}
+        policy.save()
+        # One read for the (missing) snapshot, one for the live policy.
+        with self.assertNumQueries(2):
+            grades = get_compiled_policy(self.version.id).grade([60])["grades"]
+        with self.assertNumQueries(0):
+            get_compiled_policy(self.version.id)
+
+        self.assertEqual(grades.tolist(), ["Fail"])
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        CRITERIA_RESULT_CACHE_ALIAS="default",
+    )
+    def test_cache_is_invalidated_by_other_processes(self):
+        self.addCleanup(cache.clear)
+        policy = ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"50": "Pass", "0": "Fail"},
+            action_grades=["Fail"],
+            explanation_grades=[],
+        )
+        get_compiled_policy(self.version.id)
+
+        # Another process edits the policy and renews the shared stamp.
+        ResultPolicy.objects.filter(pk=policy.pk).update(grading_rule={"70": "Pass", "0": "Fail"})
+        renew_shared_stamp(KEY_PREFIX, self.version.id)
+
+        grades = get_compiled_policy(self.version.id).grade([60])["grades"]
+        self.assertEqual(grades.tolist(), ["Fail"])
@@ -0,0 +1,25 @@
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+from ..services.graph_service import build_dependency_index
+
+class DependencyIndexTest(SimpleTestCase):
+
+    def test_topological_order_and_downstream(self):
+        index = build_dependency_index(
+            ["FINAL", "AVG", "KPI1", "KPI2", "BONUS"],
+            [("AVG", "FINAL"), ("KPI1", "AVG"), ("KPI2", "AVG"), ("KPI2", "BONUS")],
+        )
+
+        for from_alias, to_alias in [("AVG", "FINAL"), ("KPI1", "AVG"), ("KPI2", "BONUS")]:
+            self.assertLess(index.position[from_alias], index.position[to_alias])
+        self.assertEqual(index.dependencies["AVG"], ("KPI1", "KPI2"))
+        self.assertEqual(index.downstream(["KPI1"]), ("AVG", "FINAL"))
+
+    def test_cycles_and_dangling_aliases_are_reported_together(self):
+        with self.assertRaises(ValidationError) as context:
+            build_dependency_index(
+                ["A", "B", "C"],
+                [("A", "B"), ("B", "A"), ("C", "MISSING")],
+            )
+
+        self.assertEqual(set(context.exception.detail), {"A", "B", "C -> MISSING"})
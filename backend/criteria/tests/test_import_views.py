@@ -0,0 +1,84 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    EvaluationInput,
+    InputType,
+)
+
+class InputImportViewTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        Criteria.objects.create(
+            version=self.version, alias="KPI1", is_input=True, input_type=percent
+        )
+        Criteria.objects.create(version=self.version, alias="KPI2", is_input=True)
+        permission = Permission.objects.create(access_level="PM", can_write_eval_data=True)
+        team = Team.objects.create(name="Apple")
+        self.employees = [
+            Employee.objects.create(
+                user=User.objects.create_user(username=f"user{index}", password="@Abcde12345"),
+                team=team,
+                access_level=permission,
+            )
+            for index in range(2)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.employees[0].user)
+        self.url = reverse("import-inputs", kwargs={"version_name": "2025"})
+
+    def upload(self, content):
+        return self.client.post(self.url, {
+            "file": SimpleUploadedFile("inputs.csv", content.encode(), content_type="text/csv"),
+        }, format="multipart")
+
+    def test_import_sheet(self):
+        first, second = (employee.id for employee in self.employees)
+        EvaluationInput.objects.create(
+            version=self.version, employee=self.employees[0], alias="KPI1", value=1
+        )
+
+        response = self.upload(f"employee_id,KPI1,KPI2\n{first},70,-3\n{second},95,\n")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["data"], {"employees": 2, "values": 3})
+        self.assertEqual(
+            sorted(EvaluationInput.objects.values_list("employee_id", "alias", "value")),
+            [(first, "KPI1", 70), (first, "KPI2", -3), (second, "KPI1", 95)],
+        )
+
+    def test_empty_cells_keep_their_stored_value(self):
+        first, second = (employee.id for employee in self.employees)
+        EvaluationInput.objects.create(
+            version=self.version, employee=self.employees[1], alias="KPI2", value=5
+        )
+
+        response = self.upload(f"employee_id,KPI1,KPI2\n{first},70,-3\n{second},95,\n")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            sorted(EvaluationInput.objects.values_list("employee_id", "alias", "value")),
+            [(first, "KPI1", 70), (first, "KPI2", -3), (second, "KPI1", 95), (second, "KPI2", 5)],
+        )
+
+    def test_every_bad_cell_is_reported(self):
+        first = self.employees[0].id
+
+        response = self.upload(f"employee_id,KPI1,KPI2\n{first},120,abc\n999,50,1\n")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        cells = {(error["row"], error["column"]) for error in response.json()["errors"]}
+        self.assertEqual(cells, {(2, "KPI1"), (2, "KPI2"), (3, "employee_id")})
+        self.assertFalse(EvaluationInput.objects.exists())
@@ -0,0 +1,116 @@
+import math
+
+import numpy as np
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    InputType,
+    ResultPolicy,
+)
+from ..services.expression_service import compile_criteria
+from ..services.grading_service import compile_policy
+from ..services.interval_service import Interval
+
+class IntervalAnalysisTest(TestCase):
+
+    def compile(self, *criteria):
+        return compile_criteria(1, [
+            {
+                "alias": alias,
+                "is_input": bounds is not None,
+                "expression": expression,
+                "is_final_result": alias == "FINAL",
+                "input_type__min": bounds[0] if bounds else None,
+                "input_type__max": bounds[1] if bounds else None,
+            }
+            for alias, expression, bounds in criteria
+        ])
+
+    def test_bounds_are_propagated(self):
+        compiled = self.compile(
+            ("KPI1", None, (0, 100)),
+            ("KPI2", None, (0, 10)),
+            ("FREE", None, (None, None)),
+            ("SUM", "KPI1 * 0.5 + KPI2", None),
+            ("RATIO", "KPI1 / KPI2", None),
+            ("GAP", "abs(KPI1 - 50)", None),
+            ("THIRD", "round(KPI1 / 3, 1)", None),
+            ("CAPPED", "min(max(FREE, 0), 5)", None),
+            ("FINAL", "where(KPI2 > 5, SUM, GAP) ** 2", None),
+        )
+        bounds = compiled.bounds
+
+        self.assertEqual(bounds["SUM"], Interval(0, 60))
+        self.assertTrue(bounds["RATIO"].nan)
+        self.assertEqual(bounds["GAP"], Interval(0, 50))
+        self.assertEqual(bounds["THIRD"], Interval(0, 33.3))
+        self.assertEqual(bounds["CAPPED"], Interval(0, 5))
+        self.assertEqual(bounds["FINAL"], Interval(0, 3600))
+        self.assertEqual(bounds["FREE"].low, -math.inf)
+
+    def test_grading_with_bounds(self):
+        policy = compile_policy({"100": "A", "60": "B", "0": "C"}, ["C"], [])
+        scores = np.random.default_rng(0).uniform(0, 150, 1000)
+
+        expected = policy.grade(scores)
+        for bounds in (Interval(0, 150), Interval(-5, 150, nan=True)):
+            grading = policy.grade(scores, bounds)
+            self.assertEqual(grading["grades"].tolist(), expected["grades"].tolist())
+            self.assertEqual(grading["needs_action"].tolist(), expected["needs_action"].tolist())
+
+        self.assertEqual(set(policy.grade([70, 80], Interval(60, 99))["grades"]), {"B"})
+
+
+class CriteriaVersionBoundsViewTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        version = CriteriaVersion.objects.create(version_name="2025")
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        Criteria.objects.create(version=version, alias="KPI1", is_input=True, input_type=percent)
+        Criteria.objects.create(
+            version=version, alias="FINAL", expression="KPI1 * 0.6", is_final_result=True
+        )
+        ResultPolicy.objects.create(
+            version=version,
+            grading_rule={"100": "A", "60": "B", "0": "C"},
+            action_grades=[],
+            explanation_grades=[],
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_unreachable_grades_are_flagged(self):
+        response = self.client.get(reverse("bounds", kwargs={"version_name": "2025"}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual(data["final_result"], {"min": 0, "max": 60, "may_be_nan": False})
+        self.assertEqual(data["unreachable_grades"], [{"grade": "A", "min": 100}])
+        self.assertFalse(data["may_be_ungraded"])
+
+    def test_bounds_as_employee(self):
+        employee = User.objects.create_user(username="reviewer", password="@Abcde12345")
+        Employee.objects.create(
+            user=employee,
+            team=Team.objects.create(name="Apple"),
+            access_level=Permission.objects.create(
+                access_level="PM", can_read_criteria_settings=True
+            ),
+        )
+        self.client.force_authenticate(user=employee)
+
+        response = self.client.get(reverse("bounds", kwargs={"version_name": "2025"}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["unreachable_grades"], [{"grade": "A", "min": 100}])
@@ -0,0 +1,87 @@
+import numpy as np
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    ResultPolicy,
+)
+from ..services.expression_service import get_compiled_version
+from ..services.grading_service import get_compiled_policy
+from ..services.result_cache_service import (
+    clear_result_cache,
+    evaluate_cached,
+    input_digest,
+    result_cache_stats,
+)
+
+class ResultCacheTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        Criteria.objects.create(version=self.version, alias="KPI1", is_input=True)
+        self.final = Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="KPI1 * 2", is_final_result=True
+        )
+        self.policy = ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"100": "A", "0": "B"},
+            action_grades=[],
+            explanation_grades=[],
+        )
+        clear_result_cache()
+        self.addCleanup(clear_result_cache)
+
+    def evaluate(self, values):
+        values, grading = evaluate_cached(
+            get_compiled_version(self.version.id),
+            get_compiled_policy(self.version.id),
+            {"KPI1": np.array(values, dtype=np.float64)},
+        )
+        return values["FINAL"].tolist(), grading["grades"].tolist()
+
+    def test_input_digest_is_stable(self):
+        matrix = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        self.assertEqual(
+            input_digest({"A": matrix[:, 0], "B": [2, 4]}),
+            input_digest({"B": np.array([2.0, 4.0]), "A": [1, 3]}),
+        )
+        self.assertNotEqual(input_digest({"A": [1, 3]}), input_digest({"A": [3, 1]}))
+
+    def test_identical_inputs_are_not_recomputed(self):
+        self.assertEqual(self.evaluate([10, 60]), ([20, 120], ["B", "A"]))
+        self.assertEqual(self.evaluate([10, 60]), ([20, 120], ["B", "A"]))
+        self.evaluate([10, 70])
+
+        self.assertEqual(
+            result_cache_stats(), {"hits": 1, "shared_hits": 0, "misses": 2, "size": 2}
+        )
+
+    def test_results_are_invalidated_when_criteria_or_policy_change(self):
+        self.evaluate([60])
+
+        self.final.expression = "KPI1 * 3"
+        self.final.save()
+        self.assertEqual(self.evaluate([60]), ([180], ["A"]))
+
+        self.policy.grading_rule = {"200": "A", "0": "B"}
+        self.policy.save()
+        self.assertEqual(self.evaluate([60]), ([180], ["B"]))
+        self.assertEqual(result_cache_stats()["misses"], 3)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        CRITERIA_RESULT_CACHE_ALIAS="default",
+    )
+    def test_shared_tier(self):
+        self.addCleanup(cache.clear)
+        self.evaluate([60])
+        clear_result_cache()
+
+        self.assertEqual(self.evaluate([60]), ([120], ["A"]))
+        self.assertEqual(result_cache_stats()["shared_hits"], 1)
+
+        self.policy.save()
+        self.evaluate([60])
+        self.assertEqual(result_cache_stats()["misses"], 1)
@@ -0,0 +1,75 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from users.models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    EvaluationInput,
+    EvaluationResult,
+    ResultPolicy,
+)
+from ..services.runner_service import run_evaluation
+
+class RunEvaluationTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        Criteria.objects.create(version=self.version, alias="KPI1", is_input=True)
+        Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="KPI1 * 2", is_final_result=True
+        )
+        ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"100": "A", "0": "B"},
+            action_grades=["B"],
+            explanation_grades=[],
+        )
+        permission = Permission.objects.create(access_level="DEV")
+        team = Team.objects.create(name="Apple")
+        self.employees = []
+        for index in range(5):
+            user = User.objects.create_user(username=f"user{index}", password="@Abcde12345")
+            self.employees.append(
+                Employee.objects.create(user=user, team=team, access_level=permission)
+            )
+        for index, employee in enumerate(self.employees[:4]):
+            EvaluationInput.objects.create(
+                version=self.version, employee=employee, alias="KPI1", value=index * 20
+            )
+
+    def test_run_evaluation_in_chunks(self):
+        summary = run_evaluation(self.version.id, chunk_size=2, workers=1)
+
+        self.assertEqual(summary["employees"], 4)
+        self.assertEqual(summary["skipped"], 1)
+        results = EvaluationResult.objects.filter(version=self.version).order_by("employee_id")
+        self.assertEqual([result.final_result for result in results], [0, 40, 80, 120])
+        self.assertEqual([result.grade for result in results], ["B", "B", "B", "A"])
+        self.assertEqual(results[0].values, {"KPI1": 0, "FINAL": 0})
+
+    def test_removed_input_clears_the_result(self):
+        run_evaluation(self.version.id, chunk_size=2, workers=1)
+        EvaluationInput.objects.filter(employee=self.employees[1]).delete()
+
+        summary = run_evaluation(self.version.id, chunk_size=2, workers=1)
+
+        self.assertEqual(summary["employees"], 3)
+        self.assertEqual(summary["skipped"], 2)
+        results = EvaluationResult.objects.filter(version=self.version).order_by("employee_id")
+        self.assertEqual(
+            [result.employee_id for result in results],
+            [self.employees[0].id, self.employees[2].id, self.employees[3].id],
+        )
+
+    def test_management_command(self):
+        output = StringIO()
+
+        call_command("run_evaluation", "2025", "--workers", "1", stdout=output)
+
+        self.assertIn("Evaluated 4 employees (1 skipped)", output.getvalue())
@@ -0,0 +1,83 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import CustomUser as User
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    InputType,
+    ResultPolicy,
+)
+
+class SimulationViewTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        for alias in ("KPI1", "KPI2"):
+            Criteria.objects.create(
+                version=self.version, alias=alias, is_input=True, input_type=percent
+            )
+        Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="KPI1 + KPI2", is_final_result=True
+        )
+        ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"150": "A", "100": "B", "0": "C"},
+            action_grades=["C"],
+            explanation_grades=[],
+        )
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("simulation", kwargs={"version_name": "2025"})
+
+    def test_overrides(self):
+        response = self.client.post(self.url, {
+            "base": {"KPI1": 70, "KPI2": 50},
+            "overrides": [{"KPI1": 95}, {"KPI1": 20, "KPI2": 10}],
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual(data["scenarios"], 2)
+        self.assertEqual(data["inputs"], {"KPI1": [95, 20], "KPI2": [50, 10]})
+        self.assertEqual(data["final_result"], [145, 30])
+        self.assertEqual(data["grades"], ["B", "C"])
+        self.assertEqual(data["needs_action"], [False, True])
+
+    def test_sweep(self):
+        response = self.client.post(self.url, {
+            "base": {"KPI1": 70, "KPI2": 50},
+            "sweep": [
+                {"alias": "KPI1", "start": 0, "stop": 100, "steps": 3},
+                {"alias": "KPI2", "values": [0, 100]},
+            ],
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual(data["scenarios"], 6)
+        self.assertEqual(data["inputs"]["KPI1"], [0, 0, 50, 50, 100, 100])
+        self.assertEqual(data["final_result"], [0, 100, 50, 150, 100, 200])
+        self.assertEqual(data["grades"], ["C", "B", "C", "A", "B", "A"])
+
+    def test_invalid_scenarios(self):
+        for payload in (
+            {"base": {"KPI1": 70, "KPI2": 50}},
+            {"base": {"KPI1": 70, "KPI2": 50}, "sweep": [{"alias": "KPI1", "start": 0}]},
+            {"base": {"KPI1": 70, "KPI2": 50}, "overrides": [{"FINAL": 1}]},
+            {"base": {"KPI1": 70, "KPI2": 50}, "overrides": [{"KPI1": 101}]},
+            {"base": {"KPI1": 70}, "overrides": [{"KPI1": 80}]},
+            {"base": {"KPI1": 70, "KPI2": 50}, "sweep": [
+                {"alias": "KPI1", "start": 0, "stop": 100, "steps": 10 ** 12},
+            ]},
+            {"base": {"KPI1": 70, "KPI2": 50}, "sweep": [
+                {"alias": "KPI1", "start": 0, "stop": 100, "steps": 1000},
+                {"alias": "KPI2", "start": 0, "stop": 100, "steps": 1000},
+            ]},
+        ):
+            response = self.client.post(self.url, payload, format="json")
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
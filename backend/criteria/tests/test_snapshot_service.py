@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.test import TestCase
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    CriteriaVersionSnapshot,
+    InputType,
+    ResultPolicy,
+)
+from ..services.expression_service import (
+    get_compiled_version,
+    invalidate_compiled_version,
+)
+from ..services.grading_service import (
+    get_compiled_policy,
+    invalidate_compiled_policy,
+)
+from ..services.snapshot_service import (
+    forget_snapshot,
+    load_snapshot,
+)
+
+class CriteriaVersionSnapshotTest(TestCase):
+
+    def setUp(self):
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        self.addCleanup(forget_snapshot, self.version.id)
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        Criteria.objects.create(
+            version=self.version, alias="KPI1", is_input=True, input_type=percent
+        )
+        Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="KPI1 * 2", is_final_result=True
+        )
+        ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"100": "A", "0": "B"},
+            action_grades=[],
+            explanation_grades=[],
+        )
+
+    def promote(self):
+        self.version.state = "Official"
+        self.version.save()
+
+    def test_snapshot_is_created_on_promotion(self):
+        self.assertFalse(CriteriaVersionSnapshot.objects.exists())
+
+        self.promote()
+        snapshot = CriteriaVersionSnapshot.objects.get(version=self.version)
+        self.promote()
+
+        self.assertEqual(len(snapshot.content_hash), 64)
+        self.assertEqual(CriteriaVersionSnapshot.objects.get().content, snapshot.content)
+
+    def test_official_version_is_loaded_from_snapshot(self):
+        self.promote()
+        Criteria.objects.filter(alias="FINAL").update(expression="KPI1 * 3")
+        InputType.objects.update(max=10)
+        for invalidate in (invalidate_compiled_version, invalidate_compiled_policy, forget_snapshot):
+            invalidate(self.version.id)
+
+        # The snapshot is cached once the transaction that read it commits.
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            compiled = get_compiled_version(self.version.id)
+        with self.assertNumQueries(0):
+            policy = get_compiled_policy(self.version.id)
+
+        self.assertEqual(compiled.expressions["FINAL"].evaluate({"KPI1": 5}), 10)
+        self.assertEqual(compiled.input_bounds["KPI1"], (0, 100))
+        self.assertEqual(policy.grade([120])["grades"].tolist(), ["A"])
+
+    def test_version_created_as_official_is_not_frozen(self):
+        version = CriteriaVersion.objects.create(version_name="2026", state="Official")
+        self.addCleanup(forget_snapshot, version.id)
+        self.addCleanup(invalidate_compiled_version, version.id)
+        Criteria.objects.create(version=version, alias="KPI1", is_input=True)
+        Criteria.objects.create(
+            version=version, alias="FINAL", expression="KPI1 * 2", is_final_result=True
+        )
+        version.save()
+
+        self.assertFalse(CriteriaVersionSnapshot.objects.filter(version=version).exists())
+        self.assertEqual(get_compiled_version(version.id).final_alias, "FINAL")
+
+    def test_version_that_does_not_compile_is_not_frozen(self):
+        Criteria.objects.filter(alias="FINAL").update(expression="KPI1 *")
+
+        self.promote()
+
+        self.assertFalse(CriteriaVersionSnapshot.objects.exists())
+
+    def test_rolled_back_promotion_leaves_no_cached_snapshot(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.promote()
+                    self.assertIsNotNone(load_snapshot(self.version.id))
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertFalse(CriteriaVersionSnapshot.objects.exists())
+        self.assertIsNone(load_snapshot(self.version.id))
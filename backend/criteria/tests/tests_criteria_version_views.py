@@ -0,0 +1,270 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+from ..models import (
+    Criteria,
+    CriteriaVersion,
+    InputType,
+    ResultPolicy,
+    VariableRelationship,
+)
+from ..services.clone_service import clone_version
+from ..services.diff_service import diff_versions
+from ..services.snapshot_service import forget_snapshot
+
+class PromoteCriteriaVersionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        self.version = CriteriaVersion.objects.create(version_name="2025")
+        Criteria.objects.create(version=self.version, alias="KPI1", is_input=True)
+        Criteria.objects.create(
+            version=self.version, alias="FINAL", expression="KPI1 * 2", is_final_result=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("retrieve-and-patch", kwargs={"version_name": "2025"})
+
+    def test_promote_valid_version(self):
+        response = self.client.patch(self.url, {"state": "Official"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_promote_version_with_invalid_graph(self):
+        VariableRelationship.objects.create(
+            version=self.version, from_alias="FINAL", to_alias="KPI1"
+        )
+        VariableRelationship.objects.create(
+            version=self.version, from_alias="KPI1", to_alias="MISSING"
+        )
+
+        response = self.client.patch(self.url, {"state": "Official"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("KPI1 -> MISSING", response.json()["message"])
+        self.assertIn("FINAL", response.json()["message"])
+        self.version.refresh_from_db()
+        self.assertEqual(self.version.state, "Unofficial")
+
+    def test_version_cannot_be_created_as_official(self):
+        response = self.client.post(
+            "/api/criteria/criteria-version/",
+            {"version_name": "2026", "state": "Official"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(CriteriaVersion.objects.filter(version_name="2026").exists())
+
+
+class ListCriteriaVersionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        for index in range(5):
+            CriteriaVersion.objects.create(
+                version_name=f"v{index}",
+                role_name="TL" if index % 2 else "MB",
+                created_user=self.user,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        # "get-all-and-post" is also the name of the input type list.
+        self.url = "/api/criteria/criteria-version/"
+
+    def pages(self, **params):
+        names = []
+        query_counts = set()
+        cursor = None
+        while True:
+            query = {**params, **({"cursor": cursor} if cursor else {})}
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url, query)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            query_counts.add(len(queries))
+            names.append([version["version_name"] for version in response.json()["data"]])
+            cursor = response.json()["next"]
+            if cursor is None:
+                # The same queries on every page, whatever its position.
+                self.assertEqual(len(query_counts), 1)
+                return names
+
+    def test_pages_follow_creation_order(self):
+        self.assertEqual(
+            self.pages(page_size=2), [["v0", "v1"], ["v2", "v3"], ["v4"]]
+        )
+
+    def test_filters_and_count(self):
+        self.assertEqual(self.pages(role_name="MB", page_size=2), [["v0", "v2"], ["v4"]])
+
+        response = self.client.get(self.url, {"role_name": "TL", "with_count": True})
+        self.assertEqual(response.json()["count"], 2)
+        self.assertNotIn("count", self.client.get(self.url).json())
+
+        response = self.client.get(self.url, {"state": "Official"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"], [])
+
+    def test_invalid_parameters(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {"state": "Draft"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_no_version(self):
+        CriteriaVersion.objects.all().delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CloneCriteriaVersionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        self.version = CriteriaVersion.objects.create(version_name="2025", state="Official")
+        self.addCleanup(forget_snapshot, self.version.id)
+        Criteria.objects.create(version=self.version, alias="KPI1", is_input=True)
+        for index in range(500):
+            Criteria.objects.create(
+                version=self.version, alias=f"C{index}", expression="KPI1 * 2", parent_alias="KPI1"
+            )
+        VariableRelationship.objects.create(
+            version=self.version, from_alias="KPI1", to_alias="C0"
+        )
+        ResultPolicy.objects.create(
+            version=self.version,
+            grading_rule={"50": "A", "0": "B"},
+            action_grades=["B"],
+            explanation_grades=[],
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("clone", kwargs={"version_name": "2025"})
+
+    def test_clone_version(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {"version_name": "2026"}, format="json")
+
+        # One read and one bulk insert per table, not one query per node
+        # (SQLite splits the criteria insert into a few batches).
+        self.assertLess(len(queries), 20)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        clone = CriteriaVersion.objects.get(version_name="2026")
+        self.assertEqual(clone.state, "Unofficial")
+        self.assertEqual(clone.criteria_set.count(), 501)
+        self.assertEqual(
+            list(clone.criteria_set.filter(alias="C1").values_list("expression", "parent_alias")),
+            [("KPI1 * 2", "KPI1")],
+        )
+        self.assertEqual(
+            list(clone.variablerelationship_set.values_list("from_alias", "to_alias")),
+            [("KPI1", "C0")],
+        )
+        self.assertEqual(ResultPolicy.objects.get(version=clone).action_grades, ["B"])
+        self.assertEqual(self.version.criteria_set.count(), 501)
+
+    def test_clone_with_taken_name(self):
+        response = self.client.post(self.url, {"version_name": "2025"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DiffCriteriaVersionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(username="admin", password="@Abcde12345")
+        percent = InputType.objects.create(name="%", min=0, max=100)
+        self.official = CriteriaVersion.objects.create(version_name="2024")
+        self.addCleanup(forget_snapshot, self.official.id)
+        self.draft = CriteriaVersion.objects.create(version_name="2025")
+        for version, expression in ((self.official, "KPI1 * 2"), (self.draft, "KPI1 * 3")):
+            Criteria.objects.create(version=version, alias="KPI1", is_input=True)
+            Criteria.objects.create(
+                version=version, alias="FINAL", expression=expression, is_final_result=True
+            )
+        Criteria.objects.create(version=self.official, alias="OLD", is_input=True)
+        Criteria.objects.create(
+            version=self.draft, alias="NEW", is_input=True, input_type=percent
+        )
+        VariableRelationship.objects.create(
+            version=self.draft, from_alias="KPI1", to_alias="FINAL"
+        )
+        self.official.state = "Official"
+        self.official.save()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("diff", kwargs={"version_name": "2025"})
+
+    def test_diff_against_official_version(self):
+        # One read for both snapshots, then one per table for the draft.
+        with self.assertNumQueries(3):
+            diff = diff_versions(self.official, self.draft)
+
+        self.assertEqual([row["alias"] for row in diff["criteria"]["added"]], ["NEW"])
+        self.assertEqual(diff["criteria"]["added"][0]["input_type"], "%")
+        self.assertEqual([row["alias"] for row in diff["criteria"]["removed"]], ["OLD"])
+        self.assertEqual(diff["criteria"]["modified"], [{
+            "alias": "FINAL",
+            "changes": {"expression": {"from": "KPI1 * 2", "to": "KPI1 * 3"}},
+        }])
+        self.assertEqual(diff["relationships"], {"added": [("KPI1", "FINAL")], "removed": []})
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["base"], "2024")
+
+    def test_frozen_version_is_read_from_its_snapshot(self):
+        Criteria.objects.filter(version=self.official, alias="FINAL").update(expression="KPI1 * 5")
+
+        diff = diff_versions(self.official, self.draft)
+        clone = clone_version(self.official, "2026")
+
+        self.assertEqual(diff["criteria"]["modified"][0]["changes"]["expression"]["from"], "KPI1 * 2")
+        self.assertEqual(clone.criteria_set.get(alias="FINAL").expression, "KPI1 * 2")
+        self.assertEqual(clone.criteria_set.count(), 3)
+
+    def test_diff_with_sample_batch(self):
+        response = self.client.post(self.url, {
+            "columns": ["KPI1", "OLD", "NEW"],
+            "rows": [[10, 0, 0], [20, 0, 0]],
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        final_results = response.json()["data"]["final_results"]
+        self.assertEqual(final_results["base"]["final_result"], [20, 40])
+        self.assertEqual(final_results["target"]["final_result"], [30, 60])
+        self.assertEqual(final_results["delta"], [10, 20])
+
+    def test_diff_as_employee(self):
+        employee = User.objects.create_user(username="reviewer", password="@Abcde12345")
+        Employee.objects.create(
+            user=employee,
+            team=Team.objects.create(name="Apple"),
+            access_level=Permission.objects.create(
+                access_level="PM", can_read_criteria_settings=True
+            ),
+        )
+        self.client.force_authenticate(user=employee)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["target"], "2025")
+
+    def test_diff_without_official_version(self):
+        response = self.client.get(reverse("diff", kwargs={"version_name": "2024"}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
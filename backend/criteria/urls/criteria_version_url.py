@@ -13,4 +13,19 @@ urlpatterns = [
         criteria_version_view.CriteriaVersionView.as_view(), 
         name="retrieve-and-patch"
     ),
+
+    path("<str:version_name>/clone/",
+        criteria_version_view.CriteriaVersionCloneView.as_view(),
+        name="clone"
+    ),
+
+    path("<str:version_name>/diff/",
+        criteria_version_view.CriteriaVersionDiffView.as_view(),
+        name="diff"
+    ),
+
+    path("<str:version_name>/bounds/",
+        criteria_version_view.CriteriaVersionBoundsView.as_view(),
+        name="bounds"
+    ),
 ]
@@ -0,0 +1,9 @@
+from django.urls import path
+from ..views import evaluation_view
+
+urlpatterns = [
+    path("<str:version_name>/",
+        evaluation_view.EvaluationView.as_view(),
+        name="evaluation"
+    ),
+]
@@ -0,0 +1,13 @@
+from django.urls import path
+from ..views import export_view
+
+urlpatterns = [
+    path("criteria/<str:version_name>/",
+        export_view.CriteriaExportView.as_view(),
+        name="export-criteria"
+    ),
+    path("results/<str:version_name>/",
+        export_view.ResultExportView.as_view(),
+        name="export-results"
+    ),
+]
@@ -0,0 +1,9 @@
+from django.urls import path
+from ..views import import_view
+
+urlpatterns = [
+    path("<str:version_name>/",
+        import_view.InputImportView.as_view(),
+        name="import-inputs"
+    ),
+]
@@ -0,0 +1,9 @@
+from django.urls import path
+from ..views import simulation_view
+
+urlpatterns = [
+    path("<str:version_name>/",
+        simulation_view.SimulationView.as_view(),
+        name="simulation"
+    ),
+]
@@ -8,6 +8,13 @@ from users.models import(
     CustomUser as User,
     Employee
 )
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from asgiref.local import Local
+from django.conf import settings
+from django.core.cache import caches
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import PermissionDenied
 
@@ -30,6 +37,249 @@ def check_state(
     if model_name == "Criteria Version":
         return check_state_for_criteria_verison()
     
+# CustomUserPermission field checked by each check_permission action.
+ACTION_FIELDS = {
+    "can_read_eval_data": "can_read_eval_data",
+    "can_write_eval_data": "can_write_eval_data",
+    "can_read_eval_setting": "can_read_eval_settings",
+    "can_write_eval_setting": "can_write_eval_settings",
+    "can_read_criteria_setting": "can_read_criteria_settings",
+    "can_write_criteria_setting": "can_write_criteria_settings",
+    "can_export": "can_export",
+}
+
+# Permission snapshots of the request being handled, keyed by user id. The
+# store only exists while a request is handled (see criteria.signals).
+_request_state = Local()
+
+# Process-wide snapshots shared by requests, keyed by user id, as
+# (expiry time, snapshot). Signals drop the snapshots of users whose
+# permissions change, and the TTL bounds how stale a snapshot can get after
+# changes that send no signal (such as QuerySet.update).
+DEFAULT_PERMISSION_CACHE_TTL = 300
+_permission_cache = {}
+_permission_generation = 0
+_permission_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PermissionSnapshot:
+    """
+    Everything check_permission needs to know about a user, loaded once.
+
+    `access_level` maps each CustomUserPermission field to its value, and is
+    None when the user has no active employee. `group_permissions` holds the
+    permission names of the groups of a staff user without an employee, and
+    is None when that user is not part of any group.
+    """
+    is_superuser: bool
+    is_staff: bool
+    access_level: dict | None = None
+    group_permissions: tuple | None = None
+
+
+# Bits of the capability bitmask carried by access tokens (see
+# users.authentication). Each CustomUserPermission field gets one bit.
+CAPABILITY_BITS = {field: 1 << index for index, field in enumerate(ACTION_FIELDS.values())}
+SUPERUSER_BIT = 1 << 7
+STAFF_BIT = 1 << 8
+ACCESS_LEVEL_BIT = 1 << 9
+
+PERMISSION_STAMP_PREFIX = "permission-stamp"
+
+
+def encode_capabilities(snapshot: PermissionSnapshot) -> int | None:
+    """
+    Pack a permission snapshot into an integer bitmask.
+
+    Returns None for a staff user without an employee who is part of a
+    group, whose group permission names do not fit in a bitmask.
+    """
+    if snapshot.access_level is None and snapshot.group_permissions is not None:
+        return None
+
+    mask = 0
+    if snapshot.is_superuser:
+        mask |= SUPERUSER_BIT
+    if snapshot.is_staff:
+        mask |= STAFF_BIT
+    if snapshot.access_level is not None:
+        mask |= ACCESS_LEVEL_BIT
+        for field, bit in CAPABILITY_BITS.items():
+            if snapshot.access_level[field]:
+                mask |= bit
+    return mask
+
+
+def decode_capabilities(mask: int) -> PermissionSnapshot:
+    """
+    Unpack a bitmask built by `encode_capabilities`.
+    """
+    access_level = None
+    if mask & ACCESS_LEVEL_BIT:
+        access_level = {field: bool(mask & bit) for field, bit in CAPABILITY_BITS.items()}
+    return PermissionSnapshot(
+        is_superuser=bool(mask & SUPERUSER_BIT),
+        is_staff=bool(mask & STAFF_BIT),
+        access_level=access_level,
+    )
+
+
+def _stamp_cache():
+    # The stamps must live in a cache shared by every process that
+    # authenticates requests, or an invalidation in one process would not be
+    # seen by the others.
+    return caches[getattr(settings, "PERMISSION_STAMP_CACHE_ALIAS", "default")]
+
+
+def permission_stamp(user_id: int) -> str:
+    """
+    Return the permission version of a user.
+
+    The stamp changes whenever the permissions of the user, or of every
+    user, are invalidated. A missing (or evicted) stamp is replaced by a new
+    one, so tokens stamped before that are seen as stale.
+    """
+    cache = _stamp_cache()
+    keys = [PERMISSION_STAMP_PREFIX, f"{PERMISSION_STAMP_PREFIX}:{user_id}"]
+    stamps = cache.get_many(keys)
+    for key in keys:
+        if key not in stamps:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            stamps[key] = cache.get(key)
+    return ".".join(str(stamps[key]) for key in keys)
+
+
+def begin_permission_snapshots(**kwargs):
+    _request_state.snapshots = {}
+
+
+def end_permission_snapshots(**kwargs):
+    _request_state.snapshots = None
+
+
+def build_permission_snapshot(user: User) -> PermissionSnapshot:
+    """
+    Load the permissions of a user with one query for the employee and its
+    access level, plus one query for group permission names when needed.
+    """
+    if user.is_superuser:
+        return PermissionSnapshot(is_superuser=True, is_staff=user.is_staff)
+
+    employee = Employee.objects.filter(
+        user=user, is_active=True
+    ).select_related("access_level").first()
+    if employee is not None:
+        return PermissionSnapshot(
+            is_superuser=False,
+            is_staff=user.is_staff,
+            access_level={
+                field: getattr(employee.access_level, field)
+                for field in ACTION_FIELDS.values()
+            },
+        )
+
+    group_permissions = None
+    if user.is_staff:
+        # One row per group permission, and a None row for a group without
+        # any permission, so an empty result means "not part of any group".
+        names = list(user.groups.values_list("permissions__name", flat=True))
+        if names:
+            group_permissions = tuple(name for name in names if name is not None)
+    return PermissionSnapshot(
+        is_superuser=False,
+        is_staff=user.is_staff,
+        group_permissions=group_permissions,
+    )
+
+
+def invalidate_permission_snapshots(user_ids=None) -> None:
+    """
+    Drop the cached permission snapshots of the given users, or of every
+    user when `user_ids` is None.
+    """
+    global _permission_generation
+    with _permission_lock:
+        _permission_generation += 1
+        if user_ids is None:
+            _permission_cache.clear()
+        else:
+            for user_id in user_ids:
+                _permission_cache.pop(user_id, None)
+
+    cache = _stamp_cache()
+    if user_ids is None:
+        cache.set(PERMISSION_STAMP_PREFIX, uuid.uuid4().hex, timeout=None)
+    else:
+        cache.set_many(
+            {f"{PERMISSION_STAMP_PREFIX}:{user_id}": uuid.uuid4().hex for user_id in user_ids},
+            timeout=None,
+        )
+
+
+def _cached_permission_snapshot(user: User) -> PermissionSnapshot:
+    entry = _permission_cache.get(user.pk)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    generation = _permission_generation
+    snapshot = build_permission_snapshot(user)
+    ttl = getattr(settings, "PERMISSION_CACHE_TTL", DEFAULT_PERMISSION_CACHE_TTL)
+    with _permission_lock:
+        # Do not cache a snapshot that was invalidated while it was loading.
+        if generation == _permission_generation:
+            _permission_cache[user.pk] = (time.monotonic() + ttl, snapshot)
+    return snapshot
+
+
+def permission_claims(user: User) -> dict:
+    """
+    Return the claims that let an access token of the user be authorized
+    without loading the user, or an empty dict when the permissions of the
+    user cannot be packed into a bitmask.
+    """
+    # Read the stamp first: an invalidation while the snapshot is loading
+    # then makes the token stale instead of letting it carry old permissions.
+    stamp = permission_stamp(user.pk)
+    mask = encode_capabilities(_cached_permission_snapshot(user))
+    if mask is None:
+        return {}
+    return {"username": user.username, "cap": mask, "pv": stamp}
+
+
+def get_permission_snapshot(username) -> PermissionSnapshot:
+    """
+    Return the permission snapshot of a user, built at most once per request
+    and shared between requests until it expires or is invalidated.
+
+    Users authenticated from the claims of their token already carry their
+    snapshot in `permission_snapshot`.
+
+    Args:
+        username (CustomUser | str): The authenticated user (usually
+            `request.user`), or a username to look up.
+
+    Raises:
+        User.DoesNotExist: If there is no active user with that username.
+    """
+    if isinstance(username, User):
+        user = username
+        if not user.is_active:
+            raise User.DoesNotExist
+        snapshot = getattr(user, "permission_snapshot", None)
+        if snapshot is not None:
+            return snapshot
+    else:
+        user = User.objects.get(username=username, is_active=True)
+
+    snapshots = getattr(_request_state, "snapshots", None)
+    if snapshots is None:
+        return _cached_permission_snapshot(user)
+    if user.pk not in snapshots:
+        snapshots[user.pk] = _cached_permission_snapshot(user)
+    return snapshots[user.pk]
+
+
 def check_permission(
     username: str, 
     action: str, 
@@ -37,50 +287,27 @@ def check_permission(
 ) -> bool:
     
     try:
-        user = User.objects.get(username=username, is_active=True)
+        snapshot = get_permission_snapshot(username)
         
-        if user.is_superuser:
+        if snapshot.is_superuser:
             return True
         
-        employee = Employee.objects.filter(user=user, is_active=True).first()
-        
-        if employee is None:   
-            if user.is_staff:
-                groups = user.groups.all()
-                if not groups.exists():
+        if snapshot.access_level is None:   
+            if snapshot.is_staff:
+                if snapshot.group_permissions is None:
                     raise PermissionDenied(_(CheckPermissionMessage.USER_NOT_PART_ANY_GROUP))
-                for group in groups:
-                    permissions = group.permissions.all()
-                    for permission in permissions:
-                        if permission_is in permission.name:
-                            return True
-                return False
+                return any(permission_is in name for name in snapshot.group_permissions)
             else:
                 raise PermissionDenied(_(CheckPermissionMessage.EMPLOYEE_NOT_FOUND_OR_USER_NOT_PART_ANY_TEAM))
         
-        if employee is not None:
-            if action is not None:
-                match action:
-                    case "can_read_eval_data":
-                        return employee.access_level.can_read_eval_data
-                    case "can_write_eval_data":
-                        return employee.access_level.can_write_eval_data
-                    case "can_read_eval_setting":
-                        return employee.access_level.can_read_eval_settings
-                    case "can_write_eval_setting":
-                        return employee.access_level.can_write_eval_settings
-                    case "can_read_criteria_setting":
-                        return employee.access_level.can_read_criteria_settings
-                    case "can_write_criteria_setting":
-                        return employee.access_level.can_write_criteria_settings
-                    case "can_export":
-                        return employee.access_level.can_export
-                    case _:
-                        raise Exception(_(CheckPermissionMessage.NO_ACTION_DEFINE))
-            return False
+        if action is not None:
+            if action not in ACTION_FIELDS:
+                raise Exception(_(CheckPermissionMessage.NO_ACTION_DEFINE))
+            return snapshot.access_level[ACTION_FIELDS[action]]
+        return False
       
     except User.DoesNotExist:
         raise PermissionDenied(_(CheckPermissionMessage.USER_NOT_FOUND))
        
     except Exception as e:
-        raise PermissionDenied(str(e))
\ No newline at end of file
+        raise PermissionDenied(str(e))
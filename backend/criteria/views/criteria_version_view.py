@@ -6,10 +6,16 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from django.core.exceptions import PermissionDenied
 from ..models import(
-    CriteriaVersion
+    CriteriaVersion,
+    CriteriaVersionStateEnum,
 )
 from ..serializers.criteria_version_serializer import(
     CriteriaVersionSerializer,
+    CriteriaVersionListSerializer,
+    CloneCriteriaVersionSerializer,
+)
+from ..serializers.evaluation_serializer import(
+    BatchEvaluationSerializer,
 )
 from ..constants import(
     ResponseMessage,
@@ -22,6 +28,29 @@ from ..utils import(
     check_state,
     check_permission,
 )
+from ..services.expression_service import(
+    get_compiled_version,
+)
+from ..services.clone_service import(
+    clone_version,
+)
+from ..services.diff_service import(
+    compare_final_results,
+    diff_versions,
+    official_version_of,
+)
+from ..services.evaluation_service import(
+    inputs_from_matrix,
+)
+from ..services.grading_service import(
+    get_compiled_policy,
+)
+from ..services.interval_service import(
+    analyze_version,
+)
+from ..services.pagination_service import(
+    keyset_page,
+)
 
 class CriteriaVersionView(APIView):
     """
@@ -112,40 +141,49 @@ class CriteriaVersionView(APIView):
     
     def all_criteria_version(self, request):
         """
-        Retrieve all Criteria versions, with optional filtering by role name and state.
+        Retrieve one page of Criteria versions ordered by creation time, with
+        optional filtering by role name and state.
+
+        Query parameters:
+            role_name, state: Optional filters.
+            cursor: The `next` cursor of the previous page.
+            page_size: The number of versions of a page (50 by default).
+            with_count: Also count every version matching the filters.
 
         Args:
             request (Request): The incoming HTTP request with optional query parameters.
 
         Returns:
-            Response: List of serialized data or appropriate error response.
+            Response: The serialized page and the cursor of the next page, or
+                appropriate error response.
         """
         try:
-            criteria_versions=CriteriaVersion.objects.all()
-            if len(criteria_versions)<1:
+            params=CriteriaVersionListSerializer(data=request.query_params)
+            params.is_valid(raise_exception=True)
+            filters={
+                field: params.validated_data[field]
+                for field in ("role_name", "state")
+                if field in params.validated_data
+            }
+            criteria_versions=CriteriaVersion.objects.filter(**filters).select_related(
+                "created_user", "updated_user"
+            )
+            cursor=params.validated_data.get("cursor")
+
+            page, next_cursor=keyset_page(
+                criteria_versions, cursor, params.validated_data["page_size"]
+            )
+            if not page and cursor is None and not CriteriaVersion.objects.exists():
                 return Response(
                     {MESSAGE:CriteriaVersionMessage.OBJECT_HAS_NO_VALUE},
                     status=status.HTTP_404_NOT_FOUND
                 )
-                
-            role_name=request.query_params.get("role_name")
-            state=request.query_params.get("state")
-            
-            if role_name and state:
-                criteria_versions=criteria_versions.filter(
-                    role_name__exact=role_name, state__exact=state  
-                )
-                
-            elif role_name:
-                criteria_versions=criteria_versions.filter(
-                    role_name__exact=role_name
-                )
-                
-            elif state:
-                criteria_versions=criteria_versions.filter(state__exact=state)
-                
-            serializer=CriteriaVersionSerializer(criteria_versions, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+
+            serializer=CriteriaVersionSerializer(page, many=True)
+            response={DATA: serializer.data, "next": next_cursor}
+            if params.validated_data["with_count"]:
+                response["count"]=criteria_versions.count()
+            return Response(response, status=status.HTTP_200_OK)
         
         except PermissionDenied as p:
             return Response(
@@ -242,6 +280,8 @@ class CriteriaVersionView(APIView):
         - Retrieves the existing CriteriaVersion instance by `version_name`.
         - Validates the update data using the serializer (partial update).
         - Checks if the state transition is valid using `check_state`.
+        - Compiles the version and validates its dependency graph when it is
+          promoted to `Official`.
         - Saves the updated instance with the current user as `updated_user`.
 
         Args:
@@ -292,6 +332,14 @@ class CriteriaVersionView(APIView):
                         status=status.HTTP_400_BAD_REQUEST,
                     )
                 
+                if (
+                    new_state == CriteriaVersionStateEnum.OFFICIAL
+                    and current_state != CriteriaVersionStateEnum.OFFICIAL
+                ):
+                    # Raises ValidationError with every expression, cycle and
+                    # dangling alias error of the version at once.
+                    get_compiled_version(instance.id)
+                
                 serializer.save(updated_user=user)
                 return Response({
                         MESSAGE:CRUDResponseMessage.UPDATE_SUCCESSFULLY,
@@ -381,4 +429,265 @@ class CriteriaVersionView(APIView):
             return Response(
                 {MESSAGE: str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+class CriteriaVersionCloneView(APIView):
+    """
+    API endpoint for copying a Criteria Version with all its children.
+
+    The criteria, variable relationships and result policy of the source
+    version are copied in bulk inside one transaction. The new version is
+    always created as `Unofficial`.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to clone a CriteriaVersion.
+
+        Args:
+            request (Request): The incoming HTTP request with the new
+                `version_name` and an optional `role_name`.
+            **kwargs: Expected to contain 'version_name' of the source version.
+
+        Returns:
+            Response:
+                - 201 Created with the new version.
+                - 400 Bad Request if the new version name is invalid or taken.
+                - 403 Forbidden if user lacks permission.
+                - 404 Not Found if the source CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        try:
+            if not check_permission(
+            username=request.user,
+            action="can_write_criteria_setting",
+            permission_is="Criteria",
+        ):
+                return Response(
+                {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+            source=CriteriaVersion.objects.get(version_name=kwargs.get("version_name"))
+
+            serializer = CloneCriteriaVersionSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            clone = clone_version(
+                source,
+                serializer.validated_data["version_name"],
+                user=request.user,
+                role_name=serializer.validated_data.get("role_name"),
+            )
+
+            return Response({
+                    MESSAGE:CRUDResponseMessage.CREATE_SUCCESSFULLY,
+                    DATA:CriteriaVersionSerializer(clone).data,
+                },
+                status=status.HTTP_201_CREATED
+            )
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class CriteriaVersionDiffView(APIView):
+    """
+    API endpoint for reviewing the changes of a Criteria Version.
+
+    The version is compared with the `against` version given in the query,
+    or by default with the current Official version of the same role. GET
+    returns the structural diff; POST also evaluates a sample batch of
+    inputs against both versions to show the effect on the final results.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get_versions(self, request, version_name):
+        target=CriteriaVersion.objects.get(version_name=version_name)
+        against=request.query_params.get("against")
+        if against:
+            return CriteriaVersion.objects.get(version_name=against), target
+        return official_version_of(target), target
+
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request to diff a CriteriaVersion.
+
+        Args:
+            request (Request): The incoming HTTP request with an optional
+                `against` query parameter.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 200 OK with the added, removed and modified criteria and
+                  relationships.
+                - 403 Forbidden if user lacks permission.
+                - 404 Not Found if a CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        return self.diff(request, kwargs.get("version_name"))
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to diff a CriteriaVersion and compare the final
+        results of a sample batch.
+
+        Args:
+            request (Request): The incoming HTTP request with the sample
+                `columns` and `rows`, and an optional `against` query parameter.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 200 OK with the diff and the final results of both versions.
+                - 400 Bad Request if the sample or the expressions are invalid.
+                - 403 Forbidden if user lacks permission.
+                - 404 Not Found if a CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        return self.diff(request, kwargs.get("version_name"), sample=request.data)
+
+    def diff(self, request, version_name, sample=None):
+        try:
+            if not check_permission(
+            username=request.user,
+            action="can_read_criteria_setting",
+            permission_is="Criteria",
+        ):
+                return Response(
+                {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+            base, target = self.get_versions(request, version_name)
+            if base is None:
+                return Response(
+                    {MESSAGE: CriteriaVersionMessage.NO_OFFICIAL_VERSION},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            response = diff_versions(base, target)
+            if sample is not None:
+                serializer = BatchEvaluationSerializer(data=sample)
+                serializer.is_valid(raise_exception=True)
+                inputs = inputs_from_matrix(
+                    serializer.validated_data["columns"],
+                    serializer.validated_data["rows"],
+                )
+                response["final_results"] = compare_final_results(base, target, inputs)
+
+            return Response({DATA: response}, status=status.HTTP_200_OK)
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class CriteriaVersionBoundsView(APIView):
+    """
+    API endpoint for the interval analysis of a Criteria Version.
+
+    The bounds of the input types are propagated through every expression
+    to get the possible range of each criterion and of the final result,
+    and the grades of the ResultPolicy that can never be reached.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request to analyse the bounds of a CriteriaVersion.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 200 OK with the bounds and the unreachable grades.
+                - 400 Bad Request if the version does not compile.
+                - 403 Forbidden if user lacks permission.
+                - 404 Not Found if the CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        try:
+            if not check_permission(
+            username=request.user,
+            action="can_read_criteria_setting",
+            permission_is="Criteria",
+        ):
+                return Response(
+                {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+            version=CriteriaVersion.objects.get(version_name=kwargs.get("version_name"))
+            analysis = analyze_version(
+                get_compiled_version(version.id),
+                get_compiled_policy(version.id),
+            )
+            return Response({DATA: analysis}, status=status.HTTP_200_OK)
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
@@ -0,0 +1,220 @@
+from django.core.exceptions import PermissionDenied
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+
+from ..models import (
+    CriteriaVersion
+)
+
+from ..serializers.evaluation_serializer import (
+    BatchEvaluationSerializer,
+    IncrementalEvaluationSerializer,
+)
+
+from ..constants import (
+    ResponseMessage,
+    CriteriaVersionMessage,
+    MESSAGE,
+    DATA,
+)
+
+from ..utils import (
+    check_permission
+)
+
+from ..services.expression_service import (
+    get_compiled_version
+)
+
+from ..services.grading_service import (
+    get_compiled_policy
+)
+
+from ..services.evaluation_service import (
+    inputs_from_matrix,
+    evaluate_incremental,
+    to_json_list,
+    to_json_value,
+)
+
+from ..services.result_cache_service import (
+    evaluate_cached
+)
+
+class EvaluationView(APIView):
+    """
+    API endpoint for scoring a batch of employees against one criteria version.
+
+    The request carries one row of input values per employee and one column
+    per input alias. Every derived criterion and the final result are
+    computed for all rows at once.
+
+    PATCH re-evaluates a single employee after some input values changed and
+    only recomputes the criteria downstream of those inputs.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to evaluate a matrix of input values.
+
+        Args:
+            request (Request): The incoming HTTP request with `columns`, `rows`
+                and an optional list of `employees` labels.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 200 OK with the value of every criterion for every row, and
+                  the grade of every row when the version has a ResultPolicy.
+                - 400 Bad Request if the inputs or the expressions are invalid.
+                - 403 Forbidden if the user lacks permission.
+                - 404 Not Found if the CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        try:
+            if not check_permission(
+                username=request.user,
+                action="can_read_eval_data",
+                permission_is="criteria",
+            ):
+                return Response(
+                    {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            serializer = BatchEvaluationSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            version = CriteriaVersion.objects.get(version_name=kwargs.get("version_name"))
+            compiled = get_compiled_version(version.id)
+
+            inputs = inputs_from_matrix(
+                serializer.validated_data["columns"],
+                serializer.validated_data["rows"],
+            )
+            values, grading = evaluate_cached(
+                compiled, get_compiled_policy(version.id), inputs
+            )
+
+            response = {
+                "columns": list(compiled.input_aliases) + list(compiled.order),
+                "results": {
+                    alias: to_json_list(column) for alias, column in values.items()
+                },
+                "final_result": (
+                    to_json_list(values[compiled.final_alias])
+                    if compiled.final_alias in values else None
+                ),
+            }
+            if grading is not None:
+                response["grades"] = grading["grades"].tolist()
+                response["needs_action"] = grading["needs_action"].tolist()
+                response["needs_explanation"] = grading["needs_explanation"].tolist()
+
+            if "employees" in serializer.validated_data:
+                response["employees"] = serializer.validated_data["employees"]
+
+            return Response({DATA: response}, status=status.HTTP_200_OK)
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Handle PATCH request to re-evaluate one employee after input changes.
+
+        Args:
+            request (Request): The incoming HTTP request with the current
+                `values` of every alias and the `changes` of input aliases.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 200 OK with the new value of every criterion that changed.
+                - 400 Bad Request if the values or the expressions are invalid.
+                - 403 Forbidden if the user lacks permission.
+                - 404 Not Found if the CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        try:
+            if not check_permission(
+                username=request.user,
+                action="can_read_eval_data",
+                permission_is="criteria",
+            ):
+                return Response(
+                    {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            serializer = IncrementalEvaluationSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            version = CriteriaVersion.objects.get(version_name=kwargs.get("version_name"))
+            compiled = get_compiled_version(version.id)
+
+            changed = evaluate_incremental(
+                compiled,
+                serializer.validated_data["values"],
+                serializer.validated_data["changes"],
+            )
+
+            return Response({
+                    DATA: {
+                        "changed": {
+                            alias: to_json_value(value) for alias, value in changed.items()
+                        },
+                    },
+                },
+                status=status.HTTP_200_OK
+            )
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
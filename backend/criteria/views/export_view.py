@@ -0,0 +1,155 @@
+from django.core.exceptions import PermissionDenied
+from django.http import StreamingHttpResponse
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from ..models import (
+    CriteriaVersion
+)
+
+from ..constants import (
+    ResponseMessage,
+    CriteriaVersionMessage,
+    ExportMessage,
+    MESSAGE,
+)
+
+from ..utils import (
+    check_permission
+)
+
+from ..services.export_service import (
+    CONTENT_TYPES,
+    CRITERIA_HEADER,
+    CSV,
+    criteria_rows,
+    result_header,
+    result_rows,
+    stream_rows,
+)
+
+def _header_and_criteria_rows(version):
+    return CRITERIA_HEADER, criteria_rows(version.id)
+
+
+def _header_and_result_rows(version):
+    header, aliases = result_header(version.id)
+    return header, result_rows(version.id, aliases)
+
+
+def export_response(request, version_name, file_prefix, permission_is, header_and_rows):
+    """
+    Stream the rows of a criteria version as a CSV or XLSX file.
+
+    The `file_type` query parameter selects the format (csv by default).
+    Rows are read with a server-side cursor and written to the response as
+    they come, so large exports never sit in memory as a whole.
+
+    Args:
+        request (Request): The incoming HTTP request with an optional
+            `file_type` query parameter (csv or xlsx).
+        version_name (str): The name of the CriteriaVersion to export.
+        file_prefix (str): Prefix of the file name, also the sheet title.
+        permission_is (str): The permission scope checked for `can_export`.
+        header_and_rows (Callable): Returns the header and the row iterator
+            of the given CriteriaVersion.
+
+    Returns:
+        StreamingHttpResponse: The exported file.
+        Response:
+            - 400 Bad Request if the file type is not supported.
+            - 403 Forbidden if the user lacks the export permission.
+            - 404 Not Found if the CriteriaVersion does not exist.
+            - 500 Internal Server Error for unexpected exceptions.
+    """
+    try:
+        if not check_permission(
+            username=request.user,
+            action="can_export",
+            permission_is=permission_is,
+        ):
+            return Response(
+                {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        file_type = request.query_params.get("file_type", CSV)
+        if file_type not in CONTENT_TYPES:
+            return Response(
+                {MESSAGE: ExportMessage.INVALID_FILE_TYPE},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        version = CriteriaVersion.objects.get(version_name=version_name)
+        header, rows = header_and_rows(version)
+
+        response = StreamingHttpResponse(
+            stream_rows(file_type, header, rows, title=file_prefix),
+            content_type=CONTENT_TYPES[file_type],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{file_prefix}_{version.version_name}.{file_type}"'
+        )
+        return response
+
+    except PermissionDenied as p:
+        return Response(
+            {MESSAGE: str(p)},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    except CriteriaVersion.DoesNotExist:
+        return Response(
+            {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    except Exception as e:
+        return Response(
+            {MESSAGE: str(e)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+class CriteriaExportView(APIView):
+    """
+    API endpoint for exporting the criteria tree of a version.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request to export the criteria of a version as a CSV or
+        XLSX file (see `export_response`).
+        """
+        return export_response(
+            request,
+            kwargs.get("version_name"),
+            file_prefix="criteria",
+            permission_is="criteria",
+            header_and_rows=_header_and_criteria_rows,
+        )
+
+
+class ResultExportView(APIView):
+    """
+    API endpoint for exporting the evaluation results of a version, with one
+    column per criteria value.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request to export the evaluation results of a version as
+        a CSV or XLSX file (see `export_response`).
+        """
+        return export_response(
+            request,
+            kwargs.get("version_name"),
+            file_prefix="results",
+            permission_is="evaluation",
+            header_and_rows=_header_and_result_rows,
+        )
@@ -0,0 +1,132 @@
+from django.core.exceptions import PermissionDenied
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+
+from ..models import (
+    CriteriaVersion
+)
+
+from ..constants import (
+    ResponseMessage,
+    CriteriaVersionMessage,
+    ImportMessage,
+    MESSAGE,
+    DATA,
+)
+
+from ..utils import (
+    check_permission
+)
+
+from ..services.expression_service import (
+    get_compiled_version
+)
+
+from ..services.import_service import (
+    read_sheet,
+    validate_sheet,
+    write_inputs,
+)
+
+class InputImportView(APIView):
+    """
+    API endpoint for importing the input values of a criteria version from
+    a CSV or Excel sheet.
+
+    The sheet has an `employee_id` column and one column per input alias.
+    It is validated as a whole and every bad cell is reported at once;
+    nothing is written unless the whole sheet is valid.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to import a sheet of input values.
+
+        Args:
+            request (Request): The incoming HTTP request with the sheet in
+                the `file` field of a multipart form.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 201 Created with the number of imported employees and values.
+                - 400 Bad Request with every invalid cell of the sheet.
+                - 403 Forbidden if the user lacks permission.
+                - 404 Not Found if the CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        try:
+            if not check_permission(
+                username=request.user,
+                action="can_write_eval_data",
+                permission_is="evaluation",
+            ):
+                return Response(
+                    {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            file = request.FILES.get("file")
+            if file is None:
+                return Response(
+                    {MESSAGE: ImportMessage.MISSING_FILE},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            version = CriteriaVersion.objects.get(version_name=kwargs.get("version_name"))
+            compiled = get_compiled_version(version.id)
+
+            try:
+                frame = read_sheet(file)
+            except ValueError as e:
+                return Response(
+                    {MESSAGE: str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            values, errors = validate_sheet(compiled, frame)
+            if errors:
+                return Response(
+                    {MESSAGE: ImportMessage.INVALID_SHEET, "errors": errors},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            imported = write_inputs(version.id, values)
+            return Response({
+                    MESSAGE: ImportMessage.IMPORT_SUCCESSFULLY,
+                    DATA: {
+                        "employees": len(frame),
+                        "values": imported,
+                    },
+                },
+                status=status.HTTP_201_CREATED
+            )
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,132 @@
+from django.core.exceptions import PermissionDenied
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+
+from ..models import (
+    CriteriaVersion
+)
+
+from ..serializers.evaluation_serializer import (
+    SimulationSerializer
+)
+
+from ..constants import (
+    ResponseMessage,
+    CriteriaVersionMessage,
+    MESSAGE,
+    DATA,
+)
+
+from ..utils import (
+    check_permission
+)
+
+from ..services.expression_service import (
+    get_compiled_version
+)
+
+from ..services.grading_service import (
+    get_compiled_policy
+)
+
+from ..services.evaluation_service import (
+    to_json_list
+)
+
+from ..services.simulation_service import (
+    simulate
+)
+
+class SimulationView(APIView):
+    """
+    API endpoint for what-if simulations against one criteria version.
+
+    The request carries a base value for every input alias, plus either a
+    list of overrides (one scenario each) or a sweep over the points of one
+    or more aliases (one scenario per combination). Every scenario is
+    evaluated and graded in a single vectorized pass.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to run a what-if simulation.
+
+        Args:
+            request (Request): The incoming HTTP request with the `base`
+                input values and either `overrides` or `sweep`.
+            **kwargs: Expected to contain 'version_name'.
+
+        Returns:
+            Response:
+                - 200 OK with the varied inputs, the final result and, when
+                  the version has a ResultPolicy, the grading of every scenario.
+                - 400 Bad Request if the scenarios or the expressions are invalid.
+                - 403 Forbidden if the user lacks permission.
+                - 404 Not Found if the CriteriaVersion does not exist.
+                - 500 Internal Server Error for unexpected exceptions.
+        """
+        try:
+            if not check_permission(
+                username=request.user,
+                action="can_read_eval_data",
+                permission_is="criteria",
+            ):
+                return Response(
+                    {MESSAGE: ResponseMessage.DO_NOT_HAVE_PERMISSION},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            serializer = SimulationSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            version = CriteriaVersion.objects.get(version_name=kwargs.get("version_name"))
+            simulation = simulate(
+                get_compiled_version(version.id),
+                get_compiled_policy(version.id),
+                serializer.validated_data["base"],
+                overrides=serializer.validated_data.get("overrides"),
+                sweep=serializer.validated_data.get("sweep"),
+            )
+
+            response = {
+                "scenarios": len(simulation["final_result"]),
+                "inputs": {
+                    alias: column.tolist() for alias, column in simulation["inputs"].items()
+                },
+                "final_result": to_json_list(simulation["final_result"]),
+            }
+            if "grades" in simulation:
+                response["grades"] = simulation["grades"].tolist()
+                response["needs_action"] = simulation["needs_action"].tolist()
+                response["needs_explanation"] = simulation["needs_explanation"].tolist()
+
+            return Response({DATA: response}, status=status.HTTP_200_OK)
+
+        except PermissionDenied as p:
+            return Response(
+                {MESSAGE: str(p)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        except CriteriaVersion.DoesNotExist:
+            return Response(
+                {MESSAGE: CriteriaVersionMessage.INVALID_VERSION},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        except ValidationError as ve:
+            return Response(
+                {MESSAGE: ve.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            return Response(
+                {MESSAGE: str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from criteria.utils import (
+    decode_capabilities,
+    permission_stamp,
+)
+from .models import (
+    CustomUser as User,
+)
+from .services.revocation_service import is_token_revoked
+
+
+def stateless_user(validated_token) -> User | None:
+    """
+    Build the user of an access token from its capability claims, without
+    any database query.
+
+    The user only holds its id, username and flags, and carries its
+    permission snapshot so check_permission does not load it either. It can
+    be assigned to foreign keys like a loaded user.
+
+    Returns:
+        User | None: The user, or None when the token has no capability
+            claims or its permission-version stamp is stale.
+    """
+    try:
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        username = validated_token["username"]
+        mask = validated_token["cap"]
+        stamp = validated_token["pv"]
+    except KeyError:
+        return None
+
+    if stamp != permission_stamp(user_id):
+        return None
+
+    snapshot = decode_capabilities(mask)
+    user = User(
+        id=user_id,
+        username=username,
+        is_active=True,
+        is_staff=snapshot.is_staff,
+        is_superuser=snapshot.is_superuser,
+        # Tokens are only issued once the default password has been changed.
+        is_default_password=False,
+    )
+    user._state.adding = False
+    user._state.db = User.objects.db
+    user.permission_snapshot = snapshot
+    return user
+
+
+class CapabilityJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that rejects revoked tokens, and trusts the
+    capability claims of the token when `JWT_CAPABILITY_CLAIMS` is enabled.
+    The user is loaded from the database otherwise, or when the claims are
+    missing or stale.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        issued_at = validated_token.get("iat")
+        if is_token_revoked(
+            validated_token.get(api_settings.JTI_CLAIM),
+            validated_token.get(api_settings.USER_ID_CLAIM),
+            datetime_from_epoch(issued_at) if issued_at is not None else None,
+        ):
+            raise InvalidToken(_("Token is revoked"))
+        return validated_token
+
+    def get_user(self, validated_token):
+        if getattr(settings, "JWT_CAPABILITY_CLAIMS", False):
+            user = stateless_user(validated_token)
+            if user is not None:
+                return user
+        return super().get_user(validated_token)
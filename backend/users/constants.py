@@ -12,6 +12,7 @@ class ErrorMessage():
     NOT_PART_OF_ANY_TEAM = 'User is not part of any team'
     TEAM_NOT_FOUND = 'Team not found'
     AUTHENTICATION_REQUIRED='Authentication required'
+    TOO_MANY_ATTEMPTS = 'Too many attempts, please try again later'
 
 class CheckPermissionMessage:
     USER_NOT_PART_ANY_GROUP="User is not part of any group"
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 with the number of iterations of `PASSWORD_HASHER_ITERATIONS`.
+
+    Passwords hashed with another number of iterations still verify, and
+    are rehashed with the configured one on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, "PASSWORD_HASHER_ITERATIONS", PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,36 @@
+# Generated by Django 4.0 on 2026-10-18 08:48
+
+from django.db import migrations, models
+
+
+def fill_team_paths(apps, schema_editor):
+    Team = apps.get_model('users', 'Team')
+    parents = dict(Team.objects.values_list('id', 'parent_team_id'))
+    paths = {}
+
+    def path_of(team_id):
+        if team_id not in paths:
+            parent_id = parents[team_id]
+            paths[team_id] = f"{path_of(parent_id) if parent_id else '/'}{team_id}/"
+        return paths[team_id]
+
+    teams = list(Team.objects.all())
+    for team in teams:
+        team.path = path_of(team.id)
+    Team.objects.bulk_update(teams, ['path'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='path',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=255, verbose_name='path'),
+        ),
+        migrations.RunPython(fill_team_paths, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,7 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Prefetch, Value
+from django.db.models.functions import Concat, Substr
+from django.core.exceptions import ValidationError
 from django.contrib.auth.base_user import BaseUserManager
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
@@ -64,13 +67,71 @@ class CustomUserPermission(UserTrackable, TimeStamped):
     def __str__(self):
         return f'{self.access_level}'   
 
+class TeamQuerySet(models.QuerySet):
+    def subtree(self, team, include_self=True):
+        """
+        Filter on a team and every team under it, at any depth, in one query.
+        """
+        teams = self.filter(path__startswith=team.path)
+        return teams if include_self else teams.exclude(pk=team.pk)
+
+    def with_active_employees(self):
+        """
+        Prefetch the active employees of the teams, and their users, with one
+        more query.
+        """
+        return self.prefetch_related(Prefetch(
+            'employee_set',
+            queryset=Employee.objects.filter(is_active=True).select_related('user', 'access_level'),
+            to_attr='active_employees',
+        ))
+
 class Team(UserTrackable, TimeStamped):
     parent_team = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, verbose_name=_('parent team'))
     name = models.CharField(max_length=200, verbose_name=_('name'))
     is_active = models.BooleanField(default=True, verbose_name=_('active status'))
-    
+    # Materialized path: the ids from the root team down to this one, as
+    # "/1/5/12/". Kept in sync by save(), and removed with the subtree on delete.
+    path = models.CharField(max_length=255, db_index=True, editable=False, default='', verbose_name=_('path'))
+
+    objects = TeamQuerySet.as_manager()
+
     def __str__(self):
         return f'{self.name}'
+
+    @property
+    def depth(self):
+        return self.path.count('/') - 2
+
+    def _parent_path(self):
+        if self.parent_team_id is None:
+            return '/'
+        # Read the stored path, since the parent may have moved since it was loaded.
+        return Team.objects.values_list('path', flat=True).get(pk=self.parent_team_id)
+
+    def clean(self):
+        super().clean()
+        if self.pk is not None and f'/{self.pk}/' in self._parent_path():
+            raise ValidationError({'parent_team': _('A team cannot be moved under itself.')})
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            parent_path = self._parent_path()
+            if self.pk is not None and f'/{self.pk}/' in parent_path:
+                raise ValueError(_('A team cannot be moved under itself.'))
+            # Read the stored path, since this team may have moved since it was loaded.
+            old_path = Team.objects.filter(pk=self.pk).values_list('path', flat=True).first() or ''
+            super().save(*args, **kwargs)
+
+            path = f'{parent_path}{self.pk}/'
+            if path != self.path or path != old_path:
+                Team.objects.filter(pk=self.pk).update(path=path)
+            if old_path and path != old_path:
+                # Move the whole subtree with one update.
+                Team.objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                    path=Concat(Value(path), Substr('path', len(old_path) + 1))
+                )
+            self.path = path
     
 class Employee(UserTrackable, TimeStamped):
     class RoleNameEnum(models.TextChoices):
@@ -87,4 +148,15 @@ class Employee(UserTrackable, TimeStamped):
     is_active = models.BooleanField(default=True, verbose_name=_('active status'))
 
     def __str__(self):
-        return f'{self.user.username} - {self.team.name}'
\ No newline at end of file
+        return f'{self.user.username} - {self.team.name}'
+
+
+class RevokedToken(models.Model):
+    # A row with a jti revokes that token only. A row without a jti revokes
+    # every token of the user issued before `revoked_at`.
+    jti = models.CharField(max_length=255, unique=True, null=True, blank=True, verbose_name=_('token id'))
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, null=True, blank=True, verbose_name=_('user'))
+    revoked_at = models.DateTimeField(auto_now=True, verbose_name=_('revoked at'))
+
+    def __str__(self):
+        return self.jti or f'{self.user_id} - {self.revoked_at}'
@@ -0,0 +1,134 @@
+import functools
+import math
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+from rest_framework import status
+
+from ..constants import ErrorMessage
+
+DEFAULT_WINDOW = 60
+DEFAULT_PER_USERNAME = 10
+DEFAULT_PER_IP = 60
+KEY_PREFIX = "auth-attempts"
+# Past this number of keys, the in-process log drops the keys whose window
+# has passed before adding new ones.
+MAX_KEYS = 10_000
+
+# In-process sliding log: the times of the attempts of each key in the
+# current window, oldest first.
+_attempts = {}
+_lock = threading.Lock()
+
+
+def _shared_cache():
+    # Name of a Django cache shared by every process, or None to only count
+    # the attempts in-process.
+    alias = getattr(settings, "AUTH_RATE_LIMIT_CACHE_ALIAS", None)
+    return caches[alias] if alias else None
+
+
+def _local_hit(keys: dict, window: float, now: float) -> float:
+    with _lock:
+        if len(_attempts) > MAX_KEYS:
+            for key in [key for key, log in _attempts.items() if not log or log[-1] <= now - window]:
+                del _attempts[key]
+
+        retry_after = 0.0
+        for key, limit in keys.items():
+            log = _attempts.setdefault(key, deque())
+            while log and log[0] <= now - window:
+                log.popleft()
+            if len(log) >= limit:
+                retry_after = max(retry_after, log[0] + window - now)
+        if retry_after:
+            return retry_after
+
+        for key in keys:
+            _attempts[key].append(now)
+        return 0.0
+
+
+def _shared_hit(cache, keys: dict, window: float, now: float) -> float:
+    # Sliding window counter: the count of the previous fixed window is
+    # weighted by how much of it still overlaps the sliding window.
+    current = math.floor(now / window)
+    overlap = 1 - (now / window - current)
+    retry_after = 0.0
+    for key, limit in keys.items():
+        counts = cache.get_many([f"{KEY_PREFIX}:{key}:{current - 1}", f"{KEY_PREFIX}:{key}:{current}"])
+        previous = counts.get(f"{KEY_PREFIX}:{key}:{current - 1}", 0)
+        if previous * overlap + counts.get(f"{KEY_PREFIX}:{key}:{current}", 0) >= limit:
+            retry_after = max(retry_after, overlap * window)
+    if retry_after:
+        return retry_after
+
+    for key in keys:
+        counter = f"{KEY_PREFIX}:{key}:{current}"
+        if not cache.add(counter, 1, timeout=2 * window):
+            try:
+                cache.incr(counter)
+            except ValueError:
+                cache.add(counter, 1, timeout=2 * window)
+    return 0.0
+
+
+def client_ip(request) -> str:
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def hit(username: str | None, ip: str) -> float:
+    """
+    Record an authentication attempt for a username and a client IP, unless
+    one of them already used up its attempts in the sliding window.
+
+    The limits are `AUTH_RATE_LIMIT_PER_USERNAME` and `AUTH_RATE_LIMIT_PER_IP`
+    attempts per `AUTH_RATE_LIMIT_WINDOW` seconds. Rejected attempts are not
+    counted.
+
+    Returns:
+        float: 0 when the attempt is allowed, otherwise the number of
+            seconds to wait before trying again.
+    """
+    window = getattr(settings, "AUTH_RATE_LIMIT_WINDOW", DEFAULT_WINDOW)
+    keys = {f"ip:{ip}": getattr(settings, "AUTH_RATE_LIMIT_PER_IP", DEFAULT_PER_IP)}
+    if username:
+        keys[f"username:{username.lower()}"] = getattr(
+            settings, "AUTH_RATE_LIMIT_PER_USERNAME", DEFAULT_PER_USERNAME
+        )
+
+    shared = _shared_cache()
+    if shared is not None:
+        return _shared_hit(shared, keys, window, time.time())
+    return _local_hit(keys, window, time.monotonic())
+
+
+def clear_attempts() -> None:
+    """
+    Forget every attempt counted in-process.
+    """
+    with _lock:
+        _attempts.clear()
+
+
+def rate_limited(view):
+    """
+    Reject a flood of attempts on an authentication view with a 429, before
+    it looks up the user or hashes any password.
+    """
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+        retry_after = hit(str(username) if username else None, client_ip(request))
+        if retry_after:
+            response = JsonResponse({
+                "message": ErrorMessage.TOO_MANY_ATTEMPTS
+            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+            response["Retry-After"] = str(math.ceil(retry_after))
+            return response
+        return view(request, *args, **kwargs)
+    return wrapper
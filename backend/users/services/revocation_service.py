@@ -0,0 +1,155 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+from ..models import RevokedToken
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_REFRESH_INTERVAL = 5
+ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """
+    Set of strings with no false negatives and about `error_rate` false
+    positives while it holds at most `capacity` keys.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = ERROR_RATE):
+        self.capacity = capacity
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Double hashing: k positions from the two halves of one digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+def user_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def _row_key(jti, user_id) -> str:
+    return jti if jti is not None else user_key(user_id)
+
+
+# Keys of every revocation row of this process, and the id of the last row
+# read, so each refresh only reads the rows added since.
+_filter = BloomFilter(DEFAULT_CAPACITY)
+_last_id = 0
+_next_refresh = 0.0
+_lock = threading.Lock()
+
+
+def _rebuild(capacity: int) -> None:
+    global _filter, _last_id
+    _filter = BloomFilter(capacity)
+    _last_id = 0
+    _load(RevokedToken.objects.all())
+
+
+def _load(rows) -> None:
+    global _last_id
+    for row_id, jti, user_id in rows.order_by("id").values_list("id", "jti", "user_id"):
+        _filter.add(_row_key(jti, user_id))
+        _last_id = row_id
+
+
+def refresh_revocations(force: bool = False) -> None:
+    """
+    Add the revocation rows created since the last refresh to the filter.
+
+    Runs at most once every `TOKEN_REVOCATION_REFRESH_INTERVAL` seconds
+    unless forced. The filter is rebuilt, twice as large, once it holds more
+    keys than it was sized for.
+    """
+    global _next_refresh
+    now = time.monotonic()
+    with _lock:
+        if not force and now < _next_refresh:
+            return
+        _next_refresh = now + getattr(
+            settings, "TOKEN_REVOCATION_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL
+        )
+        _load(RevokedToken.objects.filter(id__gt=_last_id))
+        if _filter.count > _filter.capacity:
+            _rebuild(2 * _filter.count)
+
+
+def is_token_revoked(jti: str | None, user_id, issued_at: datetime | None) -> bool:
+    """
+    Tell whether a token was revoked, by itself or with every token of its
+    user.
+
+    The database is only queried when the filter holds the jti or the
+    user, which it does for every revoked token and, rarely, for others.
+
+    Args:
+        jti (str | None): The id of the token.
+        user_id: The id of the user of the token.
+        issued_at (datetime | None): When the token was issued.
+    """
+    refresh_revocations()
+    query = Q()
+    if jti is not None and jti in _filter:
+        query |= Q(jti=jti)
+    if user_key(user_id) in _filter:
+        # Tokens without an issue time cannot be told apart: revoke them all.
+        user_tokens = Q(jti__isnull=True, user_id=user_id)
+        if issued_at is not None:
+            user_tokens &= Q(revoked_at__gte=issued_at)
+        query |= user_tokens
+    if not query:
+        return False
+    return RevokedToken.objects.filter(query).exists()
+
+
+def revoke_token(jti: str, user_id=None) -> None:
+    """
+    Revoke one token.
+    """
+    RevokedToken.objects.get_or_create(jti=jti, defaults={"user_id": user_id})
+    with _lock:
+        _filter.add(jti)
+
+
+def revoke_user_tokens(user_id) -> None:
+    """
+    Revoke every token of a user issued until now.
+    """
+    # Saving the row refreshes its auto_now revoked_at.
+    RevokedToken.objects.update_or_create(jti=None, user_id=user_id)
+    with _lock:
+        _filter.add(user_key(user_id))
+
+
+def clear_revocation_filter() -> None:
+    """
+    Empty the filter, so the next check reads every revocation row again.
+    """
+    global _filter, _last_id, _next_refresh
+    with _lock:
+        _filter = BloomFilter(DEFAULT_CAPACITY)
+        _last_id = 0
+        _next_refresh = 0.0
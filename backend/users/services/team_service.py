@@ -0,0 +1,38 @@
+from django.db.models import Count, Q
+
+from ..models import Team
+
+
+def build_team_tree(rows) -> list:
+    """
+    Nest flat team rows under their parents in one pass.
+
+    Rows must come parents first, which ordering by path guarantees. A team
+    whose parent is not among the rows (for example an inactive parent) is
+    returned as a root.
+
+    Args:
+        rows (Iterable[dict]): Teams with `id` and `parent_team_id` keys.
+
+    Returns:
+        list: The root teams, each with the list of its `children`.
+    """
+    nodes = {}
+    roots = []
+    for row in rows:
+        node = {**row, "children": []}
+        parent = nodes.get(node.pop("parent_team_id"))
+        (parent["children"] if parent is not None else roots).append(node)
+        nodes[node["id"]] = node
+    return roots
+
+
+def get_org_chart() -> list:
+    """
+    Load every active team with its number of active members, in one query,
+    and nest them into the org chart.
+    """
+    rows = Team.objects.filter(is_active=True).annotate(
+        member_count=Count("employee", filter=Q(employee__is_active=True)),
+    ).order_by("path").values("id", "name", "parent_team_id", "member_count")
+    return build_team_tree(rows)
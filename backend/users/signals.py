@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Employee
+from .services.revocation_service import revoke_user_tokens
+
+
+@receiver(pre_save, sender=Employee)
+def remember_employee_was_active(sender, instance, **kwargs):
+    # Only read the stored state when the employee is saved as inactive.
+    instance._was_active = (
+        not instance.is_active
+        and instance.pk is not None
+        and Employee.objects.filter(pk=instance.pk, is_active=True).exists()
+    )
+
+@receiver(post_save, sender=Employee)
+def revoke_tokens_on_employee_deactivation(sender, instance, **kwargs):
+    if instance._was_active:
+        revoke_user_tokens(instance.user_id)
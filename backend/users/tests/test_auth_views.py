@@ -3,12 +3,14 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from rest_framework import status
 from ..models import CustomUser as User
+from ..services.rate_limit_service import clear_attempts
 
 test_results = []
 
 class ChangePasswordTests(TestCase):
     
     def setUp(self):
+        clear_attempts()
         self.client = Client()
         self.user = User.objects.create(
             username= 'OnDQ',
@@ -76,6 +78,7 @@ class ChangePasswordTests(TestCase):
 class SetInitPasswordCase(TestCase):
         
     def setUp(self):
+        clear_attempts()
         self.client = Client()
         self.user = User.objects.create(
             username= "OnDQ",
@@ -164,6 +167,7 @@ class SetInitPasswordCase(TestCase):
 class LoginCase(TestCase):
     
     def setUp(self):
+        clear_attempts()
         self.client = Client()
         self.user = User.objects.create(
             username= 'OnDQ',
@@ -237,6 +241,7 @@ class ForgotPasswordCase(TestCase):
         print(tabulate(test_results, headers=["From", "Test Case", "HTTP Status", "Response Message"], tablefmt="grid"))
         
     def setUp(self):
+        clear_attempts()
         self.client = Client()
         self.user = User.objects.create(
             username= 'OnDQ',
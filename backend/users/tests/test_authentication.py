@@ -0,0 +1,103 @@
+from django.contrib.auth.models import Group
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+from criteria.utils import (
+    check_permission,
+    invalidate_permission_snapshots,
+)
+from ..services.rate_limit_service import clear_attempts
+from ..authentication import CapabilityJWTAuthentication
+from ..services.revocation_service import (
+    clear_revocation_filter,
+    refresh_revocations,
+)
+from ..models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+
+@override_settings(JWT_CAPABILITY_CLAIMS=True)
+class CapabilityJWTAuthenticationTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="OnDQ", password="@Abcde12345")
+        self.user.is_default_password = False
+        self.user.save()
+        self.access_level = Permission.objects.create(
+            access_level="DEV", can_read_criteria_settings=True
+        )
+        Employee.objects.create(
+            user=self.user,
+            team=Team.objects.create(name="Apple"),
+            access_level=self.access_level,
+        )
+        self.client = APIClient()
+        clear_attempts()
+        self.addCleanup(invalidate_permission_snapshots)
+        # Read the revocation table now, so authenticating does not.
+        clear_revocation_filter()
+        refresh_revocations(force=True)
+
+    def login(self, username="OnDQ"):
+        response = self.client.post(
+            reverse("login"), {"username": username, "password": "@Abcde12345"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["access"]
+
+    def authenticate(self, access):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        user, _ = CapabilityJWTAuthentication().authenticate(request)
+        return user
+
+    def test_login_embeds_capability_claims(self):
+        token = AccessToken(self.login())
+
+        self.assertEqual(token["username"], "OnDQ")
+        self.assertIn("cap", token)
+        self.assertIn("pv", token)
+
+    def test_current_token_is_authorized_without_queries(self):
+        access = self.login()
+
+        with self.assertNumQueries(0):
+            user = self.authenticate(access)
+            self.assertTrue(check_permission(user, "can_read_criteria_setting", "criteria"))
+            self.assertFalse(check_permission(user, "can_write_criteria_setting", "criteria"))
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(str(user), "OnDQ")
+
+    def test_stale_token_loads_the_user(self):
+        access = self.login()
+        self.access_level.can_write_criteria_settings = True
+        self.access_level.save()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate(access)
+        self.assertFalse(hasattr(user, "permission_snapshot"))
+        self.assertTrue(check_permission(user, "can_write_criteria_setting", "criteria"))
+
+    def test_staff_group_permissions_are_not_embedded(self):
+        staff = User.objects.create_user(
+            username="staff", password="@Abcde12345", is_staff=True, is_default_password=False
+        )
+        staff.groups.add(Group.objects.create(name="Reviewers"))
+
+        token = AccessToken(self.login("staff"))
+
+        self.assertNotIn("cap", token)
+        with self.assertNumQueries(1):
+            self.authenticate(str(token))
+
+    def test_claims_are_ignored_when_disabled(self):
+        access = self.login()
+
+        with override_settings(JWT_CAPABILITY_CLAIMS=False):
+            with self.assertNumQueries(1):
+                user = self.authenticate(access)
+        self.assertFalse(hasattr(user, "permission_snapshot"))
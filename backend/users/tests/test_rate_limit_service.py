@@ -0,0 +1,86 @@
+from django.contrib.auth.hashers import identify_hasher
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from ..models import CustomUser as User
+from ..services.rate_limit_service import (
+    clear_attempts,
+    hit,
+)
+
+@override_settings(AUTH_RATE_LIMIT_PER_USERNAME=3, AUTH_RATE_LIMIT_PER_IP=5)
+class RateLimitTest(TestCase):
+
+    def setUp(self):
+        clear_attempts()
+        self.addCleanup(clear_attempts)
+        self.client = APIClient()
+        self.url = reverse("login")
+
+    def login(self, username, password="@Wrong12345"):
+        return self.client.post(self.url, {"username": username, "password": password})
+
+    def test_floods_on_a_username_are_rejected_before_hashing(self):
+        User.objects.create_user(username="OnDQ", password="@Abcde12345", is_default_password=False)
+        for _ in range(3):
+            self.assertEqual(self.login("OnDQ").status_code, status.HTTP_404_NOT_FOUND)
+
+        with self.assertNumQueries(0):
+            response = self.login("OnDQ", "@Abcde12345")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        self.assertEqual(self.login("other").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_floods_from_an_ip_are_rejected(self):
+        for index in range(5):
+            self.assertEqual(self.login(f"user{index}").status_code, status.HTTP_404_NOT_FOUND)
+
+        self.assertEqual(self.login("user5").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_attempts_leave_the_window(self):
+        for _ in range(3):
+            self.assertEqual(hit("OnDQ", "10.0.0.1"), 0)
+        self.assertGreater(hit("OnDQ", "10.0.0.1"), 0)
+
+        with self.settings(AUTH_RATE_LIMIT_WINDOW=0):
+            self.assertEqual(hit("OnDQ", "10.0.0.1"), 0)
+
+    @override_settings(AUTH_RATE_LIMIT_CACHE_ALIAS="default")
+    def test_shared_backend(self):
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+        for _ in range(3):
+            self.assertEqual(hit("shared", "10.0.0.2"), 0)
+        self.assertGreater(hit("shared", "10.0.0.2"), 0)
+        self.assertEqual(hit("other", "10.0.0.2"), 0)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["users.hashers.ConfigurablePBKDF2PasswordHasher"],
+    PASSWORD_HASHER_ITERATIONS=1000,
+)
+class PasswordHasherCostTest(TestCase):
+
+    def setUp(self):
+        clear_attempts()
+        self.user = User.objects.create_user(
+            username="OnDQ", password="@Abcde12345", is_default_password=False
+        )
+
+    def iterations(self):
+        self.user.refresh_from_db()
+        return identify_hasher(self.user.password).decode(self.user.password)["iterations"]
+
+    def test_password_is_rehashed_with_the_new_cost_on_login(self):
+        self.assertEqual(self.iterations(), 1000)
+
+        with self.settings(PASSWORD_HASHER_ITERATIONS=2000):
+            response = APIClient().post(
+                reverse("login"), {"username": "OnDQ", "password": "@Abcde12345"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.iterations(), 2000)
+        self.assertTrue(self.user.check_password("@Abcde12345"))
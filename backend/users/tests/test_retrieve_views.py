@@ -56,4 +56,82 @@ class RetrieveTeamTest(TestCase):
         response=self.client.get(self.url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertEqual(response.json()["message"], "User is not part of any team")
\ No newline at end of file
+        self.assertEqual(response.json()["message"], "User is not part of any team")
+
+    def test_list_team_query_count_does_not_grow_with_teams(self):
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()), 1)
+
+        for index in range(3):
+            Employee.objects.create(
+                user=self.user,
+                team=Team.objects.create(name=f'Team {index}', parent_team=self.team, created_user=self.user),
+                is_active=True,
+                access_level=self.perm_DEV,
+            )
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 4)
+        self.assertEqual(
+            sorted(team['parent_team'] for team in response.json() if team['parent_team']),
+            ['Apple', 'Apple', 'Apple'],
+        )
+
+class OrgChartTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='OnDQ',
+            password='@Abcde12345',
+        )
+        self.user.is_default_password = False
+        self.user.save()
+
+        self.company = Team.objects.create(name='Company')
+        self.engineering = Team.objects.create(name='Engineering', parent_team=self.company)
+        self.backend = Team.objects.create(name='Backend', parent_team=self.engineering)
+        Team.objects.create(name='Closed', parent_team=self.company, is_active=False)
+
+        access_level = Permission.objects.create(access_level='DEV')
+        for team, is_active in [(self.backend, True), (self.backend, True), (self.engineering, False)]:
+            Employee.objects.create(user=self.user, team=team, access_level=access_level, is_active=is_active)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("org-chart")
+
+    def test_org_chart_is_loaded_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [{
+            'id': self.company.id,
+            'name': 'Company',
+            'member_count': 0,
+            'children': [{
+                'id': self.engineering.id,
+                'name': 'Engineering',
+                'member_count': 0,
+                'children': [{
+                    'id': self.backend.id,
+                    'name': 'Backend',
+                    'member_count': 2,
+                    'children': [],
+                }],
+            }],
+        }])
+
+    def test_unchanged_org_chart_is_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Team.objects.create(name='Frontend', parent_team=self.engineering)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
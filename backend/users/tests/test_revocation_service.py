@@ -0,0 +1,102 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from ..models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    RevokedToken,
+    Team,
+)
+from ..services.rate_limit_service import clear_attempts
+from ..services.revocation_service import (
+    BloomFilter,
+    clear_revocation_filter,
+    is_token_revoked,
+    refresh_revocations,
+    revoke_token,
+)
+
+class BloomFilterTest(TestCase):
+
+    def test_has_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(1000)
+        for index in range(1000):
+            bloom.add(f"jti-{index}")
+
+        self.assertTrue(all(f"jti-{index}" in bloom for index in range(1000)))
+        false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+@override_settings(TOKEN_REVOCATION_REFRESH_INTERVAL=3600)
+class TokenRevocationTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="OnDQ", password="@Abcde12345", is_default_password=False
+        )
+        self.team = Team.objects.create(name="Apple")
+        self.employee = Employee.objects.create(
+            user=self.user,
+            team=self.team,
+            access_level=Permission.objects.create(access_level="DEV", can_read_eval_data=True),
+        )
+        self.client = APIClient()
+        clear_attempts()
+        clear_revocation_filter()
+        refresh_revocations(force=True)
+        self.addCleanup(clear_revocation_filter)
+
+    def login(self):
+        self.client.credentials()
+        response = self.client.post(
+            reverse("login"), {"username": "OnDQ", "password": "@Abcde12345"}
+        )
+        return response.json()["access"]
+
+    def list_team(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return self.client.get(reverse("list-team"))
+
+    def test_unrevoked_token_is_checked_without_queries(self):
+        token = AccessToken(self.login())
+
+        with self.assertNumQueries(0):
+            self.assertFalse(is_token_revoked(token["jti"], self.user.pk, None))
+
+    def test_employee_deactivation_revokes_tokens(self):
+        access = self.login()
+        self.assertEqual(self.list_team(access).status_code, status.HTTP_200_OK)
+
+        self.employee.is_active = False
+        self.employee.save()
+
+        self.assertEqual(self.list_team(access).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_saving_an_inactive_employee_again_does_not_revoke(self):
+        self.employee.is_active = False
+        self.employee.save()
+        self.assertEqual(RevokedToken.objects.count(), 1)
+        revoked_at = RevokedToken.objects.get().revoked_at
+
+        self.employee.save()
+
+        self.assertEqual(RevokedToken.objects.get().revoked_at, revoked_at)
+
+    def test_revoked_token_is_rejected(self):
+        access = self.login()
+        revoke_token(AccessToken(access)["jti"], self.user.pk)
+
+        self.assertEqual(self.list_team(access).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.list_team(self.login()).status_code, status.HTTP_200_OK)
+
+    def test_rows_of_other_processes_are_read_on_refresh(self):
+        token = AccessToken(self.login())
+        RevokedToken.objects.create(jti=token["jti"], user=self.user)
+
+        self.assertFalse(is_token_revoked(token["jti"], self.user.pk, None))
+        refresh_revocations(force=True)
+        self.assertTrue(is_token_revoked(token["jti"], self.user.pk, None))
@@ -0,0 +1,84 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from ..models import (
+    CustomUser as User,
+    CustomUserPermission as Permission,
+    Employee,
+    Team,
+)
+
+class TeamHierarchyTest(TestCase):
+
+    def setUp(self):
+        self.company = Team.objects.create(name="Company")
+        self.engineering = Team.objects.create(name="Engineering", parent_team=self.company)
+        self.backend = Team.objects.create(name="Backend", parent_team=self.engineering)
+        self.sales = Team.objects.create(name="Sales", parent_team=self.company)
+        access_level = Permission.objects.create(access_level="DEV")
+        for index, team in enumerate([self.company, self.engineering, self.backend, self.sales]):
+            Employee.objects.create(
+                user=User.objects.create_user(username=f"user{index}", password="@Abcde12345"),
+                team=team,
+                access_level=access_level,
+            )
+
+    def names(self, teams):
+        return sorted(team.name for team in teams)
+
+    def test_paths_follow_the_tree(self):
+        self.assertEqual(self.company.path, f"/{self.company.pk}/")
+        self.assertEqual(
+            self.backend.path, f"/{self.company.pk}/{self.engineering.pk}/{self.backend.pk}/"
+        )
+        self.assertEqual(self.backend.depth, 2)
+
+    def test_subtree_and_active_employees_take_two_queries(self):
+        Employee.objects.filter(team=self.backend).update(is_active=False)
+
+        with self.assertNumQueries(2):
+            teams = list(Team.objects.subtree(self.engineering).with_active_employees())
+            employees = [employee.user.username for team in teams for employee in team.active_employees]
+
+        self.assertEqual(self.names(teams), ["Backend", "Engineering"])
+        self.assertEqual(employees, ["user1"])
+        self.assertEqual(
+            self.names(Team.objects.subtree(self.company, include_self=False)),
+            ["Backend", "Engineering", "Sales"],
+        )
+
+    def test_moving_a_team_moves_its_subtree(self):
+        self.engineering.parent_team = self.sales
+        self.engineering.save()
+
+        self.backend.refresh_from_db()
+        self.assertEqual(
+            self.backend.path,
+            f"/{self.company.pk}/{self.sales.pk}/{self.engineering.pk}/{self.backend.pk}/",
+        )
+        self.assertEqual(self.names(Team.objects.subtree(self.sales)), ["Backend", "Engineering", "Sales"])
+
+    def test_moving_a_stale_team_moves_its_current_subtree(self):
+        stale = Team.objects.get(pk=self.backend.pk)
+        self.backend.parent_team = self.sales
+        self.backend.save()
+        leaf = Team.objects.create(name="API", parent_team=self.backend)
+
+        stale.parent_team = self.company
+        stale.save()
+
+        leaf.refresh_from_db()
+        self.assertEqual(leaf.path, f"/{self.company.pk}/{self.backend.pk}/{leaf.pk}/")
+        self.assertEqual(self.names(Team.objects.subtree(self.sales)), ["Sales"])
+
+    def test_team_cannot_be_moved_under_itself(self):
+        self.engineering.parent_team = self.backend
+
+        with self.assertRaises(ValidationError):
+            self.engineering.full_clean()
+        with self.assertRaises(ValueError):
+            self.engineering.save()
+
+    def test_deleting_a_team_deletes_its_subtree(self):
+        self.engineering.delete()
+
+        self.assertEqual(self.names(Team.objects.subtree(self.company)), ["Company", "Sales"])
@@ -2,4 +2,5 @@ from django.urls import path
 from users.views import retrieve_views as user
 urlpatterns = [
     path("list-team/", user.list_team, name="list-team"),
+    path("org-chart/", user.org_chart, name="org-chart"),
 ]
\ No newline at end of file
@@ -3,6 +3,8 @@ from rest_framework import status
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.conf import settings
+from criteria.utils import permission_claims
 from ..serializers import (
     ChangePasswordSerializer,
     SetPasswordSerializer,
@@ -16,9 +18,11 @@ from ..constants import (
     SuccessMessage,
     ErrorMessage,
 )
+from ..services.rate_limit_service import rate_limited
 
 @csrf_exempt
 @api_view(['POST'])
+@rate_limited
 def change_password(request):
     try:
         serializer = ChangePasswordSerializer(data=request.data)
@@ -64,6 +68,7 @@ def change_password(request):
         
 @csrf_exempt
 @api_view(['POST'])
+@rate_limited
 def set_password(request):
     try:
         serializer = SetPasswordSerializer(data=request.data)
@@ -111,6 +116,7 @@ def set_password(request):
         
 @csrf_exempt
 @api_view(['POST'])
+@rate_limited
 def login(request):
     try:
         serializer = LoginSerializer(data=request.data)
@@ -137,6 +143,10 @@ def login(request):
                 }, status = status.HTTP_301_MOVED_PERMANENTLY)
            
         refresh = RefreshToken.for_user(user)
+        if getattr(settings, "JWT_CAPABILITY_CLAIMS", False):
+            # Copied to every access token issued from this refresh token.
+            for claim, value in permission_claims(user).items():
+                refresh[claim] = value
         return JsonResponse({'refresh': str(refresh),
                              'access': str(refresh.access_token),
                              "message": SuccessMessage.LOGIN_SUCCESSFULLY
@@ -188,6 +198,7 @@ def get_question(request, username):
  
 @csrf_exempt
 @api_view(['POST'])
+@rate_limited
 def forgot_password(request):
     try:
         serializer = ForgotPasswordSerializer(data=request.data)
@@ -1,4 +1,7 @@
-from django.http import JsonResponse
+import hashlib
+
+from django.http import JsonResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view
@@ -17,6 +20,7 @@ from ..constants import (
 from ..serializers import (
     TeamSerializer,
 )
+from ..services.team_service import get_org_chart
 
 @csrf_exempt
 @api_view(["GET"])
@@ -38,13 +42,15 @@ def list_team(request):
                 status=status.HTTP_403_FORBIDDEN,
             )
        
-        employees = Employee.objects.filter(user__username = user, is_active = True)
-        if not employees.exists():
+        # One query: the team ids of the active employees are a subquery.
+        team_ids = Employee.objects.filter(user=user, is_active=True).values_list("team_id", flat=True)
+        teams = list(
+            Team.objects.filter(id__in=team_ids).select_related("created_user", "parent_team")
+        )
+        if not teams:
             return JsonResponse({
                 "message": ErrorMessage.NOT_PART_OF_ANY_TEAM
             }, status=status.HTTP_404_NOT_FOUND)
-       
-        teams = Team.objects.filter(id__in = [employee.team.id for employee in employees])
  
         serializer = TeamSerializer(teams, many=True)  
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -52,4 +58,37 @@ def list_team(request):
     except Exception as e:
         return JsonResponse({
             'message' : str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@csrf_exempt
+@api_view(["GET"])
+def org_chart(request):
+    try:
+        user = request.user
+        if not isinstance(user, User):
+            return JsonResponse(
+                {"message": ErrorMessage.AUTHENTICATION_REQUIRED},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        if user.is_default_password:
+            return JsonResponse(
+                {
+                    "set_password": True,
+                    "message": ErrorMessage.PASSWORD_HAS_NOT_BEEN_CHANGED
+                },
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        response = JsonResponse(get_org_chart(), safe=False)
+        etag = quote_etag(hashlib.md5(response.content).hexdigest())
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    except Exception as e:
+        return JsonResponse({
+            'message' : str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)